@@ -1,4 +1,5 @@
 import logging
+import os
 import sys
 
 from dotenv import load_dotenv
@@ -10,6 +11,7 @@ import typing as t
 
 from celery import Celery, states
 from celery.exceptions import Ignore
+from celery.signals import worker_process_init
 from fastapi.encoders import jsonable_encoder
 
 from api import celeryconfig
@@ -20,14 +22,40 @@ from api.bunka_api.datamodel import (
     TopicParameterApi,
 )
 from api.bunka_api.processing_functions import (
+    english_bunka_language,
     process_full_topics_and_bourdieu,
     process_topics,
 )
+from bunkatopics.topic_modeling.utils import load_spacy_model
 
 celery = Celery()
 celery.config_from_object(celeryconfig)
 
 
+# The spaCy pipelines loaded when a worker process starts, comma-separated. Defaults to the
+# pipeline of the default language of the API
+PRELOAD_SPACY_MODELS = [
+    model_name.strip()
+    for model_name in os.getenv(
+        "BUNKA_PRELOAD_SPACY_MODELS", english_bunka_language
+    ).split(",")
+    if model_name.strip()
+]
+
+
+@worker_process_init.connect
+def preload_spacy_model(**kwargs):
+    # Pay the spaCy cold start once per worker process instead of once per task
+    for model_name in PRELOAD_SPACY_MODELS:
+        try:
+            # Downloading here would block the start of the worker, or fail without network
+            load_spacy_model(model_name, download=False)
+        except OSError:
+            logging.warning(
+                f"The spaCy model {model_name} is not installed: it will be loaded by the first task using it"
+            )
+
+
 @celery.task(bind=True)
 def process_topics_task(
     self,
@@ -7,47 +7,40 @@ import typing as t
 import uuid
 import warnings
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import umap
-from FlagEmbedding import FlagModel
-from IPython.display import display
-from ipywidgets import Button, Checkbox, Label, Layout, VBox, widgets
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain_core._api.deprecation import LangChainDeprecationWarning
-from langchain_core.embeddings import Embeddings
-from langchain_core.language_models.llms import LLM
-from numba.core.errors import NumbaDeprecationWarning
-from sentence_transformers import SentenceTransformer
-from sklearn.preprocessing import MinMaxScaler
 from tqdm import tqdm
 
-from bunkatopics.bourdieu import (
-    BourdieuAPI,
-    BourdieuOneDimensionVisualizer,
-    BourdieuVisualizer,
-)
 from bunkatopics.datamodel import (
     DOC_ID,
+    TOPIC_ID,
     BourdieuQuery,
     Document,
     Topic,
     TopicGenParam,
     TopicParam,
 )
+from bunkatopics.embeddings import (
+    EmbeddingBackend,
+    EmbeddingCache,
+    EmbeddingMatrix,
+    as_embedding_backend,
+    embed_in_batches,
+    to_embedding_matrix,
+)
+from bunkatopics.embeddings.precomputed import PreComputedEmbeddings
 from bunkatopics.logging import logger
-from bunkatopics.serveur import is_server_running, kill_server
+from bunkatopics.projection import benchmark_projections, get_projection_model
 from bunkatopics.topic_modeling import (
     BunkaTopicModeling,
+    DocTermMatrix,
     DocumentRanker,
     LLMCleaningTopic,
     TextacyTermsExtractor,
 )
-from bunkatopics.topic_modeling.topic_utils import get_topic_repartition
+from bunkatopics.topic_modeling.topic_model_builder import _add_convex_hulls
 from bunkatopics.topic_modeling.utils import (
+    detect_document_languages,
     detect_language,
     detect_language_to_language_name,
 )
@@ -55,14 +48,21 @@ from bunkatopics.utils import (
     BunkaError,
     _create_topic_dfs,
     _filter_hdbscan,
+    _merge_terms,
     count_tokens,
+    estimate_tokens,
 )
-from bunkatopics.visualization import TopicVisualizer
-from bunkatopics.visualization.query_visualizer import plot_query
+
+# Plotting, widget and model libraries are slow to import: the methods using them
+# import them, so that headless workers never pay for them
+if t.TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import plotly.graph_objects as go
+    from langchain_core.embeddings import Embeddings
+    from langchain_core.language_models.llms import LLM
 
 # Filter ResourceWarning
 warnings.filterwarnings("ignore")
-warnings.filterwarnings("ignore", category=NumbaDeprecationWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", message="omp_set_nested routine deprecated")
@@ -92,43 +92,57 @@ class Bunka:
 
     def __init__(
         self,
-        embedding_model: Embeddings = None,
+        embedding_model: t.Union["Embeddings", EmbeddingBackend] = None,
         projection_model=None,
         language: str = "english",  # will be removed in the future
+        embedding_cache: t.Optional[EmbeddingCache] = None,
     ):
         """Initialize a BunkaTopics instance.
 
         Args:
             embedding_model (Embeddings, optional): An optional embedding model for generating document embeddings.
                 If not provided, a default model will be used based on the specified language.
-                Default is None.
-            projection_model (optional): An optional projection model to reduce the dimensionality of the embeddings.
-                Default is None.
+                Pass an EmbeddingBackend to choose the batch size, the number of threads or the
+                normalization of the embeddings. Default is None.
+            projection_model (optional): An optional projection model to reduce the dimensionality of the embeddings,
+                or the name of a registered projection backend: "umap", "pca_umap", "draft_umap", "tsne" or
+                "landmark_umap". Default is None (UMAP).
+            embedding_cache (EmbeddingCache, optional): An optional on-disk cache of embeddings. When provided,
+                only the documents missing from the cache are sent to the embedding model. Default is None.
         """
-        warnings.filterwarnings("ignore", category=LangChainDeprecationWarning)
         if embedding_model is None:
+            from sentence_transformers import SentenceTransformer
+
             embedding_model = SentenceTransformer(model_name_or_path="all-MiniLM-L6-v2")
 
         if projection_model is None:
-            projection_model = umap.UMAP(
-                n_components=2,
-                random_state=42,
-            )
+            projection_model = get_projection_model("umap")
+        elif isinstance(projection_model, str):
+            projection_model = get_projection_model(projection_model)
 
         self.projection_model = projection_model
-        self.embedding_model = embedding_model
+        self.embedding_backend = as_embedding_backend(embedding_model)
+        self.embedding_model = self.embedding_backend.model
+        self.embedding_cache = embedding_cache
+        self.doc_term_matrix = None
+        self.duplicates_: t.Dict[DOC_ID, DOC_ID] = {}
         self.df_cleaned = None
 
     def fit(
         self,
         docs: t.List[str],
         ids: t.List[DOC_ID] = None,
-        pre_computed_embeddings: t.Optional[
-            t.List[t.Dict[DOC_ID, t.List[float]]]
-        ] = None,
+        pre_computed_embeddings: t.Optional[PreComputedEmbeddings] = None,
         metadata: t.Optional[t.List[dict]] = None,
         sampling_size_for_terms: t.Optional[int] = 1000,
         language: bool = None,
+        embedding_batch_size: int = 1024,
+        embeddings_path: t.Optional[str] = None,
+        terms_n_process: int = 1,
+        language_per_document: bool = False,
+        token_counting: t.Optional[str] = "estimate",
+        deduplicate: t.Optional[str] = None,
+        duplicate_threshold: float = 0.8,
     ) -> None:
         """
         Fits the Bunka model to the provided list of documents.
@@ -139,50 +153,69 @@ class Bunka:
         Args:
             docs (t.List[str]): A list of document strings.
             ids (t.Optional[t.List[DOC_ID]]): Optional. A list of identifiers for the documents. If not provided, UUIDs are generated.
+            pre_computed_embeddings (t.Optional[PreComputedEmbeddings]): Optional. Embeddings to use instead of the
+                embedding model: a `.npy`, `.npz` or `.parquet` file, an EmbeddingMatrix, a list of
+                {"doc_id", "embedding"} records, or an array whose rows follow the order of `docs`.
             metadata (t.Optional[t.List[str]): A of metadata dictionaries for the documents.
-            sampling_size_for_terms (t.Optional[int]): The number of documents to sample for term extraction. Default is 2000.
+            sampling_size_for_terms (t.Optional[int]): The number of documents to sample for term extraction.
+                None extracts terms from the whole corpus. Default is 1000.
+            embedding_batch_size (int): The number of documents embedded at once. Default is 1024.
+            embeddings_path (t.Optional[str]): Optional. A `.npy` file where the embedding matrix is memory-mapped,
+                to embed corpora larger than the available RAM. Default is None.
+            terms_n_process (int): The number of processes used to extract terms. Default is 1.
+            language_per_document (bool): Whether to detect the language of every document, for corpora mixing
+                languages. The languages are stored in `document_languages_`, in the order of `self.docs`. Default is False.
+            token_counting (t.Optional[str]): How the number of tokens of the corpus is logged: "exact" encodes every
+                document, "estimate" encodes a sample and None skips the count. Default is "estimate".
+            deduplicate (t.Optional[str]): Collapses duplicated documents before embedding them: "exact" groups
+                the documents identical once normalized, "near" also groups the near-duplicates found by
+                MinHash/LSH. Only the first document of every group is embedded, projected and term-extracted,
+                with a `multiplicity` weighting topic sizes and rankings. The other ids are mapped to it in
+                `duplicates_` and resolve to it with `resolve`. Default is None (keep every document).
+            duplicate_threshold (float): The minimum Jaccard similarity of the word 3-grams of two
+                near-duplicates. Default is 0.8.
         """
 
-        df = pd.DataFrame(docs, columns=["content"])
-
-        # Transform into a Document model
-        if ids is not None:
-            ids = [str(x) for x in ids]
-            df["doc_id"] = ids
-            df = df.drop_duplicates(subset="doc_id", keep="first")
-
-        else:
-            df["doc_id"] = [str(uuid.uuid4())[:20] for _ in range(len(df))]
-
-        if metadata is not None:
-            metadata_values = [
-                {key: metadata[key][i] for key in metadata} for i in range(len(df))
-            ]
-
-            df["metadata"] = metadata_values
-
-        df = df[~df["content"].isna()]
-        df = df.reset_index(drop=True)
+        # Kept to fit the model the same way when partial_fit refits it
+        self.fit_params_ = dict(
+            sampling_size_for_terms=sampling_size_for_terms,
+            embedding_batch_size=embedding_batch_size,
+            terms_n_process=terms_n_process,
+            language_per_document=language_per_document,
+            token_counting=token_counting,
+        )
 
-        self.docs = [Document(**row) for row in df.to_dict(orient="records")]
+        self.docs, input_doc_ids = self._create_documents(docs, ids, metadata)
+        self.duplicates_ = {}
+        if deduplicate is not None:
+            self.docs = self._collapse_duplicates(
+                self.docs, method=deduplicate, threshold=duplicate_threshold
+            )
         sentences = [doc.content for doc in self.docs]
 
-        total_number_of_tokens = count_tokens(sentences)
-        logger.info(f"Processing {total_number_of_tokens} tokens")
+        if token_counting == "exact":
+            total_number_of_tokens = count_tokens(sentences)
+            logger.info(f"Processing {total_number_of_tokens} tokens")
+        elif token_counting == "estimate":
+            total_number_of_tokens, margin = estimate_tokens(sentences)
+            logger.info(
+                f"Processing about {total_number_of_tokens} (± {margin}) tokens"
+            )
+        elif token_counting is not None:
+            raise ValueError(
+                f"token_counting must be 'exact', 'estimate' or None, got {token_counting!r}"
+            )
 
         ids = [doc.doc_id for doc in self.docs]
 
-        # Detect language
-
-        sample_size = len(sentences) // 100  # sample 1% of the dataset
-
-        # Randomly sample 1% of the dataset
-        sampled_sentences = random.sample(sentences, sample_size)
-
+        # Detect language on a random sample, stopping once the majority is settled
         if language is None:
-            self.detected_language = detect_language(sampled_sentences)
+            self.detected_language = detect_language(sentences)
         else:
             self.detected_language = language
+
+        if language_per_document:
+            self.document_languages_ = detect_document_languages(sentences)
         self.language_name = detect_language_to_language_name.get(
             self.detected_language, "english"
         )
@@ -199,50 +232,25 @@ class Bunka:
         )
 
         if pre_computed_embeddings is None:
-            # Determine if self.embedding_model is an instance of SentenceTransformer
-            if isinstance(self.embedding_model, SentenceTransformer):
-                bunka_embeddings = self.embedding_model.encode(
-                    sentences, show_progress_bar=True
-                )
-                bunka_embeddings = bunka_embeddings.tolist()
-
-            elif isinstance(self.embedding_model, HuggingFaceEmbeddings):
-                bunka_embeddings = self.embedding_model.embed_documents(sentences)
-
-            elif isinstance(self.embedding_model, FlagModel):
-                bunka_embeddings = self.embedding_model.encode(sentences)
-                bunka_embeddings = bunka_embeddings.tolist()
+            bunka_embeddings = self._embed_sentences(
+                sentences, batch_size=embedding_batch_size, memmap_path=embeddings_path
+            )
+            self.embeddings = EmbeddingMatrix(bunka_embeddings, ids)
 
-            else:
-                bunka_embeddings = self.embedding_model.encode(
-                    sentences
-                )  # show_progress_bar=True
         else:
-            pre_computed_embeddings.sort(key=lambda x: ids.index(x["doc_id"]))
-            # bunka_embeddings = [x["embedding"] for x in pre_computed_embeddings]
-            bunka_embeddings = []
-            for x in pre_computed_embeddings:
-                embedding = x["embedding"]
-                if isinstance(embedding, list):
-                    bunka_embeddings.append(embedding)
-                else:
-                    bunka_embeddings.append(embedding.tolist())
-
-        # Add to the bunka objects
-        emb_doc_dict = {x: y for x, y in zip(ids, bunka_embeddings)}
-        for doc in self.docs:
-            doc.embedding = emb_doc_dict.get(doc.doc_id, [])
+            self.embeddings = self._align_pre_computed_embeddings(
+                pre_computed_embeddings, input_doc_ids, ids
+            )
 
-        # Add to the bunka objects
-        emb_doc_dict = {x: y for x, y in zip(ids, bunka_embeddings)}
-        for doc in self.docs:
-            doc.embedding = emb_doc_dict.get(doc.doc_id, [])
+        # The documents reference their row in the corpus-level matrix
+        for row, doc in enumerate(self.docs):
+            doc.embedding_row = row
 
         # REDUCTION OF DIMENSIONS
         logger.info("Reducing the dimensions of embeddings...")
 
         bunka_embeddings_2D = self.projection_model.fit_transform(
-            np.array(bunka_embeddings)
+            self.embeddings.vectors
         )
 
         # Insert to the Pydantic object
@@ -258,14 +266,18 @@ class Bunka:
             doc.x = xy_dict[doc.doc_id]["x"]
             doc.y = xy_dict[doc.doc_id]["y"]
 
-        # CREATE A PLOT
-
-        self.fig_embeddings = self._quick_plot(df_embeddings_2D)
+        # The plot of the embeddings is only built when `fig_embeddings` is read
+        self._fig_embeddings = None
 
         logger.info("Extracting meaningful terms from documents...")
-        terms_extractor = TextacyTermsExtractor(language=self.detected_language)
+        terms_extractor = TextacyTermsExtractor(
+            language=self.detected_language, n_process=terms_n_process
+        )
 
-        if len(sentences) >= sampling_size_for_terms:
+        if (
+            sampling_size_for_terms is not None
+            and len(sentences) >= sampling_size_for_terms
+        ):
             # Pair sentences with their corresponding ids
             paired_data = list(zip(sentences, ids))
             random.seed(42)
@@ -276,21 +288,286 @@ class Bunka:
             logger.info(
                 f"Sampling {sampling_size_for_terms} documents for term extraction"
             )
-            self.terms, indexed_terms_dict = terms_extractor.fit_transform(
+            self.terms, self.doc_term_matrix = terms_extractor.fit_transform(
                 sampled_ids, sampled_sentences
             )
 
         else:
-            self.terms, indexed_terms_dict = terms_extractor.fit_transform(
+            self.terms, self.doc_term_matrix = terms_extractor.fit_transform(
                 ids, sentences
             )
 
         # add to the docs object
+        indexed_terms_dict = self.doc_term_matrix.to_dict()
         for doc in self.docs:
             doc.term_id = indexed_terms_dict.get(doc.doc_id, [])
 
         self.topics = None
 
+    def partial_fit(
+        self,
+        docs: t.List[str],
+        ids: t.List[DOC_ID] = None,
+        metadata: t.Optional[t.List[dict]] = None,
+        max_drift: t.Optional[float] = None,
+        embedding_batch_size: int = 1024,
+        terms_n_process: int = 1,
+    ) -> t.List[Document]:
+        """
+        Adds new documents to a fitted Bunka model without fitting it again.
+
+        Only the new documents are embedded. They are placed on the existing 2D map with the
+        `transform` method of the fitted projection model, their terms are merged into the
+        existing ones and, if topics were computed, they are assigned to the topic with the
+        nearest centroid.
+
+        Args:
+            docs (t.List[str]): A list of new document strings.
+            ids (t.Optional[t.List[DOC_ID]]): Optional. A list of identifiers for the documents. If not provided,
+                UUIDs are generated. Documents whose id is already in the model are ignored.
+            metadata (t.Optional[t.List[str]): A of metadata dictionaries for the documents.
+            max_drift (t.Optional[float]): Optional. When the new documents are on average farther from their
+                topic centroid than `max_drift` times the fitted documents, the model is fitted again on all
+                documents, with the parameters of the last `get_topics`. Default is None (never refit).
+            embedding_batch_size (int): The number of documents embedded at once. Default is 1024.
+            terms_n_process (int): The number of processes used to extract terms. Default is 1.
+
+        Returns:
+            t.List[Document]: The added documents.
+
+        Raises:
+            BunkaError: If the model is not fitted or its projection model has no `transform` method.
+
+        Examples:
+        ```python
+        bunka.fit(docs)
+        bunka.get_topics(n_clusters=10)
+        bunka.partial_fit(new_docs, max_drift=1.5)
+        ```
+        """
+        if getattr(self, "docs", None) is None:
+            raise BunkaError(
+                "The Bunka model must be fitted before calling partial_fit"
+            )
+
+        new_docs, _ = self._create_documents(docs, ids, metadata)
+        new_docs = [
+            doc
+            for doc in new_docs
+            if doc.doc_id not in self.embeddings and doc.doc_id not in self.duplicates_
+        ]
+        if not new_docs:
+            logger.info("No new documents to add")
+            return []
+
+        sentences = [doc.content for doc in new_docs]
+        new_ids = [doc.doc_id for doc in new_docs]
+        logger.info(f"Adding {len(new_docs)} documents")
+
+        new_embeddings = self._embed_sentences(
+            sentences, batch_size=embedding_batch_size
+        )
+        embeddings_2D = self._project(new_embeddings)
+
+        start = len(self.embeddings)
+        self.embeddings = self.embeddings.append(new_embeddings, new_ids)
+        for row, (doc, (x, y)) in enumerate(zip(new_docs, embeddings_2D), start):
+            doc.embedding_row = row
+            doc.x, doc.y = float(x), float(y)
+
+        terms_extractor = TextacyTermsExtractor(
+            language=self.detected_language, n_process=terms_n_process
+        )
+        new_terms, new_doc_term_matrix = terms_extractor.fit_transform(
+            new_ids, sentences
+        )
+        self.terms = _merge_terms(self.terms, new_terms)
+        self.doc_term_matrix = self.doc_term_matrix.append(new_doc_term_matrix)
+        indexed_terms_dict = new_doc_term_matrix.to_dict()
+        for doc in new_docs:
+            doc.term_id = indexed_terms_dict.get(doc.doc_id, [])
+
+        self.docs = self.docs + new_docs
+
+        if getattr(self, "topics", None):
+            self._update_topics(new_docs, max_drift=max_drift)
+
+        return new_docs
+
+    def transform(
+        self,
+        docs: t.List[str],
+        ids: t.List[DOC_ID] = None,
+        embedding_batch_size: int = 1024,
+    ) -> t.List[Document]:
+        """
+        Places new documents on the map of a fitted Bunka model, without adding them to it.
+
+        The documents are embedded (through the embedding cache if any), projected with the
+        `transform` method of the fitted projection model and, if topics were computed,
+        assigned to the topic with the nearest centroid.
+
+        Args:
+            docs (t.List[str]): A list of document strings.
+            ids (t.Optional[t.List[DOC_ID]]): Optional. A list of identifiers for the documents. If not provided,
+                UUIDs are generated.
+            embedding_batch_size (int): The number of documents embedded at once. Default is 1024.
+
+        Returns:
+            t.List[Document]: The documents with their x, y and topic_id.
+
+        Raises:
+            BunkaError: If the model is not fitted or its projection model has no `transform` method.
+
+        Examples:
+        ```python
+        bunka.fit(docs)
+        bunka.get_topics(n_clusters=10)
+        new_docs = bunka.transform(["A new document", "Another one"])
+        ```
+        """
+        if getattr(self, "docs", None) is None:
+            raise BunkaError("The Bunka model must be fitted before calling transform")
+
+        new_docs, _ = self._create_documents(docs, ids)
+        if not new_docs:
+            return []
+
+        embeddings = self._embed_sentences(
+            [doc.content for doc in new_docs], batch_size=embedding_batch_size
+        )
+        for doc, (x, y) in zip(new_docs, self._project(embeddings)):
+            doc.x, doc.y = float(x), float(y)
+
+        if getattr(self, "topics", None):
+            self._assign_topics(new_docs, embeddings=embeddings)
+
+        return new_docs
+
+    def _update_topics(
+        self, new_docs: t.List[Document], max_drift: t.Optional[float] = None
+    ) -> None:
+        """Assigns new documents to the existing topics, fitting the model again if they drift too much."""
+        # The new documents have no topic yet
+        topic_ids = {topic.topic_id for topic in self.topics}
+        fitted_docs = [doc for doc in self.docs if doc.topic_id in topic_ids]
+        fitted_distances = self._distances_to_topics(fitted_docs)
+        new_distances = self._assign_topics(new_docs)
+
+        # Ratio between the spread of the new documents and the fitted ones around the centroids
+        self.drift_ = None
+        if len(fitted_distances) and fitted_distances.mean() > 0:
+            self.drift_ = float(new_distances.mean() / fitted_distances.mean())
+            logger.info(f"Topic drift of the new documents: {self.drift_:.2f}")
+
+        if (
+            max_drift is not None
+            and self.drift_ is not None
+            and self.drift_ > max_drift
+        ):
+            logger.info(
+                f"The drift is above {max_drift}, fitting the model on all documents"
+            )
+            self._refit()
+            return
+
+        # Update the sizes and the centroids of the topics with the new documents
+        topics = {topic.topic_id: topic for topic in self.topics}
+        for topic_id, group in pd.DataFrame(
+            {
+                "topic_id": [doc.topic_id for doc in new_docs],
+                "multiplicity": [doc.multiplicity for doc in new_docs],
+                "x": [doc.x * doc.multiplicity for doc in new_docs],
+                "y": [doc.y * doc.multiplicity for doc in new_docs],
+            }
+        ).groupby("topic_id"):
+            topic = topics[topic_id]
+            size = topic.size + group["multiplicity"].sum()
+            topic.x_centroid = (topic.x_centroid * topic.size + group["x"].sum()) / size
+            topic.y_centroid = (topic.y_centroid * topic.size + group["y"].sum()) / size
+            topic.size = int(size)
+
+        self.df_topics_, self.df_top_docs_per_topic_ = _create_topic_dfs(
+            self.topics, self.docs
+        )
+
+    def _distances_to_topics(self, docs: t.List[Document]) -> np.ndarray:
+        """Returns the distance of documents to the centroid of their topic."""
+        centroids = {
+            topic.topic_id: (topic.x_centroid, topic.y_centroid)
+            for topic in self.topics
+        }
+        points = np.array([[doc.x, doc.y] for doc in docs]).reshape(-1, 2)
+        doc_centroids = np.array([centroids[doc.topic_id] for doc in docs]).reshape(
+            -1, 2
+        )
+        return np.linalg.norm(points - doc_centroids, axis=1)
+
+    def _refit(self) -> None:
+        """Fits the model again on all its documents, reusing their embeddings."""
+        # The documents are already deduplicated: keep their groups
+        duplicates = self.duplicates_
+        multiplicities = {doc.doc_id: doc.multiplicity for doc in self.docs}
+        # Restored per document: the documents added by partial_fit may have no metadata
+        metadata = {doc.doc_id: doc.metadata for doc in self.docs}
+
+        self.fit(
+            docs=[doc.content for doc in self.docs],
+            ids=[doc.doc_id for doc in self.docs],
+            pre_computed_embeddings=self.embeddings,
+            language=self.detected_language,
+            **getattr(self, "fit_params_", {}),
+        )
+        self.duplicates_ = duplicates
+        for doc in self.docs:
+            doc.multiplicity = multiplicities.get(doc.doc_id, 1)
+            doc.metadata = metadata.get(doc.doc_id)
+
+        if getattr(self, "topics_params_", None) is not None:
+            self.get_topics(**self.topics_params_)
+
+    def resolve(self, doc_ids: t.Iterable[DOC_ID]) -> t.List[t.Optional[Document]]:
+        """
+        Returns the Document holding the coordinates and the topic of every document id.
+
+        The ids collapsed by the deduplication of `fit` resolve to the document representing
+        their group.
+
+        Args:
+            doc_ids (t.Iterable[DOC_ID]): The ids of input documents.
+
+        Returns:
+            t.List[t.Optional[Document]]: One Document per id, None for the ids not in the model.
+        """
+        index = {doc.doc_id: doc for doc in self.docs}
+        return [index.get(self.duplicates_.get(doc_id, doc_id)) for doc_id in doc_ids]
+
+    def benchmark_projections(
+        self,
+        backends: t.Optional[t.List[str]] = None,
+        sample_size: t.Optional[int] = 5000,
+    ) -> pd.DataFrame:
+        """
+        Compares the fit time and the trustworthiness of the projection backends on the embeddings.
+
+        Args:
+            backends (t.Optional[t.List[str]]): The backends to compare. Default is all registered backends.
+            sample_size (t.Optional[int]): The number of documents sampled for the benchmark. Default is 5000.
+
+        Returns:
+            pd.DataFrame: The backend, fit time in seconds and trustworthiness, best first.
+
+        Examples:
+        ```python
+        bunka.fit(docs)
+        print(bunka.benchmark_projections())
+        bunka = Bunka(projection_model="pca_umap")
+        ```
+        """
+        return benchmark_projections(
+            self.embeddings.vectors, backends=backends, sample_size=sample_size
+        )
+
     def remove_outliers(self, threshold=6):
         """
         Removes outliers from the dataset based on a specified threshold.
@@ -313,7 +590,10 @@ class Bunka:
         """
         Save the Bunka model to disk.
 
-        This method saves the Bunka model to disk by serializing its documents and terms.
+        This method saves the Bunka model to disk in a columnar format: Parquet files for the documents,
+        terms and topics, `.npy` matrices for the embeddings and the 2D coordinates, a `.npz` sparse
+        document-term matrix, the fitted projection model pickled with joblib and a JSON file of
+        settings (detected language, parameters of `get_topics`, identity of the embedding model).
 
         Args:
             path (str, optional): The directory path where the model will be saved.
@@ -331,31 +611,109 @@ class Bunka:
 
         save_bunka_models(path=path, bunka=self)
 
-    def load_bunka(self, path):
+    def load_bunka(self, path, mmap: bool = True):
         """
         Load the Bunka model from disk.
 
-        This method loads the Bunka model from disk by reading the serialized documents and terms.
+        This method loads the Bunka model saved by `save_bunka`: its documents, terms, embeddings,
+        document-term matrix, topics, fitted projection model and settings (detected language,
+        parameters of `get_topics`). The loaded model can `transform` new documents or be
+        visualized without being fitted again. Dumps in the JSONL format of older versions are read too.
 
         Args:
             path (str): The directory path from where the model will be loaded.
+            mmap (bool): Whether to memory-map the embeddings instead of reading them in memory. Default is True.
 
         Returns:
             bunka (Bunka): The loaded Bunka model.
         """
-        from .utils import read_documents_from_jsonl, read_terms_from_jsonl
+        from bunkatopics import serialization
+
+        if serialization.is_columnar_dump(path):
+            documents = serialization.read_documents(path, mmap=mmap)
+            terms = serialization.read_terms(path, mmap=mmap)
+            embeddings = serialization.read_embeddings(path, mmap=mmap)
+            doc_term_matrix = serialization.read_doc_term_matrix(path)
+            self.topics = serialization.read_topics(path)
+            projection_model = serialization.read_projection_model(path)
+            if projection_model is not None:
+                self.projection_model = projection_model
+            self._restore_settings(
+                serialization.read_settings(path),
+                serialization.read_clustering_model(path),
+            )
+
+        else:
+            from .utils import (
+                read_documents_from_jsonl,
+                read_embeddings,
+                read_terms_from_jsonl,
+            )
+
+            documents = read_documents_from_jsonl(path + "/bunka_docs.jsonl")
+            terms = read_terms_from_jsonl(path + "/bunka_terms.jsonl")
+            embeddings = read_embeddings(path)
+            doc_term_matrix = None
 
-        documents = read_documents_from_jsonl(path + "/bunka_docs.jsonl")
-        terms = read_terms_from_jsonl(path + "/bunka_terms.jsonl")
+        for doc in documents:
+            doc.embedding_row = embeddings.index.get(doc.doc_id)
 
         self.docs = documents
         self.terms = terms
+        self.embeddings = embeddings
+        if doc_term_matrix is None:
+            doc_term_matrix = DocTermMatrix.from_documents(
+                documents, vocabulary=[term.term_id for term in terms]
+            )
+        self.doc_term_matrix = doc_term_matrix
+
+        if getattr(self, "topics", None):
+            self.df_topics_, self.df_top_docs_per_topic_ = _create_topic_dfs(
+                self.topics, self.docs
+            )
+
+        return self
+
+    def _restore_settings(
+        self, settings: t.Dict[str, t.Any], clustering_model=None
+    ) -> None:
+        """Restores the state of a saved model that is not held by its documents, terms or topics."""
+        saved_model = settings.get("embedding_model")
+        if saved_model is not None and saved_model != self.embedding_backend.model_id:
+            logger.warning(
+                f"The model was saved with the embedding model {saved_model} but is loaded with "
+                f"{self.embedding_backend.model_id}: new documents will not be embedded in the same space"
+            )
+
+        if settings.get("detected_language") is not None:
+            self.detected_language = settings["detected_language"]
+            self.language_name = settings.get("language_name") or (
+                detect_language_to_language_name.get(self.detected_language, "english")
+            )
+        if clustering_model is not None:
+            self.clustering_model_ = clustering_model
+        if settings.get("topics_params") is not None:
+            topics_params = settings["topics_params"]
+            # Only a flag is saved for the custom clustering model
+            self.topics_params_ = {
+                **topics_params,
+                "custom_clustering_model": (
+                    clustering_model
+                    if topics_params.get("custom_clustering_model")
+                    else None
+                ),
+            }
+        if settings.get("fit_params") is not None:
+            self.fit_params_ = settings["fit_params"]
+        if settings.get("document_languages") is not None:
+            self.document_languages_ = settings["document_languages"]
+        self.duplicates_ = settings.get("duplicates") or {}
 
         return self
 
     def get_topics(
         self,
-        n_clusters: int = 5,
+        n_clusters: t.Union[int, str] = 5,
         ngrams: t.List[int] = [1, 2],
         name_length: int = 5,
         top_terms_overall: int = 2000,
@@ -364,6 +722,9 @@ class Bunka:
         max_doc_per_topic: int = 20,
         custom_clustering_model: bool = None,
         min_docs_per_cluster: int = 10,
+        clustering_space: str = "2d",
+        n_components: t.Optional[int] = None,
+        convex_hulls: bool = True,
     ) -> pd.DataFrame:
         """
         Computes and organizes topics from the documents using specified parameters.
@@ -371,12 +732,21 @@ class Bunka:
         This method uses a topic modeling process to identify and characterize topics within the data.
 
         Args:
-            n_clusters (int): The number of clusters to form. Default is 5.
+            n_clusters (t.Union[int, str]): The number of clusters to form, or "auto" to select it between 2 and 30
+                at the knee of the inertia curve of MiniBatchKMeans fitted in parallel on a sample. The curve, with
+                the silhouette of every candidate, is kept in `n_clusters_curve_`. Default is 5.
             ngrams (t.List[int]): The n-gram range to consider for topic extraction. Default is [1, 2].
             name_length (int): The length of the name for topics. Default is 10.
             top_terms_overall (int): The number of top terms to consider overall. Default is 2000.
             min_count_terms (int): The minimum count of terms to be considered. Default is 2.
             min_docs_per_cluster (int, optional): Minimum count of documents per topic
+            clustering_space (str): "2d" clusters the documents on the 2D map, "embeddings" clusters their
+                embeddings with a chunked float32 MiniBatchKMeans, the map being then used for display only.
+                New documents are assigned to the nearest cluster in the same space. Default is "2d".
+            n_components (int, optional): With `clustering_space="embeddings"`, reduces the embeddings to this
+                number of PCA components before clustering them. Default is None.
+            convex_hulls (bool): Whether to compute the convex hull of every topic. When False, they are
+                computed by `visualize_topics` if it draws them. Default is True.
 
         Returns:
             pd.DataFrame: A DataFrame containing the topics and their associated data.
@@ -386,51 +756,344 @@ class Bunka:
             with the resulting topics. It also associates the identified topics with the documents.
         """
 
-        # Add the conditional check for min_count_terms and len(self.docs)
-        if min_count_terms > 1 and len(self.docs) <= 500:
-            logger.info(
-                f"There is not enough data to select terms with a minimum occurrence of {min_count_terms}. Setting min_count_terms to 1"
-            )
-            min_count_terms = 1
+        # Kept to compute the same topics again when partial_fit refits the model
+        self.topics_params_ = dict(
+            n_clusters=n_clusters,
+            ngrams=ngrams,
+            name_length=name_length,
+            top_terms_overall=top_terms_overall,
+            min_count_terms=min_count_terms,
+            ranking_terms=ranking_terms,
+            max_doc_per_topic=max_doc_per_topic,
+            custom_clustering_model=custom_clustering_model,
+            min_docs_per_cluster=min_docs_per_cluster,
+            clustering_space=clustering_space,
+            n_components=n_components,
+            convex_hulls=convex_hulls,
+        )
 
         logger.info("Computing the topics")
 
-        topic_model = BunkaTopicModeling(
+        topic_model = self._topic_model_builder(
             n_clusters=n_clusters,
             ngrams=ngrams,
             name_length=name_length,
-            x_column="x",
-            y_column="y",
             top_terms_overall=top_terms_overall,
             min_count_terms=min_count_terms,
             custom_clustering_model=custom_clustering_model,
             min_docs_per_cluster=min_docs_per_cluster,
+            clustering_space=clustering_space,
+            n_components=n_components,
+            convex_hulls=convex_hulls,
         )
 
         self.topics: t.List[Topic] = topic_model.fit_transform(
             docs=self.docs,
             terms=self.terms,
+            doc_term_matrix=self.doc_term_matrix,
+            embeddings=self._clustering_embeddings(clustering_space),
         )
+        self.clustering_model_ = topic_model.clustering_model_
+        self.n_clusters_curve_ = getattr(topic_model, "n_clusters_curve_", None)
+        self.topics_level_ = None
 
-        model_ranker = DocumentRanker(
-            ranking_terms=ranking_terms, max_doc_per_topic=max_doc_per_topic
+        self._rank_topic_documents(ranking_terms, max_doc_per_topic)
+
+        self.df_topics_, self.df_top_docs_per_topic_ = _create_topic_dfs(
+            self.topics, self.docs
         )
-        self.docs, self.topics = model_ranker.fit_transform(self.docs, self.topics)
 
-        (
-            self.topics,
-            self.docs,
-        ) = _filter_hdbscan(self.topics, self.docs)
+        return self.df_topics_
+
+    def get_topics_sweep(
+        self,
+        n_clusters: t.List[int] = [5, 10, 20, 40],
+        ngrams: t.List[int] = [1, 2],
+        name_length: int = 5,
+        top_terms_overall: int = 2000,
+        min_count_terms: int = 2,
+        ranking_terms: int = 20,
+        max_doc_per_topic: int = 20,
+        min_docs_per_cluster: int = 10,
+        clustering_space: str = "2d",
+        n_components: t.Optional[int] = None,
+        silhouette_sample_size: int = 10_000,
+    ) -> pd.DataFrame:
+        """
+        Computes the topics of several numbers of clusters in one pass, to choose a granularity.
+
+        The resolutions share the document-term matrix, the k-means of every resolution starts
+        from the centers of the coarser one and all the topics are named in one vectorized pass.
+        The documents are left untouched: call `select_topics` with the chosen number of clusters
+        to rank their documents, compute their convex hulls and make them the topics of the model.
+
+        Args:
+            n_clusters (t.List[int]): The numbers of clusters to compute. Default is [5, 10, 20, 40].
+            silhouette_sample_size (int): The number of documents the silhouette score is computed on.
+                Default is 10,000.
+            The other arguments are the ones of `get_topics`.
+
+        Returns:
+            pd.DataFrame: One row per number of clusters with the number of topics kept, the inertia
+            of the k-means and the silhouette score on a sample of documents. The topics of every
+            resolution are stored in `topics_sweep_`.
 
+        Examples:
+        ```python
+        bunka.fit(docs)
+        bunka.get_topics_sweep(n_clusters=[5, 10, 20, 40])
+        bunka.select_topics(20)
+        ```
+        """
+        logger.info(f"Computing the topics of {len(n_clusters)} numbers of clusters")
+
+        topic_model = self._topic_model_builder(
+            n_clusters=None,
+            ngrams=ngrams,
+            name_length=name_length,
+            top_terms_overall=top_terms_overall,
+            min_count_terms=min_count_terms,
+            custom_clustering_model=None,
+            min_docs_per_cluster=min_docs_per_cluster,
+            clustering_space=clustering_space,
+            n_components=n_components,
+        )
+        self.topics_sweep_ = topic_model.fit_sweep(
+            docs=self.docs,
+            terms=self.terms,
+            n_clusters=n_clusters,
+            doc_term_matrix=self.doc_term_matrix,
+            embeddings=self._clustering_embeddings(clustering_space),
+            silhouette_sample_size=silhouette_sample_size,
+        )
+        self.topics_sweep_params_ = dict(
+            ngrams=ngrams,
+            name_length=name_length,
+            top_terms_overall=top_terms_overall,
+            min_count_terms=min_count_terms,
+            ranking_terms=ranking_terms,
+            max_doc_per_topic=max_doc_per_topic,
+            custom_clustering_model=None,
+            min_docs_per_cluster=min_docs_per_cluster,
+            clustering_space=clustering_space,
+            n_components=n_components,
+        )
+        self._topics_sweep_doc_ids = [doc.doc_id for doc in self.docs]
+
+        return pd.DataFrame(
+            [
+                {
+                    "n_clusters": k,
+                    "n_topics": len(result["topics"]),
+                    "inertia": result["inertia"],
+                    "silhouette": result["silhouette"],
+                }
+                for k, result in self.topics_sweep_.items()
+            ]
+        )
+
+    def select_topics(self, n_clusters: int) -> pd.DataFrame:
+        """
+        Makes the topics of one resolution of `get_topics_sweep` the topics of the model.
+
+        This is equivalent to calling `get_topics` with the same parameters, without clustering
+        the documents and naming the topics again.
+
+        Args:
+            n_clusters (int): One of the numbers of clusters of the sweep.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the topics and their associated data.
+
+        Raises:
+            BunkaError: If `n_clusters` was not computed by the last sweep, or if the documents
+                changed since.
+        """
+        result = getattr(self, "topics_sweep_", {}).get(n_clusters)
+        if result is None:
+            raise BunkaError(
+                f"No topics for {n_clusters} clusters, call get_topics_sweep with it first"
+            )
+        if [doc.doc_id for doc in self.docs] != self._topics_sweep_doc_ids:
+            raise BunkaError(
+                "The documents changed since get_topics_sweep, call it again"
+            )
+
+        for doc, topic_id in zip(self.docs, result["topic_ids"]):
+            doc.topic_id = topic_id
+        self.topics = [topic.model_copy(deep=True) for topic in result["topics"]]
+        _add_convex_hulls(self.topics, self.docs)
+        self.clustering_model_ = result["clustering_model"]
+        self.topics_level_ = None
+        self.topics_params_ = dict(n_clusters=n_clusters, **self.topics_sweep_params_)
+
+        self._rank_topic_documents(
+            self.topics_params_["ranking_terms"],
+            self.topics_params_["max_doc_per_topic"],
+        )
         self.df_topics_, self.df_top_docs_per_topic_ = _create_topic_dfs(
             self.topics, self.docs
         )
 
         return self.df_topics_
 
+    def get_topics_hierarchy(
+        self,
+        n_clusters: t.List[int] = [5, 10, 20],
+        n_fine_clusters: t.Optional[int] = None,
+        ngrams: t.List[int] = [1, 2],
+        name_length: int = 5,
+        top_terms_overall: int = 2000,
+        min_count_terms: int = 2,
+        ranking_terms: int = 20,
+        max_doc_per_topic: int = 20,
+        min_docs_per_cluster: int = 10,
+        clustering_space: str = "2d",
+        n_components: t.Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Computes a hierarchy of topics, that can then be cut at any level with `cut_topics`.
+
+        The documents are clustered once into `n_fine_clusters` clusters, whose centers are merged
+        by a Ward dendrogram. The assignment of the clusters to every level of the dendrogram is
+        cached: moving to another level does not cluster the documents again. The topics of the
+        levels `n_clusters` are named at once, and linked through their `level`, `parent_topic_id`
+        and `children_topic_id`. The topics of the coarsest level become the topics of the model.
+
+        Args:
+            n_clusters (t.List[int]): The numbers of topics of the levels to name. Default is [5, 10, 20].
+            n_fine_clusters (int, optional): The number of clusters of the k-means, the finest level the
+                hierarchy can be cut at. Default is the largest of `n_clusters`.
+            The other arguments are the ones of `get_topics`.
+
+        Returns:
+            pd.DataFrame: The topics of all the named levels, with their level and parent.
+
+        Examples:
+        ```python
+        bunka.fit(docs)
+        bunka.get_topics_hierarchy(n_clusters=[5, 10, 20], n_fine_clusters=50)
+        bunka.cut_topics(10)  # zoom in
+        bunka.cut_topics(37)  # any level up to n_fine_clusters
+        ```
+        """
+        logger.info("Computing the hierarchy of topics")
+
+        params = dict(
+            ngrams=ngrams,
+            name_length=name_length,
+            top_terms_overall=top_terms_overall,
+            min_count_terms=min_count_terms,
+            custom_clustering_model=None,
+            min_docs_per_cluster=min_docs_per_cluster,
+            clustering_space=clustering_space,
+            n_components=n_components,
+        )
+        topic_model = self._topic_model_builder(n_clusters=None, **params)
+        self.topic_hierarchy_ = topic_model.fit_hierarchy(
+            docs=self.docs,
+            terms=self.terms,
+            n_clusters=n_clusters,
+            n_fine_clusters=n_fine_clusters,
+            doc_term_matrix=self.doc_term_matrix,
+            embeddings=self._clustering_embeddings(clustering_space),
+        )
+        self.topics_hierarchy_params_ = dict(
+            ranking_terms=ranking_terms, max_doc_per_topic=max_doc_per_topic, **params
+        )
+        self._topic_hierarchy_doc_ids = [doc.doc_id for doc in self.docs]
+
+        self.cut_topics(min(n_clusters))
+        return self.get_topic_hierarchy_df()
+
+    def cut_topics(self, n_clusters: int) -> pd.DataFrame:
+        """
+        Makes the topics of one level of the hierarchy of `get_topics_hierarchy` the topics of the model.
+
+        The documents of the level are read from the cached cuts of the dendrogram. A level that was
+        not named yet is named and linked to the others.
+
+        Args:
+            n_clusters (int): The number of topics of the level, at most the number of fine clusters.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the topics and their associated data.
+
+        Raises:
+            BunkaError: If there is no hierarchy, or if the documents changed since it was computed.
+        """
+        hierarchy = getattr(self, "topic_hierarchy_", None)
+        if hierarchy is None:
+            raise BunkaError("Call get_topics_hierarchy before cutting the topics")
+        if [doc.doc_id for doc in self.docs] != self._topic_hierarchy_doc_ids:
+            raise BunkaError(
+                "The documents changed since get_topics_hierarchy, call it again"
+            )
+
+        params = dict(self.topics_hierarchy_params_)
+        ranking_terms = params.pop("ranking_terms")
+        max_doc_per_topic = params.pop("max_doc_per_topic")
+        if n_clusters not in hierarchy.topics:
+            topic_model = self._topic_model_builder(n_clusters=n_clusters, **params)
+            topic_model.name_levels(
+                hierarchy,
+                self.docs,
+                self.terms,
+                [n_clusters],
+                doc_term_matrix=self.doc_term_matrix,
+            )
+
+        for doc, topic_id in zip(self.docs, hierarchy.topic_ids(n_clusters)):
+            doc.topic_id = topic_id
+        self.topics = [
+            topic.model_copy(deep=True) for topic in hierarchy.topics[n_clusters]
+        ]
+        _add_convex_hulls(self.topics, self.docs)
+        self.clustering_model_ = hierarchy.clustering_model
+        self.topics_level_ = n_clusters
+        self.topics_params_ = dict(
+            n_clusters=n_clusters,
+            ranking_terms=ranking_terms,
+            max_doc_per_topic=max_doc_per_topic,
+            **params,
+        )
+
+        self._rank_topic_documents(ranking_terms, max_doc_per_topic)
+        self.df_topics_, self.df_top_docs_per_topic_ = _create_topic_dfs(
+            self.topics, self.docs
+        )
+
+        return self.df_topics_
+
+    def get_topic_hierarchy_df(self) -> pd.DataFrame:
+        """
+        Returns the topics of all the named levels of the hierarchy.
+
+        Returns:
+            pd.DataFrame: One row per topic with its level (the number of topics of the level), topic_id,
+            name, size and parent_topic_id.
+        """
+        hierarchy = getattr(self, "topic_hierarchy_", None)
+        if hierarchy is None:
+            raise BunkaError("Call get_topics_hierarchy first")
+
+        return pd.DataFrame(
+            [
+                {
+                    "level": topic.level,
+                    "topic_id": topic.topic_id,
+                    "topic_name": topic.name,
+                    "size": topic.size,
+                    "parent_topic_id": topic.parent_topic_id,
+                }
+                for n_clusters in sorted(hierarchy.topics)
+                for topic in hierarchy.topics[n_clusters]
+            ]
+        )
+
     def get_clean_topic_name(
         self,
-        llm: LLM,
+        llm: "LLM",
         use_doc: bool = False,
         context: str = "everything",
     ) -> pd.DataFrame:
@@ -481,7 +1144,7 @@ class Bunka:
         convex_hull: bool = True,
         color: str = None,
         # search: str = None,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Generates a visualization of the identified topics in the document set.
 
@@ -503,8 +1166,18 @@ class Bunka:
             using Plotly for interactive visualization. It displays how documents are grouped
             into topics and can include text labels for clarity.
         """
+        from bunkatopics.visualization import TopicVisualizer
+
         logger.info("Creating the Bunka Map")
 
+        if convex_hull:
+            # The convex hulls may have been skipped by get_topics
+            missing_hulls = [
+                topic for topic in self.topics if topic.convex_hull is None
+            ]
+            if missing_hulls:
+                _add_convex_hulls(missing_hulls, self.docs)
+
         model_visualizer = TopicVisualizer(
             width=width,
             height=height,
@@ -521,7 +1194,7 @@ class Bunka:
 
     def visualize_bourdieu(
         self,
-        llm: t.Optional[LLM] = None,
+        llm: t.Optional["LLM"] = None,
         x_left_words: t.List[str] = ["war"],
         x_right_words: t.List[str] = ["peace"],
         y_top_words: t.List[str] = ["men"],
@@ -545,7 +1218,7 @@ class Bunka:
         label_size_ratio_label: int = 50,
         label_size_ratio_percent: int = 10,
         min_docs_per_cluster: int = 5,
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Creates and visualizes a Bourdieu Map using specified parameters and a generative model.
 
@@ -581,6 +1254,8 @@ class Bunka:
             offering a range of customization options for detailed analysis.
         """
 
+        from bunkatopics.bourdieu import BourdieuAPI, BourdieuVisualizer
+
         logger.info("Creating the Bourdieu Map")
         topic_gen_param = TopicGenParam(
             language=gen_topic_language,
@@ -609,7 +1284,7 @@ class Bunka:
 
         bourdieu_api = BourdieuAPI(
             llm=llm,
-            embedding_model=self.embedding_model,
+            embedding_model=self.embedding_backend,
             bourdieu_query=self.bourdieu_query,
             topic_param=topic_param,
             topic_gen_param=topic_gen_param,
@@ -622,6 +1297,7 @@ class Bunka:
         res = bourdieu_api.fit_transform(
             docs=new_docs,
             terms=new_terms,
+            embeddings=self.embeddings,
         )
 
         self.bourdieu_docs = res[0]
@@ -652,7 +1328,7 @@ class Bunka:
         width: int = 800,
         height: int = 800,
         explainer: bool = False,
-    ) -> t.Tuple[go.Figure, t.Union[plt.Figure, None]]:
+    ) -> t.Tuple["go.Figure", t.Union["plt.Figure", None]]:
         """
         Visualizes the document set on a one-dimensional Bourdieu axis.
 
@@ -673,9 +1349,10 @@ class Bunka:
             in terms of these contrasting word concepts. An optional explainer figure can provide additional
             insight into specific terms used in the visualization.
         """
+        from bunkatopics.bourdieu import BourdieuOneDimensionVisualizer
 
         model_bourdieu = BourdieuOneDimensionVisualizer(
-            embedding_model=self.embedding_model,
+            embedding_model=self.embedding_backend,
             left=left,
             right=right,
             width=width,
@@ -685,6 +1362,7 @@ class Bunka:
 
         fig = model_bourdieu.fit_transform(
             docs=self.docs,
+            embeddings=self.embeddings,
         )
 
         return fig
@@ -696,10 +1374,13 @@ class Bunka:
         width: int = 600,
         height: int = 300,
     ):
+        from bunkatopics.visualization.query_visualizer import plot_query
+
         # Create a visualization plot using plot_query function
         fig, percent = plot_query(
-            embedding_model=self.embedding_model,
+            embedding_model=self.embedding_backend,
             docs=self.docs,
+            embeddings=self.embeddings,
             query=query,
             min_score=min_score,
             width=width,
@@ -715,7 +1396,7 @@ class Bunka:
         width=500,
         height=500,
         template="plotly_dark",
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Visualizes the similarity scores between a given query and the document set.
 
@@ -732,6 +1413,8 @@ class Bunka:
             the specified query. Documents with similarity scores above the threshold are highlighted,
             providing a visual representation of their relevance to the query.
         """
+        import plotly.express as px
+        from sklearn.preprocessing import MinMaxScaler
 
         final_df = []
         logger.info("Computing Similarities")
@@ -770,7 +1453,9 @@ class Bunka:
         )
         return fig
 
-    def get_topic_repartition(self, width: int = 1200, height: int = 800) -> go.Figure:
+    def get_topic_repartition(
+        self, width: int = 1200, height: int = 800
+    ) -> "go.Figure":
         """
         Creates a bar plot to visualize the distribution of topics by size.
 
@@ -787,6 +1472,7 @@ class Bunka:
             of topics within the document set. It provides a clear and concise bar plot for
             easy interpretation of the topic sizes.
         """
+        from bunkatopics.topic_modeling.topic_utils import get_topic_repartition
 
         fig = get_topic_repartition(self.topics, width=width, height=height)
         return fig
@@ -816,6 +1502,8 @@ class Bunka:
             - The cleaning process is triggered by clicking the 'Clean Data' button.
 
         """
+        from IPython.display import display
+        from ipywidgets import Button, Checkbox, Label, Layout, VBox
 
         def on_button_clicked(b):
             selected_topics = [
@@ -882,6 +1570,8 @@ class Bunka:
             - The cleaning process is triggered by clicking the 'Apply Changes' button.
 
         """
+        from IPython.display import display
+        from ipywidgets import widgets
 
         def apply_changes(b):
             for i, text_widget in enumerate(text_widgets):
@@ -933,6 +1623,8 @@ class Bunka:
         display(container, apply_button)
 
     def start_server(self):
+        from bunkatopics.serveur import is_server_running, kill_server
+
         subprocess.run(["cp", "web/env.model", "web/.env"], check=True)
         if is_server_running():
             logger.info("Server on port 3000 is already running. Killing it...")
@@ -942,8 +1634,6 @@ class Bunka:
         else:
             file_path = "web/public" + "/bunka_docs.json"
 
-            for x in self.docs:
-                x.embedding = None
             docs_json = [x.model_dump() for x in self.docs]
             with open(file_path, "w") as json_file:
                 json.dump(docs_json, json_file)
@@ -975,7 +1665,234 @@ class Bunka:
         subprocess.Popen(["npm", "start"], cwd="web")
         logger.info("NPM server started.")
 
+    def _create_documents(
+        self,
+        docs: t.List[str],
+        ids: t.Optional[t.List[DOC_ID]] = None,
+        metadata: t.Optional[t.Dict[str, t.List]] = None,
+    ) -> t.Tuple[t.List[Document], t.List[DOC_ID]]:
+        """Creates the Documents of the texts, and returns them with the ids of all the input texts."""
+        df = pd.DataFrame(docs, columns=["content"])
+
+        # Transform into a Document model
+        if ids is not None:
+            ids = [str(x) for x in ids]
+            df["doc_id"] = ids
+            df = df.drop_duplicates(subset="doc_id", keep="first")
+
+        else:
+            df["doc_id"] = [str(uuid.uuid4())[:20] for _ in range(len(df))]
+
+        input_doc_ids = df["doc_id"].tolist()
+
+        if metadata is not None:
+            metadata_values = [
+                {key: metadata[key][i] for key in metadata} for i in range(len(df))
+            ]
+
+            df["metadata"] = metadata_values
+
+        df = df[~df["content"].isna()]
+        df = df.reset_index(drop=True)
+
+        documents = [Document(**row) for row in df.to_dict(orient="records")]
+        return documents, input_doc_ids
+
+    def _collapse_duplicates(
+        self, docs: t.List[Document], method: str, threshold: float
+    ) -> t.List[Document]:
+        """Keeps the first Document of every group of duplicates, with the size of its group."""
+        from bunkatopics.cleaning import find_duplicates
+
+        representatives = find_duplicates(
+            [doc.content for doc in docs], method=method, threshold=threshold
+        )
+        multiplicities = np.bincount(representatives, minlength=len(docs))
+
+        kept_docs = []
+        for i, (doc, representative) in enumerate(zip(docs, representatives)):
+            if representative == i:
+                doc.multiplicity = int(multiplicities[i])
+                kept_docs.append(doc)
+            else:
+                self.duplicates_[doc.doc_id] = docs[representative].doc_id
+
+        logger.info(
+            f"Collapsed {len(self.duplicates_)} duplicated documents, "
+            f"{len(kept_docs)} documents are left"
+        )
+        return kept_docs
+
+    def _embed_sentences(
+        self,
+        sentences: t.List[str],
+        batch_size: int = 1024,
+        memmap_path: t.Optional[str] = None,
+    ) -> np.ndarray:
+        """Embeds sentences batch by batch, through the embedding cache if there is one."""
+        if self.embedding_cache is not None:
+            model_id = self.embedding_backend.model_id
+            hits, misses = self.embedding_cache.hits, self.embedding_cache.misses
+
+            def encode(batch: t.List[str]) -> np.ndarray:
+                return self.embedding_cache.get_or_compute(
+                    model_id, batch, self.embedding_backend.encode
+                )
+
+        else:
+            encode = self.embedding_backend.encode
+
+        # Encode batch by batch straight into a single float32 matrix
+        embeddings = embed_in_batches(
+            (sentence for sentence in sentences),
+            n_sentences=len(sentences),
+            encode=encode,
+            batch_size=batch_size,
+            memmap_path=memmap_path,
+        )
+
+        if self.embedding_cache is not None:
+            logger.info(
+                f"Embedding cache: {self.embedding_cache.hits - hits} hits, "
+                f"{self.embedding_cache.misses - misses} misses"
+            )
+
+        return embeddings
+
+    def _topic_model_builder(
+        self, min_count_terms: int, **params
+    ) -> BunkaTopicModeling:
+        # Add the conditional check for min_count_terms and len(self.docs)
+        if min_count_terms > 1 and len(self.docs) <= 500:
+            logger.info(
+                f"There is not enough data to select terms with a minimum occurrence of {min_count_terms}. Setting min_count_terms to 1"
+            )
+            min_count_terms = 1
+
+        return BunkaTopicModeling(
+            x_column="x", y_column="y", min_count_terms=min_count_terms, **params
+        )
+
+    def _clustering_embeddings(self, clustering_space: str) -> t.Optional[np.ndarray]:
+        """The embeddings of the documents, when they are clustered in that space."""
+        if clustering_space == "embeddings":
+            return self.embeddings.vectors_of(self.docs)
+        return None
+
+    def _rank_topic_documents(self, ranking_terms: int, max_doc_per_topic: int) -> None:
+        """Ranks the documents of every topic and drops the noise topic of HDBSCAN, if any."""
+        model_ranker = DocumentRanker(
+            ranking_terms=ranking_terms, max_doc_per_topic=max_doc_per_topic
+        )
+        self.docs, self.topics = model_ranker.fit_transform(
+            self.docs, self.topics, doc_term_matrix=self.doc_term_matrix
+        )
+
+        (
+            self.topics,
+            self.docs,
+        ) = _filter_hdbscan(self.topics, self.docs)
+
+    def _project(self, embeddings: np.ndarray) -> np.ndarray:
+        """Places new embeddings on the 2D map with the fitted projection model."""
+        if not hasattr(self.projection_model, "transform"):
+            raise BunkaError(
+                f"The projection model {type(self.projection_model).__name__} cannot place new "
+                "documents on the map as it has no transform method, call fit instead"
+            )
+        return np.asarray(self.projection_model.transform(embeddings))
+
+    def _assign_topics(
+        self, docs: t.List[Document], embeddings: t.Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Assigns documents to the topic with the nearest centroid and returns their distance to it on the map."""
+        centroids = np.array(
+            [[topic.x_centroid, topic.y_centroid] for topic in self.topics]
+        )
+        points = np.array([[doc.x, doc.y] for doc in docs]).reshape(-1, 2)
+        distances = np.linalg.norm(points[:, None, :] - centroids[None, :, :], axis=2)
+
+        nearest = distances.argmin(axis=1)
+
+        clustering_model = getattr(self, "clustering_model_", None)
+        if (
+            (getattr(self, "topics_params_", None) or {}).get("clustering_space")
+            == "embeddings"
+        ) and hasattr(clustering_model, "transform"):
+            # The topics are clusters of embeddings: use the nearest center of a kept topic
+            topic_index = {topic.topic_id: i for i, topic in enumerate(self.topics)}
+            cluster_topics = np.array(
+                [
+                    topic_index.get(topic_id, -1)
+                    for topic_id in self._cluster_topic_ids(
+                        len(clustering_model.cluster_centers_)
+                    )
+                ]
+            )
+            if (cluster_topics >= 0).any():
+                if embeddings is None:
+                    embeddings = self.embeddings.vectors_of(docs)
+                center_distances = clustering_model.transform(embeddings)
+                center_distances[:, cluster_topics < 0] = np.inf
+                nearest = cluster_topics[center_distances.argmin(axis=1)]
+        for doc, topic_index in zip(docs, nearest):
+            doc.topic_id = self.topics[topic_index].topic_id
+
+        return distances[np.arange(len(docs)), nearest]
+
+    def _cluster_topic_ids(self, n_clusters: int) -> t.List[TOPIC_ID]:
+        """The topic_id of every cluster of the clustering model."""
+        level = getattr(self, "topics_level_", None)
+        if level is not None:
+            return list(self.topic_hierarchy_.topic_ids_of_clusters(level))
+        return [f"bt-{i}" for i in range(n_clusters)]
+
+    def _align_pre_computed_embeddings(
+        self,
+        pre_computed_embeddings: PreComputedEmbeddings,
+        input_doc_ids: t.List[DOC_ID],
+        ids: t.List[DOC_ID],
+    ) -> EmbeddingMatrix:
+        """Aligns pre-computed embeddings with the documents through the doc_id index."""
+        embeddings = to_embedding_matrix(pre_computed_embeddings, input_doc_ids)
+        embeddings, missing_ids, extra_ids = embeddings.align(ids)
+        # The embeddings of collapsed duplicates are expected to be left out
+        extra_ids = [doc_id for doc_id in extra_ids if doc_id not in self.duplicates_]
+
+        if extra_ids:
+            logger.warning(
+                f"{len(extra_ids)} pre-computed embeddings do not match any document and are ignored"
+            )
+        if missing_ids:
+            raise BunkaError(
+                f"{len(missing_ids)} documents have no pre-computed embedding, "
+                f"for instance: {missing_ids[:5]}"
+            )
+
+        return embeddings
+
+    @property
+    def fig_embeddings(self) -> "go.Figure":
+        """A scatter plot of the 2D embeddings of the documents, built on first access."""
+        if getattr(self, "_fig_embeddings", None) is None:
+            df_embeddings_2D = pd.DataFrame(
+                {
+                    "x": [doc.x for doc in self.docs],
+                    "y": [doc.y for doc in self.docs],
+                    "doc_id": [doc.doc_id for doc in self.docs],
+                    "bunka_docs": [doc.content for doc in self.docs],
+                }
+            )
+            self._fig_embeddings = self._quick_plot(df_embeddings_2D)
+        return self._fig_embeddings
+
+    @fig_embeddings.setter
+    def fig_embeddings(self, fig: "go.Figure") -> None:
+        self._fig_embeddings = fig
+
     def _quick_plot(self, df_embeddings_2D):
+        import plotly.express as px
+
         # Create a scatter plot
         fig_quick_embedding = px.scatter(
             df_embeddings_2D, x="x", y="y", hover_data=["bunka_docs"]
@@ -3,20 +3,18 @@ import warnings
 
 import numpy as np
 import pandas as pd
-from FlagEmbedding import FlagModel
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain_core.embeddings import Embeddings
-from langchain_core.language_models.llms import LLM
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.preprocessing import MinMaxScaler
 
 from bunkatopics.datamodel import (BourdieuDimension, BourdieuQuery,
                                    ContinuumDimension, Document, Term, Topic,
                                    TopicGenParam, TopicParam)
+from bunkatopics.embeddings import EmbeddingMatrix, as_embedding_backend
 from bunkatopics.topic_modeling import (BunkaTopicModeling, DocumentRanker,
                                         LLMCleaningTopic)
 
+if t.TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+    from langchain_core.language_models.llms import LLM
+
 # Ignore all UserWarnings
 warnings.filterwarnings("ignore", category=UserWarning)
 pd.options.mode.chained_assignment = None
@@ -34,8 +32,8 @@ class BourdieuAPI:
 
     def __init__(
         self,
-        embedding_model: Embeddings,
-        llm: t.Optional[LLM] = None,
+        embedding_model: "Embeddings",
+        llm: t.Optional["LLM"] = None,
         bourdieu_query: BourdieuQuery = BourdieuQuery(),
         topic_param: TopicParam = TopicParam(),
         topic_gen_param: TopicGenParam = TopicGenParam(),
@@ -59,6 +57,7 @@ class BourdieuAPI:
 
         self.llm = llm
         self.embedding_model = embedding_model
+        self.embedding_backend = as_embedding_backend(embedding_model)
         self.bourdieu_query = bourdieu_query
         self.topic_param = topic_param
         self.topic_gen_param = topic_gen_param
@@ -67,7 +66,10 @@ class BourdieuAPI:
         self.min_docs_per_cluster = min_docs_per_cluster
 
     def fit_transform(
-        self, docs: t.List[Document], terms: t.List[Term]
+        self,
+        docs: t.List[Document],
+        terms: t.List[Term],
+        embeddings: t.Optional[EmbeddingMatrix] = None,
     ) -> t.Tuple[t.List[Document], t.List[Topic]]:
         """
         Processes the documents and terms to compute Bourdieu dimensions and topics.
@@ -79,6 +81,8 @@ class BourdieuAPI:
         Arguments:
             docs (List[Document]): List of Document objects representing the documents to be analyzed.
             terms (List[Term]): List of Term objects representing the terms to be used in topic modeling.
+            embeddings (EmbeddingMatrix, optional): The embeddings of the documents. If None, the documents
+                are embedded with the embedding model.
 
         Notes:
             - The method first resets Bourdieu dimensions for all documents.
@@ -92,10 +96,19 @@ class BourdieuAPI:
         for doc in docs:
             doc.bourdieu_dimensions = []
 
+        if embeddings is None:
+            embeddings = EmbeddingMatrix(
+                self.embedding_backend.encode([doc.content for doc in docs]),
+                [doc.doc_id for doc in docs],
+            )
+            for row, doc in enumerate(docs):
+                doc.embedding_row = row
+
         # Compute Continuums
         new_docs = _get_continuum(
             self.embedding_model,
             docs,
+            embeddings,
             cont_name="cont1",
             left_words=self.bourdieu_query.x_left_words,
             right_words=self.bourdieu_query.x_right_words,
@@ -103,6 +116,7 @@ class BourdieuAPI:
         bourdieu_docs = _get_continuum(
             self.embedding_model,
             new_docs,
+            embeddings,
             cont_name="cont2",
             left_words=self.bourdieu_query.y_top_words,
             right_words=self.bourdieu_query.y_bottom_words,
@@ -186,6 +200,7 @@ class BourdieuAPI:
 def _get_continuum(
     embedding_model,
     docs: t.List[Document],
+    embeddings: EmbeddingMatrix,
     cont_name: str = "emotion",
     left_words: list = ["hate"],
     right_words: list = ["love"],
@@ -195,8 +210,9 @@ def _get_continuum(
     Compute the Bourdieu continuum dimensions for a list of documents.
 
     Args:
-        embedding_model: The embedding model.
+        embedding_model: The embedding model, or an EmbeddingBackend.
         docs: List of documents.
+        embeddings: The embedding matrix referenced by the documents.
         cont_name: Name of the continuum dimension.
         left_words: List of words representing the left side of the continuum.
         right_words: List of words representing the right side of the continuum.
@@ -205,68 +221,31 @@ def _get_continuum(
     Returns:
         List of documents with Bourdieu dimensions.
     """
-    # Create a DataFrame from the input documents
-    df_docs = pd.DataFrame.from_records([doc.model_dump() for doc in docs])
-    df_emb = df_docs[["doc_id", "embedding"]]
-    df_emb = df_emb.set_index("doc_id")
-    df_emb = pd.DataFrame(list(df_emb["embedding"]))
-    df_emb.index = df_docs["doc_id"]
-
     continuum = ContinuumDimension(
         id=cont_name, left_words=left_words, right_words=right_words
     )
 
-    # Determine if self.embedding_model is an instance of SentenceTransformer
-
-    if isinstance(embedding_model, SentenceTransformer):
-        left_embedding = embedding_model.encode(
-            continuum.left_words, show_progress_bar=True
-        )
-        right_embedding = embedding_model.encode(
-            continuum.right_words, show_progress_bar=True
-        )
-
-    elif isinstance(embedding_model, HuggingFaceEmbeddings):
-        left_embedding = embedding_model.embed_documents(continuum.left_words)
-        right_embedding = embedding_model.embed_documents(continuum.right_words)
-
-    elif isinstance(embedding_model, FlagModel):
-        left_embedding = embedding_model.encode(continuum.left_words)
-        right_embedding = embedding_model.encode(continuum.right_words)
-
-    left_embedding = pd.DataFrame(left_embedding).mean().values.reshape(1, -1)
-    right_embedding = pd.DataFrame(right_embedding).mean().values.reshape(1, -1)
+    embedding_backend = as_embedding_backend(embedding_model)
+    left_embedding = embedding_backend.encode(continuum.left_words).mean(axis=0)
+    right_embedding = embedding_backend.encode(continuum.right_words).mean(axis=0)
 
     # Compute the continuum embedding
     continuum_embedding = left_embedding - right_embedding
-    df_continuum = pd.DataFrame(continuum_embedding)
-    df_continuum.index = ["distance"]
-
-    # Compute the Cosine Similarity
-    full_emb = pd.concat([df_emb, df_continuum])
-    df_bert = pd.DataFrame(cosine_similarity(full_emb))
 
-    df_bert.index = full_emb.index
-    df_bert.columns = full_emb.index
-    df_bert = df_bert.iloc[-1:,].T
-    df_bert = df_bert.sort_values("distance", ascending=False).reset_index()
-    df_bert = df_bert[1:]
-    df_bert = df_bert.rename(columns={"index": "doc_id"})
-    final_df = pd.merge(df_bert, df_docs[["doc_id", "content"]], on="doc_id")
+    # Cosine Similarity of every document with the continuum, in a single product
+    distances = embeddings.cosine_similarity(
+        continuum_embedding, rows=embeddings.rows_of(docs)
+    )
 
     if scale:
-        scaler = MinMaxScaler(feature_range=(-1, 1))
-        final_df[["distance"]] = scaler.fit_transform(final_df[["distance"]])
+        from sklearn.preprocessing import MinMaxScaler
 
-    final_df = final_df.set_index("doc_id")
-    final_df = final_df[["distance"]]
+        scaler = MinMaxScaler(feature_range=(-1, 1))
+        distances = scaler.fit_transform(distances.reshape(-1, 1)).ravel()
 
-    distance_dict = final_df.to_dict("index")
     bourdieu_docs = docs.copy()
-    for doc in bourdieu_docs:
-        res = BourdieuDimension(
-            continuum=continuum, distance=distance_dict.get(doc.doc_id)["distance"]
-        )
+    for doc, distance in zip(bourdieu_docs, distances.tolist()):
+        res = BourdieuDimension(continuum=continuum, distance=distance)
         doc.bourdieu_dimensions.append(res)
 
     return bourdieu_docs
@@ -4,12 +4,15 @@ import typing as t
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from langchain_core.embeddings import Embeddings
 
 from bunkatopics.bourdieu.bourdieu_api import _get_continuum
 from bunkatopics.datamodel import Document
+from bunkatopics.embeddings import EmbeddingMatrix
 from bunkatopics.visualization.visualization_utils import wrap_by_word
 
+if t.TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
 pd.options.mode.chained_assignment = None
 
 
@@ -20,7 +23,7 @@ class BourdieuOneDimensionVisualizer:
 
     def __init__(
         self,
-        embedding_model: Embeddings,
+        embedding_model: "Embeddings",
         left: str = ["aggressivity"],
         right: str = ["peacefulness"],
         height=700,
@@ -49,12 +52,15 @@ class BourdieuOneDimensionVisualizer:
         self.explainer = explainer
         self.explainer_ngrams = explainer_ngrams
 
-    def fit_transform(self, docs: t.List[Document]) -> go.Figure:
+    def fit_transform(
+        self, docs: t.List[Document], embeddings: EmbeddingMatrix
+    ) -> go.Figure:
         """
         Analyzes a list of Document objects and visualizes their distribution along the unique continuum.
 
         Args:
             docs (List[Document]): A list of Document objects to be analyzed.
+            embeddings (EmbeddingMatrix): The embedding matrix referenced by the documents.
 
         Returns:
             Tuple[go.Figure, plt]: A tuple containing a Plotly figures and a matplolib Figure. The first figure represents the
@@ -68,6 +74,7 @@ class BourdieuOneDimensionVisualizer:
         self.new_docs = _get_continuum(
             embedding_model=self.embedding_model,
             docs=self.docs,
+            embeddings=embeddings,
             cont_name=self.id,
             left_words=self.left,
             right_words=self.right,
@@ -268,22 +268,22 @@ class BourdieuVisualizer:
                 )
 
             if self.convex_hull:
-                try:
-                    for topic in bourdieu_topics:
-                        # Create a Scatter plot with the convex hull coordinates
-                        trace = go.Scatter(
-                            x=topic.convex_hull.x_coordinates,
-                            y=topic.convex_hull.y_coordinates,  # Assuming y=0 for simplicity
-                            mode="lines",
-                            name="Convex Hull",
-                            line=dict(color="grey", dash="dot"),
-                            showlegend=False,
-                            hoverinfo="none",
-                        )
-
-                        fig.add_trace(trace)
-                except Exception as e:
-                    print(e)
+                for topic in bourdieu_topics:
+                    # Topics whose convex hull could not be computed are not outlined
+                    if topic.convex_hull is None:
+                        continue
+                    # Create a Scatter plot with the convex hull coordinates
+                    trace = go.Scatter(
+                        x=topic.convex_hull.x_coordinates,
+                        y=topic.convex_hull.y_coordinates,  # Assuming y=0 for simplicity
+                        mode="lines",
+                        name="Convex Hull",
+                        line=dict(color="grey", dash="dot"),
+                        showlegend=False,
+                        hoverinfo="none",
+                    )
+
+                    fig.add_trace(trace)
 
         if self.display_percent:
             # Calculate the percentage for every box
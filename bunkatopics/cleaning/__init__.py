@@ -0,0 +1,6 @@
+from .deduplication import (
+    exact_duplicates,
+    find_duplicates,
+    minhash_signatures,
+    near_duplicates,
+)
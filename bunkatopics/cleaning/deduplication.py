@@ -0,0 +1,249 @@
+import hashlib
+import typing as t
+import zlib
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from bunkatopics.embeddings.cache import normalize_text
+
+# Smallest prime above 2**32: the MinHash permutations are (a * x + b) mod _PRIME
+_PRIME = np.uint64(4294967311)
+_MAX_HASH = np.uint32(np.iinfo(np.uint32).max)
+
+
+def _dedup_text(text: str) -> str:
+    return normalize_text(text).casefold()
+
+
+def exact_duplicates(texts: t.Sequence[str]) -> np.ndarray:
+    """
+    Groups the texts that are identical once normalized (unicode, case and whitespace).
+
+    Args:
+        texts (Sequence[str]): The texts.
+
+    Returns:
+        np.ndarray: For every text, the index of the first text of its group.
+    """
+    first: t.Dict[bytes, int] = {}
+    return np.fromiter(
+        (
+            first.setdefault(
+                hashlib.blake2b(
+                    _dedup_text(text).encode("utf-8"), digest_size=16
+                ).digest(),
+                i,
+            )
+            for i, text in enumerate(texts)
+        ),
+        dtype=np.int64,
+        count=len(texts),
+    )
+
+
+def _shingles(text: str, shingle_size: int) -> np.ndarray:
+    """Returns the distinct hashes of the word n-grams of a text."""
+    tokens = _dedup_text(text).split()
+    if len(tokens) <= shingle_size:
+        grams = [" ".join(tokens)] if tokens else []
+    else:
+        grams = [
+            " ".join(tokens[i : i + shingle_size])
+            for i in range(len(tokens) - shingle_size + 1)
+        ]
+    return np.unique(
+        np.fromiter(
+            (zlib.crc32(gram.encode("utf-8")) for gram in grams),
+            dtype=np.uint64,
+            count=len(grams),
+        )
+    )
+
+
+def minhash_signatures(
+    texts: t.Sequence[str],
+    num_perm: int = 128,
+    shingle_size: int = 3,
+    max_shingles_per_batch: int = 100_000,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Computes the MinHash signature of the word n-grams of every text.
+
+    The hashes of all the shingles of a batch of texts go through the `num_perm` permutations
+    at once, and the minimum of every text is taken with `np.minimum.reduceat`.
+
+    Args:
+        texts (Sequence[str]): The texts.
+        num_perm (int): The number of hash permutations. Default is 128.
+        shingle_size (int): The number of words per shingle. Default is 3.
+        max_shingles_per_batch (int): Bounds the (num_perm, n_shingles) matrix of a batch. Default is 100,000.
+        random_state (int): Seed of the permutations. Default is 42.
+
+    Returns:
+        np.ndarray: A (len(texts), num_perm) uint32 matrix. Texts without any word get the maximum
+        hash everywhere.
+    """
+    rng = np.random.default_rng(random_state)
+    # a * x + b stays below 2**64 for 32-bit shingle hashes
+    a = rng.integers(1, 2**31, size=(num_perm, 1), dtype=np.uint64)
+    b = rng.integers(0, 2**31, size=(num_perm, 1), dtype=np.uint64)
+
+    signatures = np.full((len(texts), num_perm), _MAX_HASH, dtype=np.uint32)
+    shingles = [_shingles(text, shingle_size) for text in texts]
+
+    def flush(rows: t.List[int]) -> None:
+        values = np.concatenate([shingles[row] for row in rows])
+        starts = np.cumsum([0] + [len(shingles[row]) for row in rows[:-1]])
+        hashed = ((a * values + b) % _PRIME).astype(np.uint32)
+        signatures[rows] = np.minimum.reduceat(hashed, starts, axis=1).T
+
+    batch, batch_size = [], 0
+    for row, values in enumerate(shingles):
+        if not len(values):
+            continue
+        if batch and batch_size + len(values) > max_shingles_per_batch:
+            flush(batch)
+            batch, batch_size = [], 0
+        batch.append(row)
+        batch_size += len(values)
+    if batch:
+        flush(batch)
+
+    return signatures
+
+
+def _lsh_parameters(num_perm: int, threshold: float) -> t.Tuple[int, int]:
+    """Returns the (bands, rows) whose S-curve threshold is the highest one below `threshold`."""
+    # Candidates are verified afterwards: favour recall over precision
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+def near_duplicates(
+    texts: t.Sequence[str],
+    threshold: float = 0.8,
+    num_perm: int = 128,
+    shingle_size: int = 3,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Groups the texts whose word n-grams have a Jaccard similarity of at least `threshold`.
+
+    The MinHash signatures are split in bands: texts sharing a band are candidates, kept when
+    their estimated Jaccard similarity reaches `threshold`. The groups are the connected
+    components of the kept pairs.
+
+    Args:
+        texts (Sequence[str]): The texts.
+        threshold (float): The minimum Jaccard similarity of two duplicates. Default is 0.8.
+        num_perm (int): The number of hash permutations. Default is 128.
+        shingle_size (int): The number of words per shingle. Default is 3.
+        random_state (int): Seed of the permutations. Default is 42.
+
+    Returns:
+        np.ndarray: For every text, the index of the first text of its group.
+    """
+    n_texts = len(texts)
+    if not n_texts:
+        return np.empty(0, dtype=np.int64)
+
+    signatures = minhash_signatures(
+        texts, num_perm=num_perm, shingle_size=shingle_size, random_state=random_state
+    )
+    bands, rows = _lsh_parameters(num_perm, threshold)
+
+    # Texts without words are never near-duplicates
+    candidates = np.flatnonzero((signatures != _MAX_HASH).any(axis=1))
+    weights = np.random.default_rng(random_state).integers(
+        1, 2**63, size=rows, dtype=np.uint64
+    )
+
+    pairs = []
+    for band in range(bands):
+        block = signatures[candidates, band * rows : (band + 1) * rows]
+        keys = (block.astype(np.uint64) * weights).sum(axis=1)
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        first = candidates[first[inverse]]
+        duplicated = first != candidates
+        pairs.append(np.stack([candidates[duplicated], first[duplicated]], axis=1))
+
+    pairs = np.unique(np.concatenate(pairs), axis=0)
+
+    # Estimated Jaccard similarity: the share of equal MinHash values
+    kept = np.zeros(len(pairs), dtype=bool)
+    for start in range(0, len(pairs), 10_000):
+        chunk = pairs[start : start + 10_000]
+        similarity = (signatures[chunk[:, 0]] == signatures[chunk[:, 1]]).mean(axis=1)
+        kept[start : start + 10_000] = similarity >= threshold
+    pairs = pairs[kept]
+
+    graph = sparse.csr_matrix(
+        (np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(n_texts, n_texts)
+    )
+    _, labels = connected_components(graph, directed=False)
+    first_of_label = np.full(labels.max() + 1, n_texts)
+    np.minimum.at(first_of_label, labels, np.arange(n_texts))
+    return first_of_label[labels]
+
+
+def find_duplicates(
+    texts: t.Sequence[str],
+    method: str = "near",
+    threshold: float = 0.8,
+    num_perm: int = 128,
+    shingle_size: int = 3,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Groups the duplicated texts of a corpus.
+
+    Exact duplicates are grouped by the hash of their normalized text. With `method="near"`,
+    one text of every exact group then goes through MinHash/LSH to group near-duplicates.
+
+    Args:
+        texts (Sequence[str]): The texts.
+        method (str): "exact" or "near". Default is "near".
+        threshold (float): The minimum Jaccard similarity of two near-duplicates. Default is 0.8.
+        num_perm (int): The number of MinHash permutations. Default is 128.
+        shingle_size (int): The number of words per shingle. Default is 3.
+        random_state (int): Seed of the MinHash permutations. Default is 42.
+
+    Returns:
+        np.ndarray: For every text, the index of its representative: the first text of its group.
+
+    Raises:
+        ValueError: If `method` is neither "exact" nor "near".
+
+    Examples:
+    ```python
+    from bunkatopics.cleaning import find_duplicates
+
+    representatives = find_duplicates(["A tweet", "RT a tweet", "Something else"], method="exact")
+    ```
+    """
+    if method not in ("exact", "near"):
+        raise ValueError(f"method must be 'exact' or 'near', got {method!r}")
+
+    representatives = exact_duplicates(texts)
+    if method == "exact":
+        return representatives
+
+    unique = np.flatnonzero(representatives == np.arange(len(texts)))
+    near = near_duplicates(
+        [texts[i] for i in unique],
+        threshold=threshold,
+        num_perm=num_perm,
+        shingle_size=shingle_size,
+        random_state=random_state,
+    )
+    # Map every text to its exact representative, then to the near representative of the latter
+    position = np.empty(len(texts), dtype=np.int64)
+    position[unique] = np.arange(len(unique))
+    return unique[near[position[representatives]]]
@@ -40,7 +40,9 @@ class Document(BaseModel):
     topic_id: t.Optional[TOPIC_ID] = None
     topic_ranking: t.Optional[TopicRanking] = None
     term_id: t.Optional[t.List[TERM_ID]] = None
-    embedding: t.Optional[t.List[float]] = Field(None, repr=False)
+    embedding_row: t.Optional[int] = Field(None, repr=False)
+    # Number of input documents collapsed into this one by the deduplication
+    multiplicity: int = 1
     bourdieu_dimensions: t.List[BourdieuDimension] = []
     metadata: t.Optional[t.Dict[str, t.Any]] = None
 
@@ -78,6 +80,10 @@ class Topic(BaseModel):
     top_doc_content: t.Optional[t.List[str]] = Field(None, repr=False)
     top_term_id: t.Optional[t.List[TERM_ID]] = None
     convex_hull: t.Optional[ConvexHullModel] = Field(None, repr=False)
+    # Links of the topics computed by Bunka.get_topics_hierarchy, the level being its number of topics
+    level: t.Optional[int] = None
+    parent_topic_id: t.Optional[TOPIC_ID] = None
+    children_topic_id: t.Optional[t.List[TOPIC_ID]] = Field(None, repr=False)
 
 
 class Term(BaseModel):
@@ -0,0 +1,5 @@
+from .backend import EmbeddingBackend, as_embedding_backend
+from .cache import EmbeddingCache, get_model_identity
+from .matrix import EmbeddingMatrix
+from .pipeline import embed_in_batches, iter_batches
+from .precomputed import read_embeddings_file, to_embedding_matrix
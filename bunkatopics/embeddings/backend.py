@@ -0,0 +1,150 @@
+import sys
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from bunkatopics.embeddings.cache import get_model_identity
+from bunkatopics.embeddings.pipeline import iter_batches
+
+
+def _is_instance(obj, module_name: str, class_name: str) -> bool:
+    # isinstance check that never imports `module_name`: if the module was not imported
+    # yet, `obj` cannot be an instance of one of its classes
+    module = sys.modules.get(module_name)
+    cls = getattr(module, class_name, None)
+    return isinstance(cls, type) and isinstance(obj, cls)
+
+
+class EmbeddingBackend:
+    """
+    Single entry point to every supported embedding model.
+
+    The backend hides the API of the wrapped model (SentenceTransformer, FlagModel,
+    langchain Embeddings or any object with an `encode` method) and always returns a
+    (n_texts, dim) float32 matrix. Identical texts are encoded once, the texts are sent
+    to the model in batches of `batch_size`, optionally from several threads, and the
+    embeddings are L2-normalized unless `normalize` is False.
+
+    Examples:
+    ```python
+    from bunkatopics import Bunka
+    from bunkatopics.embeddings import EmbeddingBackend
+
+    backend = EmbeddingBackend(embedding_model, batch_size=128, num_threads=4)
+    bunka = Bunka(embedding_model=backend)
+    ```
+    """
+
+    def __init__(
+        self,
+        model,
+        batch_size: int = 64,
+        num_threads: int = 1,
+        normalize: bool = True,
+    ) -> None:
+        """
+        Args:
+            model: The embedding model to wrap.
+            batch_size (int): The number of texts sent to the model at once. Default is 64.
+            num_threads (int): The number of batches encoded concurrently. Models releasing the
+                GIL (torch) or calling a remote API benefit from more than one thread. Default is 1.
+            normalize (bool): Whether to L2-normalize the embeddings. Default is True.
+        """
+        if batch_size < 1 or num_threads < 1:
+            raise ValueError("batch_size and num_threads must be positive")
+
+        self.model = model
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self.normalize = normalize
+
+    def __repr__(self) -> str:
+        return (
+            f"EmbeddingBackend(model={self.model_id!r}, batch_size={self.batch_size}, "
+            f"num_threads={self.num_threads}, normalize={self.normalize})"
+        )
+
+    @property
+    def model_id(self) -> str:
+        """Identity of the embeddings in the cache: normalized embeddings get their own entries."""
+        model_id = get_model_identity(self.model)
+        return f"{model_id}:normalized" if self.normalize else model_id
+
+    def encode(self, texts: t.Sequence[str], query: bool = False) -> np.ndarray:
+        """
+        Embeds a list of texts.
+
+        Args:
+            texts (Sequence[str]): The texts to embed.
+            query (bool): Whether the texts are search queries rather than documents. Models
+                with a dedicated query encoding (langchain Embeddings, FlagModel) use it.
+                Default is False.
+
+        Returns:
+            np.ndarray: A (len(texts), dim) float32 matrix.
+        """
+        # Encode every distinct text once and broadcast the result to its duplicates
+        positions: t.Dict[str, int] = {}
+        inverse = np.fromiter(
+            (positions.setdefault(str(text), len(positions)) for text in texts),
+            dtype=np.int64,
+            count=len(texts),
+        )
+        unique_texts = list(positions)
+        if not unique_texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        batches = list(iter_batches(unique_texts, self.batch_size))
+        if self.num_threads > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+                results = list(
+                    executor.map(
+                        lambda batch: self._encode_batch(batch, query), batches
+                    )
+                )
+        else:
+            results = [self._encode_batch(batch, query) for batch in batches]
+
+        embeddings = np.concatenate(results)
+        if self.normalize:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0  # zero vectors stay zero
+            embeddings /= norms
+
+        return embeddings[inverse]
+
+    def encode_query(self, query: str) -> np.ndarray:
+        """Embeds a single search query into a (dim,) float32 vector."""
+        return self.encode([query], query=True)[0]
+
+    def _encode_batch(self, texts: t.List[str], query: bool) -> np.ndarray:
+        model = self.model
+
+        if _is_instance(model, "sentence_transformers", "SentenceTransformer"):
+            embeddings = model.encode(
+                texts, batch_size=len(texts), show_progress_bar=False
+            )
+
+        elif _is_instance(model, "FlagEmbedding", "FlagModel"):
+            encode = model.encode_queries if query else model.encode
+            embeddings = encode(texts, batch_size=len(texts))
+
+        elif hasattr(model, "embed_documents"):
+            # langchain Embeddings
+            if query:
+                embeddings = [model.embed_query(text) for text in texts]
+            else:
+                embeddings = model.embed_documents(texts)
+
+        else:
+            embeddings = model.encode(texts)
+
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
+
+
+def as_embedding_backend(embedding_model) -> EmbeddingBackend:
+    """Wraps `embedding_model` in an EmbeddingBackend with the default settings, unless it is one already."""
+    if isinstance(embedding_model, EmbeddingBackend):
+        return embedding_model
+    return EmbeddingBackend(embedding_model)
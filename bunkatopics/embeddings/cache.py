@@ -0,0 +1,291 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import typing as t
+import unicodedata
+
+import numpy as np
+
+from bunkatopics.logging import logger
+
+# SQLite caps the number of bound parameters per statement (999 on old builds)
+_SQLITE_MAX_VARIABLES = 900
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize a text before hashing so that trivial variations share a cache entry.
+
+    Args:
+        text (str): The raw document text.
+
+    Returns:
+        str: The NFKC-normalized text with collapsed and stripped whitespace.
+    """
+    text = unicodedata.normalize("NFKC", str(text))
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def get_model_identity(embedding_model) -> str:
+    """
+    Derive a stable identifier for an embedding model.
+
+    The identifier is part of every cache key, so that embeddings computed by
+    different models never collide.
+
+    Args:
+        embedding_model: A SentenceTransformer, a langchain Embeddings, a FlagModel or
+            any object exposing an `encode` method.
+
+    Returns:
+        str: The model name when it can be found, the class path otherwise.
+    """
+    for attribute in ("model_name", "model_name_or_path", "name_or_path"):
+        value = getattr(embedding_model, attribute, None)
+        if isinstance(value, str) and value:
+            return value
+
+    # SentenceTransformer: the first module wraps the transformers model
+    try:
+        name = embedding_model[0].auto_model.config._name_or_path
+        if isinstance(name, str) and name:
+            return name
+    except Exception:
+        pass
+
+    # FlagModel: the transformers model is stored on `.model`
+    config = getattr(getattr(embedding_model, "model", None), "config", None)
+    name = getattr(config, "_name_or_path", None)
+    if isinstance(name, str) and name:
+        return name
+
+    model_class = type(embedding_model)
+    return f"{model_class.__module__}.{model_class.__qualname__}"
+
+
+class EmbeddingCache:
+    """
+    A persistent, content-addressed cache of document embeddings.
+
+    Embeddings are stored in a SQLite database and keyed by a hash of the model identity
+    and the normalized document text. The cache is capped in number of entries and the
+    least recently used entries are evicted first. Several processes can share the same
+    cache directory: the cap applies to the entries written by all of them.
+
+    Examples:
+    ```python
+    from bunkatopics import Bunka
+    from bunkatopics.embeddings import EmbeddingCache
+
+    bunka = Bunka(embedding_cache=EmbeddingCache("bunka_cache", max_entries=2_000_000))
+    bunka.fit(docs)  # only documents never seen before are sent to the model
+    ```
+    """
+
+    def __init__(
+        self,
+        path: str = "bunka_embedding_cache",
+        max_entries: t.Optional[int] = 1_000_000,
+        model_id: t.Optional[str] = None,
+    ) -> None:
+        """
+        Opens (or creates) the cache stored in `path`.
+
+        Args:
+            path (str): Directory where the cache database is stored. Defaults to "bunka_embedding_cache".
+            max_entries (int, optional): Maximum number of embeddings kept on disk. The least recently
+                used entries are evicted beyond this size. None disables eviction. Defaults to 1,000,000.
+            model_id (str, optional): Overrides the model identity derived from the embedding model,
+                for instance to share a cache between two copies of the same model. Defaults to None.
+        """
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.model_id = model_id
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.path.join(path, "embeddings.sqlite"), check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # The schema is created in one write transaction, so that the processes sharing the
+        # cache never write rows the triggers below do not count
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    dim INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_used INTEGER NOT NULL
+                )"""
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)"
+            )
+            # The number of rows is kept in the database by triggers: every process reads the
+            # same count, without scanning the table on every write
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings_size (size INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                """INSERT INTO embeddings_size
+                SELECT COUNT(*) FROM embeddings WHERE NOT EXISTS (SELECT 1 FROM embeddings_size)"""
+            )
+            self._connection.execute(
+                """CREATE TRIGGER IF NOT EXISTS embeddings_insert AFTER INSERT ON embeddings
+                BEGIN UPDATE embeddings_size SET size = size + 1; END"""
+            )
+            self._connection.execute(
+                """CREATE TRIGGER IF NOT EXISTS embeddings_delete AFTER DELETE ON embeddings
+                BEGIN UPDATE embeddings_size SET size = size - 1; END"""
+            )
+            self._connection.commit()
+        except BaseException:
+            self._connection.rollback()
+            raise
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size()
+
+    def _size(self) -> int:
+        return self._connection.execute("SELECT size FROM embeddings_size").fetchone()[
+            0
+        ]
+
+    def make_key(self, model_id: str, text: str) -> str:
+        """Returns the cache key of `text` embedded by the model `model_id`."""
+        payload = (self.model_id or model_id) + "\x00" + normalize_text(text)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(
+        self, model_id: str, texts: t.Sequence[str]
+    ) -> t.List[t.Optional[np.ndarray]]:
+        """
+        Looks up the embeddings of `texts` and refreshes their position in the LRU order.
+
+        Args:
+            model_id (str): Identity of the embedding model.
+            texts (Sequence[str]): The texts to look up.
+
+        Returns:
+            List[Optional[np.ndarray]]: One float32 vector per text, None for cache misses.
+        """
+        keys = [self.make_key(model_id, text) for text in texts]
+        found: t.Dict[str, np.ndarray] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        now = time.time_ns()
+
+        with self._lock, self._connection:
+            for start in range(0, len(unique_keys), _SQLITE_MAX_VARIABLES):
+                chunk = unique_keys[start : start + _SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.float32)
+                hit_keys = [row[0] for row in rows]
+                if hit_keys:
+                    self._connection.execute(
+                        f"UPDATE embeddings SET last_used = ? WHERE key IN ({','.join('?' * len(hit_keys))})",
+                        [now] + hit_keys,
+                    )
+
+        return [found.get(key) for key in keys]
+
+    def put(
+        self, model_id: str, texts: t.Sequence[str], embeddings: np.ndarray
+    ) -> None:
+        """
+        Stores the embeddings of `texts` and evicts the least recently used entries if needed.
+
+        Args:
+            model_id (str): Identity of the embedding model.
+            texts (Sequence[str]): The embedded texts.
+            embeddings (np.ndarray): A (len(texts), dim) matrix of embeddings.
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        now = time.time_ns()
+        # The last embedding of a text repeated in the batch wins
+        rows = {
+            self.make_key(model_id, text): (
+                embedding.shape[0],
+                embedding.tobytes(),
+                now,
+            )
+            for text, embedding in zip(texts, embeddings)
+        }
+        with self._lock, self._connection:
+            # An upsert, unlike INSERT OR REPLACE, only fires the insert trigger for new keys
+            self._connection.executemany(
+                """INSERT INTO embeddings (key, dim, vector, last_used) VALUES (?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    dim = excluded.dim, vector = excluded.vector, last_used = excluded.last_used""",
+                [(key, *row) for key, row in rows.items()],
+            )
+
+            if self.max_entries is not None:
+                # Read in the write transaction: it includes the rows of the other processes
+                overflow = self._size() - self.max_entries
+                if overflow > 0:
+                    self._connection.execute(
+                        """DELETE FROM embeddings WHERE key IN (
+                            SELECT key FROM embeddings ORDER BY last_used ASC LIMIT ?
+                        )""",
+                        (overflow,),
+                    )
+                    logger.debug(f"Evicted {overflow} embeddings from the cache")
+
+    def get_or_compute(
+        self,
+        model_id: str,
+        texts: t.Sequence[str],
+        encode: t.Callable[[t.List[str]], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Returns the embeddings of `texts`, sending only the cache misses to `encode`.
+
+        Args:
+            model_id (str): Identity of the embedding model.
+            texts (Sequence[str]): The texts to embed.
+            encode (Callable): Function embedding a list of texts into a 2D array.
+
+        Returns:
+            np.ndarray: A (len(texts), dim) float32 matrix of embeddings.
+        """
+        cached = self.get(model_id, texts)
+        missing = [i for i, embedding in enumerate(cached) if embedding is None]
+        hits = len(texts) - len(missing)
+        self.hits += hits
+        self.misses += len(missing)
+        logger.debug(f"Embedding cache: {hits} hits, {len(missing)} misses")
+
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            computed = np.asarray(encode(missing_texts), dtype=np.float32)
+            self.put(model_id, missing_texts, computed)
+            for i, embedding in zip(missing, computed):
+                cached[i] = embedding
+
+        if not cached:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.vstack(cached)
+
+    def clear(self) -> None:
+        """Removes every embedding from the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM embeddings")
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        self._connection.close()
@@ -0,0 +1,166 @@
+import typing as t
+
+import numpy as np
+
+from bunkatopics.datamodel import DOC_ID, Document
+
+
+class EmbeddingMatrix:
+    """
+    Corpus-level store of document embeddings.
+
+    The embeddings are kept in one contiguous float32 matrix (possibly memory-mapped)
+    with a `doc_id -> row` index, instead of one list of Python floats per Document.
+    Documents reference their vector through `Document.embedding_row`.
+    """
+
+    def __init__(self, vectors: np.ndarray, doc_ids: t.Sequence[DOC_ID]) -> None:
+        """
+        Args:
+            vectors (np.ndarray): A (n_docs, dim) matrix of embeddings.
+            doc_ids (Sequence[DOC_ID]): The document id of every row of `vectors`.
+
+        Raises:
+            ValueError: If `vectors` and `doc_ids` do not have the same length.
+        """
+        if not isinstance(vectors, np.memmap):
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(doc_ids):
+            raise ValueError(
+                f"Expected a 2D matrix with {len(doc_ids)} rows, got shape {vectors.shape}"
+            )
+
+        self.vectors = vectors
+        self.doc_ids = list(doc_ids)
+        self.index: t.Dict[DOC_ID, int] = {}
+        for row, doc_id in enumerate(self.doc_ids):
+            # Like Bunka.fit, the first occurrence of a duplicated id wins
+            self.index.setdefault(doc_id, row)
+        self._norms = None
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def __contains__(self, doc_id: DOC_ID) -> bool:
+        return doc_id in self.index
+
+    def __repr__(self) -> str:
+        return f"EmbeddingMatrix(n_docs={len(self)}, dim={self.dim})"
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """The L2 norm of every row, computed once."""
+        if self._norms is None:
+            self._norms = np.linalg.norm(self.vectors, axis=1)
+        return self._norms
+
+    def rows(self, doc_ids: t.Iterable[DOC_ID]) -> np.ndarray:
+        """Returns the row of each document id."""
+        return np.fromiter((self.index[doc_id] for doc_id in doc_ids), dtype=np.int64)
+
+    def rows_of(self, docs: t.Sequence[Document]) -> np.ndarray:
+        """Returns the row of each Document, using `embedding_row` when it is set."""
+        return np.fromiter(
+            (
+                doc.embedding_row
+                if doc.embedding_row is not None
+                else self.index[doc.doc_id]
+                for doc in docs
+            ),
+            dtype=np.int64,
+            count=len(docs),
+        )
+
+    def vectors_of(self, docs: t.Sequence[Document]) -> np.ndarray:
+        """Returns the embeddings of Documents, without copying the matrix when they follow its rows."""
+        rows = self.rows_of(docs)
+        if len(rows) == len(self) and np.array_equal(rows, np.arange(len(self))):
+            return self.vectors
+        return self.vectors[rows]
+
+    def take(self, doc_ids: t.Iterable[DOC_ID]) -> np.ndarray:
+        """Returns the embeddings of the given document ids as a new matrix."""
+        return self.vectors[self.rows(doc_ids)]
+
+    def append(
+        self, vectors: np.ndarray, doc_ids: t.Sequence[DOC_ID]
+    ) -> "EmbeddingMatrix":
+        """
+        Returns a new matrix with the rows of `vectors` added after the stored ones.
+
+        Args:
+            vectors (np.ndarray): A (n_new_docs, dim) matrix of embeddings.
+            doc_ids (Sequence[DOC_ID]): The document id of every row of `vectors`.
+
+        Returns:
+            EmbeddingMatrix: The extended matrix, held in memory.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if len(vectors) and vectors.shape[1:] != (self.dim,):
+            raise ValueError(
+                f"Expected embeddings of dimension {self.dim}, got shape {vectors.shape}"
+            )
+        return EmbeddingMatrix(
+            np.concatenate([self.vectors, vectors.reshape(-1, self.dim)]),
+            self.doc_ids + list(doc_ids),
+        )
+
+    def align(
+        self, doc_ids: t.Sequence[DOC_ID]
+    ) -> t.Tuple["EmbeddingMatrix", t.List[DOC_ID], t.List[DOC_ID]]:
+        """
+        Reorders the matrix to follow `doc_ids`, through the hash index.
+
+        Args:
+            doc_ids (Sequence[DOC_ID]): The document ids the rows should follow.
+
+        Returns:
+            Tuple[EmbeddingMatrix, List[DOC_ID], List[DOC_ID]]: The aligned matrix (None if some
+            ids are missing), the ids without an embedding and the embedded ids not in `doc_ids`.
+        """
+        rows = np.fromiter(
+            (self.index.get(doc_id, -1) for doc_id in doc_ids),
+            dtype=np.int64,
+            count=len(doc_ids),
+        )
+        missing = [doc_id for doc_id, row in zip(doc_ids, rows) if row < 0]
+
+        used = np.zeros(len(self), dtype=bool)
+        used[rows[rows >= 0]] = True
+        extra = [self.doc_ids[row] for row in np.flatnonzero(~used)]
+
+        if missing:
+            return None, missing, extra
+
+        if len(rows) == len(self) and np.array_equal(rows, np.arange(len(self))):
+            # Already aligned: keep the (possibly memory-mapped) matrix as it is
+            return EmbeddingMatrix(self.vectors, doc_ids), missing, extra
+
+        return EmbeddingMatrix(self.vectors[rows], doc_ids), missing, extra
+
+    def cosine_similarity(
+        self, query: np.ndarray, rows: t.Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Computes the cosine similarity between the stored embeddings and one or more queries.
+
+        Args:
+            query (np.ndarray): A (dim,) vector or a (n_queries, dim) matrix.
+            rows (np.ndarray, optional): Restricts the computation to these rows. Default is None.
+
+        Returns:
+            np.ndarray: A (n_rows,) vector for a single query, a (n_rows, n_queries) matrix otherwise.
+        """
+        query = np.asarray(query, dtype=np.float32)
+        query_norms = np.linalg.norm(query, axis=-1)
+        vectors = self.vectors if rows is None else self.vectors[rows]
+        norms = self.norms if rows is None else self.norms[rows]
+
+        similarities = vectors @ query.T
+        denominator = np.multiply.outer(norms, query_norms)
+        denominator[denominator == 0] = 1.0  # zero vectors have a similarity of 0
+        return similarities / denominator
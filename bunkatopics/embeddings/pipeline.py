@@ -0,0 +1,81 @@
+import typing as t
+
+import numpy as np
+from tqdm import tqdm
+
+
+def iter_batches(
+    sentences: t.Iterable[str], batch_size: int
+) -> t.Iterator[t.List[str]]:
+    """
+    Yields consecutive batches of at most `batch_size` sentences.
+
+    Args:
+        sentences (Iterable[str]): Any iterable of sentences, including a generator.
+        batch_size (int): The number of sentences per batch.
+    """
+    batch = []
+    for sentence in sentences:
+        batch.append(sentence)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def embed_in_batches(
+    sentences: t.Iterable[str],
+    n_sentences: int,
+    encode: t.Callable[[t.List[str]], np.ndarray],
+    batch_size: int = 1024,
+    memmap_path: t.Optional[str] = None,
+) -> np.ndarray:
+    """
+    Embeds sentences batch by batch into a single preallocated float32 matrix.
+
+    Only one batch of embeddings is held outside the output matrix at any time, so the
+    peak memory is about the size of the matrix itself. With `memmap_path`, the matrix
+    is a `.npy` file mapped in memory and can be larger than the available RAM.
+
+    Args:
+        sentences (Iterable[str]): The sentences to embed, possibly a generator.
+        n_sentences (int): The number of sentences yielded by `sentences`.
+        encode (Callable): Function embedding a list of sentences into a 2D array.
+        batch_size (int): The number of sentences sent to `encode` at once. Default is 1024.
+        memmap_path (str, optional): Path of a `.npy` file backing the matrix. Default is None.
+
+    Returns:
+        np.ndarray: A (n_sentences, dim) float32 matrix, or a `np.memmap` if `memmap_path` is set.
+    """
+    embeddings = None
+    start = 0
+
+    n_batches = -(-n_sentences // batch_size)
+    for batch in tqdm(iter_batches(sentences, batch_size), total=n_batches):
+        batch_embeddings = np.asarray(encode(batch), dtype=np.float32)
+
+        if embeddings is None:
+            # The dimension is only known once the first batch is embedded
+            shape = (n_sentences, batch_embeddings.shape[1])
+            if memmap_path is not None:
+                embeddings = np.lib.format.open_memmap(
+                    memmap_path, mode="w+", dtype=np.float32, shape=shape
+                )
+            else:
+                embeddings = np.empty(shape, dtype=np.float32)
+
+        end = start + len(batch_embeddings)
+        embeddings[start:end] = batch_embeddings
+        start = end
+
+    if embeddings is None:
+        return np.empty((0, 0), dtype=np.float32)
+
+    if start != n_sentences:
+        raise ValueError(f"Expected {n_sentences} sentences, received {start}")
+
+    if isinstance(embeddings, np.memmap):
+        embeddings.flush()
+
+    return embeddings
@@ -0,0 +1,105 @@
+import os
+import typing as t
+
+import numpy as np
+
+from bunkatopics.datamodel import DOC_ID
+from bunkatopics.embeddings.matrix import EmbeddingMatrix
+
+PreComputedEmbeddings = t.Union[
+    str,
+    os.PathLike,
+    np.ndarray,
+    EmbeddingMatrix,
+    t.List[t.Dict[str, t.Any]],
+]
+
+
+def read_embeddings_file(
+    path: t.Union[str, os.PathLike]
+) -> t.Union[np.ndarray, EmbeddingMatrix]:
+    """
+    Reads pre-computed embeddings from disk.
+
+    Supported formats:
+        - `.npy`: a (n_docs, dim) matrix whose rows follow the order of the documents.
+          It is memory-mapped rather than read.
+        - `.npz`: a `doc_id` array and an `embedding` matrix.
+        - `.parquet`: a `doc_id` column and either an `embedding` list column or one
+          numeric column per dimension.
+
+    Args:
+        path (str): The file to read.
+
+    Returns:
+        Union[np.ndarray, EmbeddingMatrix]: A matrix for `.npy` files, an EmbeddingMatrix
+        indexed by doc_id otherwise.
+    """
+    path = os.fspath(path)
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".npy":
+        return np.load(path, mmap_mode="r")
+
+    if extension == ".npz":
+        with np.load(path, allow_pickle=False) as data:
+            doc_ids = [str(x) for x in data["doc_id"]]
+            return EmbeddingMatrix(data["embedding"], doc_ids)
+
+    if extension == ".parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        doc_ids = [str(x) for x in table.column("doc_id").to_pylist()]
+        if "embedding" in table.column_names:
+            column = table.column("embedding").combine_chunks()
+            vectors = column.flatten().to_numpy(zero_copy_only=False)
+            vectors = vectors.reshape(len(doc_ids), -1)
+        else:
+            table = table.drop(["doc_id"])
+            vectors = np.column_stack(
+                [column.to_numpy() for column in table.itercolumns()]
+            )
+        return EmbeddingMatrix(vectors, doc_ids)
+
+    raise ValueError(
+        f"Unsupported embeddings file '{path}', expected a .npy, .npz or .parquet file"
+    )
+
+
+def to_embedding_matrix(
+    pre_computed_embeddings: PreComputedEmbeddings,
+    input_doc_ids: t.Sequence[DOC_ID],
+) -> EmbeddingMatrix:
+    """
+    Converts any supported form of pre-computed embeddings into an EmbeddingMatrix.
+
+    Args:
+        pre_computed_embeddings: A file path (see `read_embeddings_file`), an EmbeddingMatrix,
+            a list of {"doc_id", "embedding"} records, or a (n_docs, dim) array whose rows
+            follow the order of the input documents.
+        input_doc_ids (Sequence[DOC_ID]): The id of every input document, in input order.
+            Used to index matrices without ids.
+
+    Returns:
+        EmbeddingMatrix: The embeddings indexed by doc_id, not yet aligned with the documents.
+    """
+    if isinstance(pre_computed_embeddings, (str, os.PathLike)):
+        pre_computed_embeddings = read_embeddings_file(pre_computed_embeddings)
+
+    if isinstance(pre_computed_embeddings, EmbeddingMatrix):
+        return pre_computed_embeddings
+
+    if isinstance(pre_computed_embeddings, np.ndarray):
+        if len(pre_computed_embeddings) != len(input_doc_ids):
+            raise ValueError(
+                f"The pre-computed embeddings have {len(pre_computed_embeddings)} rows "
+                f"for {len(input_doc_ids)} documents"
+            )
+        return EmbeddingMatrix(pre_computed_embeddings, input_doc_ids)
+
+    doc_ids = [str(x["doc_id"]) for x in pre_computed_embeddings]
+    vectors = np.asarray(
+        [x["embedding"] for x in pre_computed_embeddings], dtype=np.float32
+    )
+    return EmbeddingMatrix(vectors, doc_ids)
@@ -0,0 +1,8 @@
+from .benchmark import benchmark_projections
+from .models import PCAUMAP, LandmarkUMAP, RandomProjectionTSNE, stratified_landmarks
+from .registry import (
+    PROJECTION_BACKENDS,
+    get_projection_model,
+    list_projection_backends,
+    register_projection,
+)
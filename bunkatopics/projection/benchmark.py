@@ -0,0 +1,71 @@
+import time
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from bunkatopics.logging import logger
+from bunkatopics.projection.registry import (
+    get_projection_model,
+    list_projection_backends,
+)
+
+
+def benchmark_projections(
+    embeddings: np.ndarray,
+    backends: t.Optional[t.List[str]] = None,
+    sample_size: t.Optional[int] = 5000,
+    n_neighbors: int = 10,
+    random_state: int = 42,
+) -> pd.DataFrame:
+    """
+    Compares the projection backends on the same embeddings.
+
+    Every backend is fitted on the same sample and scored with the trustworthiness of the
+    2D map, i.e. how well the nearest neighbors of each 2D point were neighbors in the
+    embedding space (1 is a perfect preservation).
+
+    Args:
+        embeddings (np.ndarray): A (n_docs, dim) matrix of embeddings.
+        backends (List[str], optional): The backends to compare. Default is all registered backends.
+        sample_size (int, optional): The number of documents sampled for the benchmark, as the
+            trustworthiness is quadratic in the number of documents. None uses all documents.
+            Default is 5000.
+        n_neighbors (int): The number of neighbors considered by the trustworthiness. Default is 10.
+        random_state (int): The random seed of the sample. Default is 42.
+
+    Returns:
+        pd.DataFrame: The backend, fit time in seconds and trustworthiness, best first.
+    """
+    from sklearn.manifold import trustworthiness
+
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if sample_size is not None and len(embeddings) > sample_size:
+        rng = np.random.default_rng(random_state)
+        embeddings = embeddings[
+            np.sort(rng.choice(len(embeddings), sample_size, replace=False))
+        ]
+
+    results = []
+    for backend in backends or list_projection_backends():
+        try:
+            projection_model = get_projection_model(backend)
+            start_time = time.perf_counter()
+            embeddings_2D = projection_model.fit_transform(embeddings)
+            fit_time = time.perf_counter() - start_time
+        except ImportError as e:
+            logger.warning(f"Skipping the projection backend {backend}: {e}")
+            continue
+
+        score = trustworthiness(embeddings, embeddings_2D, n_neighbors=n_neighbors)
+        logger.info(f"{backend}: {fit_time:.1f}s, trustworthiness {score:.3f}")
+        results.append(
+            {"backend": backend, "fit_time": fit_time, "trustworthiness": score}
+        )
+
+    df_results = pd.DataFrame(
+        results, columns=["backend", "fit_time", "trustworthiness"]
+    )
+    return df_results.sort_values("trustworthiness", ascending=False).reset_index(
+        drop=True
+    )
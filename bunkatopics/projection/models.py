@@ -0,0 +1,268 @@
+import typing as t
+
+import numpy as np
+
+
+def _make_umap(**kwargs):
+    import umap
+
+    params = {"n_components": 2, "random_state": 42}
+    params.update(kwargs)
+    return umap.UMAP(**params)
+
+
+class PCAUMAP:
+    """
+    UMAP fitted on the embeddings reduced by a PCA.
+
+    Reducing e.g. 384 dimensions to 50 first makes the nearest-neighbor search of UMAP
+    much cheaper while keeping most of the variance.
+    """
+
+    def __init__(self, n_pca_components: int = 50, **umap_kwargs) -> None:
+        """
+        Args:
+            n_pca_components (int): The number of dimensions kept by the PCA. Default is 50.
+            **umap_kwargs: Parameters of the UMAP model.
+        """
+        self.n_pca_components = n_pca_components
+        self.umap_kwargs = umap_kwargs
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        from sklearn.decomposition import PCA
+
+        n_components = min(self.n_pca_components, X.shape[0], X.shape[1])
+        self.pca_ = PCA(n_components=n_components, random_state=42)
+        self.umap_ = _make_umap(**self.umap_kwargs)
+        return self.umap_.fit_transform(self.pca_.fit_transform(X))
+
+    def fit(self, X: np.ndarray) -> "PCAUMAP":
+        self.fit_transform(X)
+        return self
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        return self.umap_.transform(self.pca_.transform(X))
+
+
+class RandomProjectionTSNE:
+    """
+    t-SNE with FFT-accelerated gradients (openTSNE) on randomly projected embeddings.
+
+    The Gaussian random projection cheaply reduces the dimension before the neighbor
+    search. openTSNE is an optional dependency: `pip install bunkatopics[tsne]`.
+    """
+
+    def __init__(
+        self,
+        n_projection_components: int = 50,
+        perplexity: float = 30,
+        n_jobs: int = -1,
+        random_state: int = 42,
+    ) -> None:
+        """
+        Args:
+            n_projection_components (int): The number of dimensions of the random projection. Default is 50.
+            perplexity (float): The perplexity of t-SNE. Default is 30.
+            n_jobs (int): The number of threads used by openTSNE. Default is -1 (all cores).
+            random_state (int): The random seed. Default is 42.
+        """
+        self.n_projection_components = n_projection_components
+        self.perplexity = perplexity
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        try:
+            from openTSNE import TSNE
+        except ImportError as e:
+            raise ImportError(
+                "The tsne projection needs openTSNE: pip install bunkatopics[tsne]"
+            ) from e
+        from sklearn.random_projection import GaussianRandomProjection
+
+        self.random_projection_ = GaussianRandomProjection(
+            n_components=min(self.n_projection_components, X.shape[1]),
+            random_state=self.random_state,
+        )
+        X_projected = self.random_projection_.fit_transform(X)
+
+        # openTSNE needs at least 3 neighbors per perplexity unit
+        perplexity = min(self.perplexity, max((len(X) - 1) / 3, 1))
+        self.tsne_ = TSNE(
+            n_components=2,
+            perplexity=perplexity,
+            negative_gradient_method="fft",
+            n_jobs=self.n_jobs,
+            random_state=self.random_state,
+        ).fit(X_projected)
+        return np.asarray(self.tsne_)
+
+    def fit(self, X: np.ndarray) -> "RandomProjectionTSNE":
+        self.fit_transform(X)
+        return self
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        return np.asarray(self.tsne_.transform(self.random_projection_.transform(X)))
+
+
+def stratified_landmarks(
+    X: np.ndarray,
+    n_landmarks: int,
+    n_strata: int = 100,
+    seeding_sample_size: int = 10_000,
+    batch_size: int = 10_000,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Picks landmark documents covering every region of the embedding space.
+
+    Strata centers are chosen by k-means++ seeding on a subsample of the embeddings, every
+    document joins the stratum of its nearest center and the landmarks are sampled in each
+    stratum proportionally to its size, with at least one landmark per stratum. Small but
+    distinct groups of documents are thus represented on the map.
+
+    Args:
+        X (np.ndarray): A (n_docs, dim) matrix of embeddings, possibly memory-mapped.
+        n_landmarks (int): The number of landmarks.
+        n_strata (int): The number of strata. Default is 100.
+        seeding_sample_size (int): The number of documents the strata centers are picked from. Default is 10,000.
+        batch_size (int): The number of documents assigned to strata at once. Default is 10,000.
+        random_state (int): The random seed. Default is 42.
+
+    Returns:
+        np.ndarray: The sorted row indices of the landmarks.
+    """
+    from sklearn.cluster import kmeans_plusplus
+
+    n_docs = len(X)
+    if n_landmarks >= n_docs:
+        return np.arange(n_docs)
+
+    rng = np.random.default_rng(random_state)
+    seeding_rows = np.sort(
+        rng.choice(n_docs, min(seeding_sample_size, n_docs), replace=False)
+    )
+    centers, _ = kmeans_plusplus(
+        np.asarray(X[seeding_rows], dtype=np.float32),
+        n_clusters=min(n_strata, len(seeding_rows)),
+        random_state=random_state,
+    )
+
+    # Nearest center of every document, chunk by chunk to bound the memory
+    strata = np.empty(n_docs, dtype=np.int64)
+    center_norms = (centers**2).sum(axis=1)
+    for start in range(0, n_docs, batch_size):
+        chunk = np.asarray(X[start : start + batch_size], dtype=np.float32)
+        strata[start : start + batch_size] = (
+            center_norms - 2 * chunk @ centers.T
+        ).argmin(axis=1)
+
+    # Proportional allocation with the largest remainders, one landmark at least
+    sizes = np.bincount(strata, minlength=len(centers))
+    shares = sizes * n_landmarks / n_docs
+    quotas = np.floor(shares).astype(np.int64)
+    remainder = n_landmarks - quotas.sum()
+    quotas[np.argsort(quotas - shares)[:remainder]] += 1
+    quotas = np.minimum(np.maximum(quotas, sizes > 0), sizes)
+
+    members = np.split(np.argsort(strata, kind="stable"), np.cumsum(sizes)[:-1])
+    landmarks = [
+        rng.choice(stratum_members, quota, replace=False)
+        for stratum_members, quota in zip(members, quotas)
+        if quota > 0
+    ]
+    return np.sort(np.concatenate(landmarks))
+
+
+class LandmarkUMAP:
+    """
+    UMAP fitted on a stratified sample of landmark documents, the others being placed with `transform`.
+
+    The memory and time of the fit are bounded by the number of landmarks, and the other
+    documents are transformed by chunks in parallel, so the total time grows almost
+    linearly with the number of documents.
+    """
+
+    def __init__(
+        self,
+        n_landmarks: int = 50_000,
+        n_strata: int = 100,
+        batch_size: int = 10_000,
+        n_jobs: int = -1,
+        random_state: int = 42,
+        **umap_kwargs,
+    ) -> None:
+        """
+        Args:
+            n_landmarks (int): The number of documents the UMAP model is fitted on. Default is 50,000.
+            n_strata (int): The number of strata the landmarks are sampled from, see `stratified_landmarks`.
+                Default is 100.
+            batch_size (int): The number of documents transformed at once. Default is 10,000.
+            n_jobs (int): The number of chunks transformed in parallel. Default is -1 (all cores).
+            random_state (int): The random seed. Default is 42.
+            **umap_kwargs: Parameters of the UMAP model.
+        """
+        self.n_landmarks = n_landmarks
+        self.n_strata = n_strata
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.umap_kwargs = umap_kwargs
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        self.umap_ = _make_umap(random_state=self.random_state, **self.umap_kwargs)
+        if len(X) <= self.n_landmarks:
+            self.landmarks_ = np.arange(len(X))
+            return self.umap_.fit_transform(X)
+
+        self.landmarks_ = stratified_landmarks(
+            X,
+            self.n_landmarks,
+            n_strata=self.n_strata,
+            batch_size=self.batch_size,
+            random_state=self.random_state,
+        )
+        self.umap_.fit(np.asarray(X[self.landmarks_], dtype=np.float32))
+
+        others = np.ones(len(X), dtype=bool)
+        others[self.landmarks_] = False
+
+        embeddings_2D = np.empty((len(X), 2), dtype=np.float32)
+        embeddings_2D[self.landmarks_] = self.umap_.embedding_
+        self._transform_rows(X, np.flatnonzero(others), embeddings_2D)
+        return embeddings_2D
+
+    def fit(self, X: np.ndarray) -> "LandmarkUMAP":
+        self.fit_transform(X)
+        return self
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        embeddings_2D = np.empty((len(X), 2), dtype=np.float32)
+        self._transform_rows(X, np.arange(len(X)), embeddings_2D)
+        return embeddings_2D
+
+    def _transform_rows(
+        self, X: np.ndarray, rows: np.ndarray, embeddings_2D: np.ndarray
+    ) -> None:
+        """Transforms the given rows of X by chunks in parallel threads, into `embeddings_2D`."""
+        from joblib import Parallel, delayed
+
+        def transform_chunk(chunk_rows: np.ndarray) -> None:
+            # Only one chunk of embeddings is copied in memory per thread
+            embeddings_2D[chunk_rows] = self.umap_.transform(
+                np.asarray(X[chunk_rows], dtype=np.float32)
+            )
+
+        chunks = [
+            rows[start : start + self.batch_size]
+            for start in range(0, len(rows), self.batch_size)
+        ]
+        if not chunks:
+            return
+
+        # The first transform builds the search index of UMAP and compiles its numba
+        # functions: it runs alone, so that the threads share the initialized model
+        transform_chunk(chunks[0])
+        Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(transform_chunk)(chunk_rows) for chunk_rows in chunks[1:]
+        )
@@ -0,0 +1,89 @@
+import typing as t
+
+from bunkatopics.projection.models import (
+    PCAUMAP,
+    LandmarkUMAP,
+    RandomProjectionTSNE,
+    _make_umap,
+)
+
+# Factories of the projection models, by name
+PROJECTION_BACKENDS: t.Dict[str, t.Callable[..., t.Any]] = {}
+
+
+def register_projection(name: str) -> t.Callable:
+    """
+    Registers a projection model factory under `name`.
+
+    The factory takes keyword arguments and returns an object with `fit_transform` and,
+    to place new documents on the map, `transform` methods.
+
+    Examples:
+    ```python
+    from sklearn.decomposition import PCA
+    from bunkatopics.projection import register_projection
+
+    @register_projection("pca")
+    def make_pca(**kwargs):
+        return PCA(n_components=2, **kwargs)
+
+    bunka = Bunka(projection_model="pca")
+    ```
+    """
+
+    def decorator(factory: t.Callable[..., t.Any]) -> t.Callable[..., t.Any]:
+        PROJECTION_BACKENDS[name] = factory
+        return factory
+
+    return decorator
+
+
+def get_projection_model(name: str, **kwargs):
+    """
+    Creates the projection model registered under `name`.
+
+    Args:
+        name (str): The name of the backend, see `list_projection_backends`.
+        **kwargs: Parameters passed to the factory of the backend.
+
+    Raises:
+        ValueError: If no backend is registered under `name`.
+    """
+    if name not in PROJECTION_BACKENDS:
+        raise ValueError(
+            f"Unknown projection backend {name!r}, available backends: {list_projection_backends()}"
+        )
+    return PROJECTION_BACKENDS[name](**kwargs)
+
+
+def list_projection_backends() -> t.List[str]:
+    """Returns the names of the registered projection backends."""
+    return list(PROJECTION_BACKENDS)
+
+
+@register_projection("umap")
+def make_umap(**kwargs):
+    return _make_umap(**kwargs)
+
+
+@register_projection("pca_umap")
+def make_pca_umap(n_pca_components: int = 50, **kwargs):
+    return PCAUMAP(n_pca_components=n_pca_components, **kwargs)
+
+
+@register_projection("draft_umap")
+def make_draft_umap(**kwargs):
+    # Few optimization epochs and neighbors: a rough map, several times faster
+    params = {"n_epochs": 50, "n_neighbors": 10, "low_memory": True}
+    params.update(kwargs)
+    return _make_umap(**params)
+
+
+@register_projection("tsne")
+def make_tsne(**kwargs):
+    return RandomProjectionTSNE(**kwargs)
+
+
+@register_projection("landmark_umap")
+def make_landmark_umap(**kwargs):
+    return LandmarkUMAP(**kwargs)
@@ -0,0 +1,369 @@
+import json
+import os
+import typing as t
+
+import numpy as np
+
+from bunkatopics.datamodel import (
+    BourdieuDimension,
+    ConvexHullModel,
+    Document,
+    Term,
+    Topic,
+    TopicRanking,
+)
+from bunkatopics.embeddings import EmbeddingMatrix
+from bunkatopics.logging import logger
+from bunkatopics.topic_modeling.doc_term_matrix import DocTermMatrix
+
+DOCS_FILE = "bunka_docs.parquet"
+COORDINATES_FILE = "bunka_coordinates.npy"
+TERMS_FILE = "bunka_terms.parquet"
+TOPICS_FILE = "bunka_topics.parquet"
+EMBEDDINGS_FILE = "bunka_embeddings.npy"
+EMBEDDING_IDS_FILE = "bunka_embeddings_ids.parquet"
+PROJECTION_MODEL_FILE = "bunka_projection_model.joblib"
+CLUSTERING_MODEL_FILE = "bunka_clustering_model.joblib"
+DOC_TERM_MATRIX_FILE = "bunka_doc_term_matrix.npz"
+DOC_TERM_ROWS_FILE = "bunka_doc_term_rows.parquet"
+VOCABULARY_FILE = "bunka_vocabulary.parquet"
+SETTINGS_FILE = "bunka_settings.json"
+
+# Bumped when the layout of a dump changes
+FORMAT_VERSION = 1
+
+
+def is_columnar_dump(path: str) -> bool:
+    """Whether `path` holds a model saved in the columnar format."""
+    return os.path.exists(os.path.join(path, DOCS_FILE))
+
+
+def _to_json(value) -> t.Optional[str]:
+    return json.dumps(value, default=str) if value else None
+
+
+def write_documents(docs: t.Sequence[Document], path: str) -> None:
+    """
+    Writes the documents to a Parquet file, and their 2D coordinates to a `.npy` matrix.
+
+    Args:
+        docs (Sequence[Document]): The documents.
+        path (str): The directory of the dump.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table(
+        {
+            "doc_id": pa.array([doc.doc_id for doc in docs], pa.string()),
+            "content": pa.array([doc.content for doc in docs], pa.string()),
+            "size": pa.array([doc.size for doc in docs], pa.float64()),
+            "topic_id": pa.array([doc.topic_id for doc in docs], pa.string()),
+            "ranking_topic_id": pa.array(
+                [
+                    doc.topic_ranking.topic_id if doc.topic_ranking else None
+                    for doc in docs
+                ],
+                pa.string(),
+            ),
+            "ranking_rank": pa.array(
+                [doc.topic_ranking.rank if doc.topic_ranking else None for doc in docs],
+                pa.int64(),
+            ),
+            "term_id": pa.array([doc.term_id for doc in docs], pa.list_(pa.string())),
+            "embedding_row": pa.array([doc.embedding_row for doc in docs], pa.int64()),
+            "multiplicity": pa.array([doc.multiplicity for doc in docs], pa.int64()),
+            "bourdieu_dimensions": pa.array(
+                [
+                    _to_json([x.model_dump() for x in doc.bourdieu_dimensions])
+                    for doc in docs
+                ],
+                pa.string(),
+            ),
+            "metadata": pa.array([_to_json(doc.metadata) for doc in docs], pa.string()),
+        }
+    )
+    pq.write_table(table, os.path.join(path, DOCS_FILE))
+
+    coordinates = np.array([[doc.x, doc.y] for doc in docs], dtype=np.float64).reshape(
+        -1, 2
+    )
+    np.save(os.path.join(path, COORDINATES_FILE), coordinates)
+
+
+def _iter_coordinates(
+    coordinates: np.ndarray, chunk_size: int = 100_000
+) -> t.Iterator[t.Tuple[t.Optional[float], t.Optional[float]]]:
+    """Yields the (x, y) of every document, reading the matrix by chunks."""
+    for start in range(0, len(coordinates), chunk_size):
+        for x, y in coordinates[start : start + chunk_size].tolist():
+            # Missing coordinates are stored as NaN
+            yield (None if x != x else x), (None if y != y else y)
+
+
+def read_documents(path: str, mmap: bool = True) -> t.List[Document]:
+    """
+    Reads the documents written by `write_documents`.
+
+    The Documents are built without running the pydantic validation again. They are Python
+    objects, so their fields end up in memory whatever `mmap`: only the embeddings matrix
+    (see `read_embeddings`) stays memory-mapped.
+
+    Args:
+        path (str): The directory of the dump.
+        mmap (bool): Whether to memory-map the files while they are read. Default is True.
+
+    Returns:
+        List[Document]: The documents.
+    """
+    import pyarrow.parquet as pq
+
+    columns = pq.read_table(os.path.join(path, DOCS_FILE), memory_map=mmap).to_pydict()
+    coordinates = np.load(
+        os.path.join(path, COORDINATES_FILE), mmap_mode="r" if mmap else None
+    )
+
+    docs = []
+    for i, (doc_id, (x, y)) in enumerate(
+        zip(columns["doc_id"], _iter_coordinates(coordinates))
+    ):
+        ranking_topic_id = columns["ranking_topic_id"][i]
+        bourdieu_dimensions = columns["bourdieu_dimensions"][i]
+        metadata = columns["metadata"][i]
+        docs.append(
+            Document.model_construct(
+                doc_id=doc_id,
+                content=columns["content"][i],
+                size=columns["size"][i],
+                x=x,
+                y=y,
+                topic_id=columns["topic_id"][i],
+                topic_ranking=(
+                    TopicRanking.model_construct(
+                        topic_id=ranking_topic_id, rank=columns["ranking_rank"][i]
+                    )
+                    if ranking_topic_id is not None
+                    else None
+                ),
+                term_id=columns["term_id"][i],
+                embedding_row=columns["embedding_row"][i],
+                multiplicity=columns["multiplicity"][i],
+                bourdieu_dimensions=(
+                    [BourdieuDimension(**x) for x in json.loads(bourdieu_dimensions)]
+                    if bourdieu_dimensions
+                    else []
+                ),
+                metadata=json.loads(metadata) if metadata else None,
+            )
+        )
+    return docs
+
+
+def write_terms(terms: t.Sequence[Term], path: str) -> None:
+    """Writes the terms to a Parquet file, one column per field."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table(
+        {name: [getattr(term, name) for term in terms] for name in Term.model_fields}
+    )
+    pq.write_table(table, os.path.join(path, TERMS_FILE))
+
+
+def read_terms(path: str, mmap: bool = True) -> t.List[Term]:
+    """Reads the terms written by `write_terms`."""
+    import pyarrow.parquet as pq
+
+    columns = pq.read_table(os.path.join(path, TERMS_FILE), memory_map=mmap).to_pydict()
+    names = list(columns)
+    return [
+        Term.model_construct(**dict(zip(names, values)))
+        for values in zip(*columns.values())
+    ]
+
+
+def write_topics(topics: t.Sequence[Topic], path: str) -> None:
+    """Writes the topics, with their convex hulls, to a Parquet file."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = {
+        name: [getattr(topic, name) for topic in topics]
+        for name in Topic.model_fields
+        if name != "convex_hull"
+    }
+    columns["convex_hull_x"] = pa.array(
+        [
+            topic.convex_hull.x_coordinates if topic.convex_hull else None
+            for topic in topics
+        ],
+        pa.list_(pa.float64()),
+    )
+    columns["convex_hull_y"] = pa.array(
+        [
+            topic.convex_hull.y_coordinates if topic.convex_hull else None
+            for topic in topics
+        ],
+        pa.list_(pa.float64()),
+    )
+    pq.write_table(pa.table(columns), os.path.join(path, TOPICS_FILE))
+
+
+def read_topics(path: str) -> t.Optional[t.List[Topic]]:
+    """Reads the topics written by `write_topics`, None if the model had no topics."""
+    import pyarrow.parquet as pq
+
+    file_path = os.path.join(path, TOPICS_FILE)
+    if not os.path.exists(file_path):
+        return None
+
+    columns = pq.read_table(file_path).to_pydict()
+    hulls_x, hulls_y = columns.pop("convex_hull_x"), columns.pop("convex_hull_y")
+    names = list(columns)
+
+    topics = []
+    for values, hull_x, hull_y in zip(zip(*columns.values()), hulls_x, hulls_y):
+        topic = Topic.model_construct(**dict(zip(names, values)))
+        topic.convex_hull = (
+            ConvexHullModel(x_coordinates=hull_x, y_coordinates=hull_y)
+            if hull_x is not None
+            else None
+        )
+        topics.append(topic)
+    return topics
+
+
+def write_embeddings(embeddings: EmbeddingMatrix, path: str) -> None:
+    """Writes the embedding matrix to a `.npy` file and its document ids to a Parquet file."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    file_path = os.path.join(path, EMBEDDINGS_FILE)
+    vectors = embeddings.vectors
+    # A model loaded from `path` maps this very file: it is already up to date
+    if not (
+        isinstance(vectors, np.memmap)
+        and os.path.exists(file_path)
+        and os.path.samefile(vectors.filename, file_path)
+    ):
+        np.save(file_path, vectors)
+
+    pq.write_table(
+        pa.table({"doc_id": pa.array(embeddings.doc_ids, pa.string())}),
+        os.path.join(path, EMBEDDING_IDS_FILE),
+    )
+
+
+def read_embeddings(path: str, mmap: bool = True) -> EmbeddingMatrix:
+    """Reads the embedding matrix written by `write_embeddings`, memory-mapped by default."""
+    import pyarrow.parquet as pq
+
+    vectors = np.load(
+        os.path.join(path, EMBEDDINGS_FILE), mmap_mode="r" if mmap else None
+    )
+    doc_ids = (
+        pq.read_table(os.path.join(path, EMBEDDING_IDS_FILE))
+        .column("doc_id")
+        .to_pylist()
+    )
+    return EmbeddingMatrix(vectors, doc_ids)
+
+
+def _write_ids(ids: t.Sequence[str], column: str, file_path: str) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pq.write_table(pa.table({column: pa.array(list(ids), pa.string())}), file_path)
+
+
+def _read_ids(column: str, file_path: str) -> t.List[str]:
+    import pyarrow.parquet as pq
+
+    return pq.read_table(file_path).column(column).to_pylist()
+
+
+def write_doc_term_matrix(doc_term_matrix: DocTermMatrix, path: str) -> None:
+    """Writes the sparse matrix to a `.npz` file, its rows and its vocabulary to Parquet files."""
+    from scipy import sparse
+
+    sparse.save_npz(
+        os.path.join(path, DOC_TERM_MATRIX_FILE),
+        doc_term_matrix.matrix,
+        compressed=False,
+    )
+    _write_ids(
+        doc_term_matrix.doc_ids, "doc_id", os.path.join(path, DOC_TERM_ROWS_FILE)
+    )
+    _write_ids(
+        doc_term_matrix.vocabulary, "term_id", os.path.join(path, VOCABULARY_FILE)
+    )
+
+
+def read_doc_term_matrix(path: str) -> t.Optional[DocTermMatrix]:
+    """Reads the matrix written by `write_doc_term_matrix`, None if there is none."""
+    from scipy import sparse
+
+    file_path = os.path.join(path, DOC_TERM_MATRIX_FILE)
+    if not os.path.exists(file_path):
+        return None
+    return DocTermMatrix(
+        sparse.load_npz(file_path),
+        _read_ids("doc_id", os.path.join(path, DOC_TERM_ROWS_FILE)),
+        _read_ids("term_id", os.path.join(path, VOCABULARY_FILE)),
+    )
+
+
+def write_settings(settings: t.Dict[str, t.Any], path: str) -> None:
+    """Writes the settings of the model (language, topic parameters...) to a JSON file."""
+    with open(os.path.join(path, SETTINGS_FILE), "w", encoding="utf-8") as f:
+        json.dump({"format_version": FORMAT_VERSION, **settings}, f)
+
+
+def read_settings(path: str) -> t.Dict[str, t.Any]:
+    """Reads the settings written by `write_settings`, an empty dict if there are none."""
+    file_path = os.path.join(path, SETTINGS_FILE)
+    if not os.path.exists(file_path):
+        return {}
+    with open(file_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_model(model, path: str, file_name: str, description: str) -> None:
+    import joblib
+
+    file_path = os.path.join(path, file_name)
+    try:
+        joblib.dump(model, file_path)
+    except Exception as error:
+        logger.warning(f"The {description} could not be saved: {error}")
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+def _read_model(path: str, file_name: str):
+    import joblib
+
+    file_path = os.path.join(path, file_name)
+    if not os.path.exists(file_path):
+        return None
+    return joblib.load(file_path)
+
+
+def write_projection_model(projection_model, path: str) -> None:
+    """Pickles the fitted projection model with joblib, if it can be pickled."""
+    _write_model(projection_model, path, PROJECTION_MODEL_FILE, "projection model")
+
+
+def read_projection_model(path: str):
+    """Loads the projection model written by `write_projection_model`, None if there is none."""
+    return _read_model(path, PROJECTION_MODEL_FILE)
+
+
+def write_clustering_model(clustering_model, path: str) -> None:
+    """Pickles the fitted clustering model of the topics, if it can be pickled."""
+    _write_model(clustering_model, path, CLUSTERING_MODEL_FILE, "clustering model")
+
+
+def read_clustering_model(path: str):
+    """Loads the model written by `write_clustering_model`, None if there is none."""
+    return _read_model(path, CLUSTERING_MODEL_FILE)
@@ -1,4 +1,7 @@
+from .clustering import EmbeddingKMeans
+from .doc_term_matrix import DocTermMatrix
 from .document_topic_ranker import DocumentRanker
+from .hierarchy import TopicHierarchy
 from .llm_topic_representation import LLMCleaningTopic
 from .term_extractor import TextacyTermsExtractor
 from .topic_model_builder import BunkaTopicModeling
@@ -0,0 +1,230 @@
+import typing as t
+
+import numpy as np
+
+
+def warm_start_centers(
+    X: np.ndarray,
+    centers: np.ndarray,
+    n_clusters: int,
+    sample_weight: t.Optional[np.ndarray] = None,
+    random_state: int = 42,
+) -> np.ndarray:
+    """
+    Extends the centers of a coarser k-means solution to `n_clusters` centers.
+
+    The new centers are drawn with the D² sampling of k-means++, conditioned on the existing
+    centers: the points far from every center are the most likely to seed a new cluster.
+
+    Args:
+        X (np.ndarray): A (n_samples, dim) matrix of points, in the space of `centers`.
+        centers (np.ndarray): The (n_centers, dim) centers of the coarser solution.
+        n_clusters (int): The number of centers to return.
+        sample_weight (np.ndarray, optional): The weight of every point. Default is None.
+        random_state (int): Seed of the sampling. Default is 42.
+
+    Returns:
+        np.ndarray: The (n_clusters, dim) initial centers, starting with `centers`.
+    """
+    X = np.asarray(X)
+    centers = np.asarray(centers, dtype=X.dtype)
+    rng = np.random.default_rng(random_state)
+    weights = np.ones(len(X)) if sample_weight is None else np.asarray(sample_weight)
+
+    squared_norms = np.einsum("ij,ij->i", X, X)
+    closest = (
+        squared_norms[:, None]
+        - 2 * X @ centers.T
+        + np.einsum("ij,ij->i", centers, centers)[None, :]
+    ).min(axis=1)
+    closest = np.maximum(closest, 0)
+
+    new_centers = []
+    for _ in range(n_clusters - len(centers)):
+        probabilities = weights * closest
+        if probabilities.sum() > 0:
+            row = rng.choice(len(X), p=probabilities / probabilities.sum())
+        else:
+            row = rng.integers(len(X))
+        new_centers.append(X[row])
+        closest = np.minimum(closest, ((X - X[row]) ** 2).sum(axis=1))
+
+    return np.vstack([centers] + new_centers) if new_centers else centers
+
+
+class EmbeddingKMeans:
+    """
+    MiniBatchKMeans on the document embeddings, optionally reduced with PCA.
+
+    The embeddings are read chunk by chunk in float32, so that large (possibly memory-mapped)
+    corpora never have to be copied in memory: the PCA and the initial centers are fitted on a
+    random sample, then the centers are updated with `partial_fit` over every chunk. Corpora
+    smaller than a chunk are fitted at once with `MiniBatchKMeans.fit`.
+
+    It follows the scikit-learn clustering API: `fit`, `predict`, `transform`, `labels_`,
+    `cluster_centers_` and `inertia_`.
+    """
+
+    def __init__(
+        self,
+        n_clusters: int = 10,
+        n_components: t.Optional[int] = None,
+        batch_size: int = 4096,
+        chunk_size: int = 100_000,
+        n_epochs: int = 1,
+        random_state: int = 42,
+        init: t.Union[str, np.ndarray] = "k-means++",
+    ) -> None:
+        """
+        Args:
+            n_clusters (int): The number of clusters. Default is 10.
+            n_components (int, optional): Reduces the embeddings to this number of PCA components
+                before clustering them. Default is None (no reduction).
+            batch_size (int): The number of embeddings of a k-means mini-batch. Default is 4096.
+            chunk_size (int): The number of embeddings read at once. Default is 100,000.
+            n_epochs (int): The number of passes over the chunks of a large corpus, after the
+                centers are initialized on a sample. Default is 1.
+            random_state (int): Seed of the sampling, the PCA and the k-means. Default is 42.
+            init (Union[str, np.ndarray]): The initialization of MiniBatchKMeans, or the initial centers
+                in the (reduced) clustering space. Default is "k-means++".
+        """
+        self.n_clusters = n_clusters
+        self.n_components = n_components
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.n_epochs = n_epochs
+        self.random_state = random_state
+        self.init = init
+
+    def __repr__(self) -> str:
+        return (
+            f"EmbeddingKMeans(n_clusters={self.n_clusters}, n_components={self.n_components}, "
+            f"batch_size={self.batch_size}, chunk_size={self.chunk_size})"
+        )
+
+    def fit(
+        self, X: np.ndarray, sample_weight: t.Optional[np.ndarray] = None
+    ) -> "EmbeddingKMeans":
+        """
+        Fits the PCA (if any) and the k-means centers, then labels every embedding.
+
+        Args:
+            X (np.ndarray): A (n_docs, dim) matrix of embeddings.
+            sample_weight (np.ndarray, optional): The weight of every embedding. Default is None.
+
+        Returns:
+            EmbeddingKMeans: The fitted model.
+        """
+        from sklearn.cluster import MiniBatchKMeans
+
+        n_samples = len(X)
+        rng = np.random.default_rng(self.random_state)
+        sample = self.sample_rows(n_samples)
+        self.fit_reducer(X)
+
+        init_centers = not isinstance(self.init, str)
+        self.kmeans_ = MiniBatchKMeans(
+            n_clusters=self.n_clusters,
+            init=self.init,
+            batch_size=self.batch_size,
+            n_init=1 if init_centers else 3,
+            random_state=self.random_state,
+        )
+        if sample is None:
+            self.kmeans_.fit(self.reduce(X), sample_weight=sample_weight)
+        else:
+            self.kmeans_.fit(
+                self.reduce(X[sample]),
+                sample_weight=None if sample_weight is None else sample_weight[sample],
+            )
+            starts = np.arange(0, n_samples, self.chunk_size)
+            for _ in range(self.n_epochs):
+                for start in rng.permutation(starts):
+                    self._partial_fit_chunk(X, sample_weight, start)
+
+        self.cluster_centers_ = self.kmeans_.cluster_centers_
+
+        # Labeled chunk by chunk: only one (chunk_size, n_clusters) block of distances is held
+        self.labels_ = np.empty(n_samples, dtype=np.int64)
+        self.inertia_ = 0.0
+        for start in range(0, n_samples, self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            distances = self.kmeans_.transform(self.reduce(X[chunk]))
+            labels = distances.argmin(axis=1)
+            squared_distances = (
+                distances[np.arange(len(labels)), labels].astype(np.float64) ** 2
+            )
+            self.labels_[chunk] = labels
+            self.inertia_ += float(
+                squared_distances.sum()
+                if sample_weight is None
+                else squared_distances @ sample_weight[chunk]
+            )
+        return self
+
+    def fit_reducer(self, X: np.ndarray) -> "EmbeddingKMeans":
+        """
+        Fits the PCA (if any) on the sampled rows of the embeddings, see `reduce`.
+
+        Args:
+            X (np.ndarray): A (n_docs, dim) matrix of embeddings.
+
+        Returns:
+            EmbeddingKMeans: The model, with its fitted reducer.
+        """
+        sample = self.sample_rows(len(X))
+        self.pca_ = None
+        if self.n_components is not None and self.n_components < X.shape[1]:
+            from sklearn.decomposition import PCA
+
+            self.pca_ = PCA(
+                n_components=self.n_components, random_state=self.random_state
+            )
+            self.pca_.fit(np.asarray(X if sample is None else X[sample], np.float32))
+        return self
+
+    def sample_rows(self, n_samples: int) -> t.Optional[np.ndarray]:
+        """The rows the PCA and the initial centers are fitted on, None if it is every row."""
+        if n_samples <= self.chunk_size:
+            return None
+        rng = np.random.default_rng(self.random_state)
+        # Sorted rows read a memory-mapped matrix sequentially
+        return np.sort(rng.choice(n_samples, size=self.chunk_size, replace=False))
+
+    def reduce(self, X: np.ndarray) -> np.ndarray:
+        """Returns the embeddings in the clustering space: float32, reduced by the PCA if any."""
+        X = np.asarray(X, dtype=np.float32)
+        if self.pca_ is not None:
+            X = self.pca_.transform(X).astype(np.float32, copy=False)
+        return X
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Returns the cluster of every embedding."""
+        return self._map_chunks(self.kmeans_.predict, X).astype(np.int64)
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Returns the (n_docs, n_clusters) distances between the embeddings and the centers."""
+        return self._map_chunks(self.kmeans_.transform, X)
+
+    def _partial_fit_chunk(
+        self, X: np.ndarray, sample_weight: t.Optional[np.ndarray], start: int
+    ) -> None:
+        chunk = self.reduce(X[start : start + self.chunk_size])
+        weights = (
+            None
+            if sample_weight is None
+            else sample_weight[start : start + self.chunk_size]
+        )
+        for batch_start in range(0, len(chunk), self.batch_size):
+            batch = slice(batch_start, batch_start + self.batch_size)
+            self.kmeans_.partial_fit(
+                chunk[batch], sample_weight=None if weights is None else weights[batch]
+            )
+
+    def _map_chunks(self, function: t.Callable, X: np.ndarray) -> np.ndarray:
+        return np.concatenate(
+            [
+                function(self.reduce(X[start : start + self.chunk_size]))
+                for start in range(0, len(X), self.chunk_size)
+            ]
+        )
@@ -0,0 +1,185 @@
+import typing as t
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from bunkatopics.datamodel import DOC_ID, TERM_ID, Document
+
+
+class DocTermMatrix:
+    """
+    Sparse document × term incidence matrix produced by the term extraction.
+
+    Rows follow `doc_ids` and columns follow `vocabulary`: the cell (i, j) is 1 when the
+    term `vocabulary[j]` occurs in the document `doc_ids[i]`. Topic naming, document
+    ranking and the explainers work on this matrix instead of exploding the `term_id`
+    lists of every Document.
+    """
+
+    def __init__(
+        self,
+        matrix: sparse.spmatrix,
+        doc_ids: t.Sequence[DOC_ID],
+        vocabulary: t.Sequence[TERM_ID],
+    ) -> None:
+        """
+        Args:
+            matrix (sparse.spmatrix): A (n_docs, n_terms) sparse matrix.
+            doc_ids (Sequence[DOC_ID]): The document id of every row.
+            vocabulary (Sequence[TERM_ID]): The term id of every column.
+
+        Raises:
+            ValueError: If the shape of `matrix` does not match `doc_ids` and `vocabulary`.
+        """
+        matrix = sparse.csr_matrix(matrix, dtype=np.int32)
+        if matrix.shape != (len(doc_ids), len(vocabulary)):
+            raise ValueError(
+                f"Expected a ({len(doc_ids)}, {len(vocabulary)}) matrix, got shape {matrix.shape}"
+            )
+        matrix.sort_indices()
+
+        self.matrix = matrix
+        self.doc_ids = list(doc_ids)
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self.index: t.Dict[DOC_ID, int] = {}
+        for row, doc_id in enumerate(self.doc_ids):
+            self.index.setdefault(doc_id, row)
+        self.term_index: t.Dict[TERM_ID, int] = {
+            term_id: column for column, term_id in enumerate(self.vocabulary)
+        }
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def __repr__(self) -> str:
+        return f"DocTermMatrix(n_docs={len(self)}, n_terms={len(self.vocabulary)}, nnz={self.matrix.nnz})"
+
+    @property
+    def shape(self) -> t.Tuple[int, int]:
+        return self.matrix.shape
+
+    @classmethod
+    def from_pairs(
+        cls,
+        pair_doc_ids: t.Sequence[DOC_ID],
+        pair_term_ids: t.Sequence[TERM_ID],
+        doc_ids: t.Sequence[DOC_ID],
+        vocabulary: t.Sequence[TERM_ID],
+    ) -> "DocTermMatrix":
+        """
+        Builds the matrix from parallel arrays of (document, term) occurrences.
+
+        Args:
+            pair_doc_ids (Sequence[DOC_ID]): The document of every occurrence.
+            pair_term_ids (Sequence[TERM_ID]): The term of every occurrence.
+            doc_ids (Sequence[DOC_ID]): The documents, in row order.
+            vocabulary (Sequence[TERM_ID]): The terms, in column order.
+
+        Returns:
+            DocTermMatrix: The incidence matrix. Occurrences of unknown documents or terms
+            are ignored.
+        """
+        rows = pd.Index(doc_ids).get_indexer(pair_doc_ids)
+        columns = pd.Index(vocabulary).get_indexer(pair_term_ids)
+        known = (rows >= 0) & (columns >= 0)
+        rows, columns = rows[known], columns[known]
+
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, columns)),
+            shape=(len(doc_ids), len(vocabulary)),
+        )
+        # Repeated occurrences are summed on conversion: keep the incidence only
+        matrix.data[:] = 1
+        return cls(matrix, doc_ids, vocabulary)
+
+    @classmethod
+    def from_documents(
+        cls,
+        docs: t.Sequence[Document],
+        vocabulary: t.Optional[t.Sequence[TERM_ID]] = None,
+    ) -> "DocTermMatrix":
+        """
+        Builds the matrix from the `term_id` lists of Documents.
+
+        Args:
+            docs (Sequence[Document]): The documents.
+            vocabulary (Sequence[TERM_ID], optional): The terms, in column order. Defaults to
+                the terms of the documents in order of first appearance.
+
+        Returns:
+            DocTermMatrix: The incidence matrix.
+        """
+        doc_ids = [doc.doc_id for doc in docs]
+        lengths = [len(doc.term_id) if doc.term_id else 0 for doc in docs]
+        pair_term_ids = [
+            term_id for doc in docs if doc.term_id for term_id in doc.term_id
+        ]
+        pair_doc_ids = np.repeat(np.asarray(doc_ids, dtype=object), lengths)
+
+        if vocabulary is None:
+            vocabulary = list(dict.fromkeys(pair_term_ids))
+
+        return cls.from_pairs(pair_doc_ids, pair_term_ids, doc_ids, vocabulary)
+
+    def append(self, other: "DocTermMatrix") -> "DocTermMatrix":
+        """
+        Returns a new matrix with the rows of `other` added after the stored ones.
+
+        The terms of `other` missing from the vocabulary are added as new columns.
+
+        Args:
+            other (DocTermMatrix): The matrix of the new documents.
+
+        Returns:
+            DocTermMatrix: The extended matrix.
+        """
+        new_terms = [term for term in other.vocabulary if term not in self.term_index]
+        vocabulary = np.concatenate(
+            [self.vocabulary, np.asarray(new_terms, dtype=object)]
+        )
+        term_index = dict(self.term_index)
+        for term in new_terms:
+            term_index[term] = len(term_index)
+
+        # Move the columns of `other` to their position in the merged vocabulary
+        columns = np.fromiter(
+            (term_index[term] for term in other.vocabulary),
+            dtype=np.int64,
+            count=len(other.vocabulary),
+        )
+        other_matrix = sparse.csr_matrix(
+            (other.matrix.data, columns[other.matrix.indices], other.matrix.indptr),
+            shape=(len(other), len(vocabulary)),
+        )
+        matrix = sparse.csr_matrix(
+            (self.matrix.data, self.matrix.indices, self.matrix.indptr),
+            shape=(len(self), len(vocabulary)),
+        )
+
+        return DocTermMatrix(
+            sparse.vstack([matrix, other_matrix], format="csr"),
+            self.doc_ids + other.doc_ids,
+            vocabulary,
+        )
+
+    def rows(self, doc_ids: t.Iterable[DOC_ID]) -> np.ndarray:
+        """Returns the row of each document id, -1 for documents without a row."""
+        return np.fromiter(
+            (self.index.get(doc_id, -1) for doc_id in doc_ids), dtype=np.int64
+        )
+
+    def columns(self, term_ids: t.Iterable[TERM_ID]) -> np.ndarray:
+        """Returns the column of each term id, -1 for terms outside the vocabulary."""
+        return np.fromiter(
+            (self.term_index.get(term_id, -1) for term_id in term_ids), dtype=np.int64
+        )
+
+    def terms_of(self, row: int) -> t.List[TERM_ID]:
+        """Returns the terms of the document stored in `row`."""
+        start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        return self.vocabulary[self.matrix.indices[start:end]].tolist()
+
+    def to_dict(self) -> t.Dict[DOC_ID, t.List[TERM_ID]]:
+        """Returns the `doc_id -> [term_id]` mapping stored in `Document.term_id`."""
+        return {doc_id: self.terms_of(row) for doc_id, row in self.index.items()}
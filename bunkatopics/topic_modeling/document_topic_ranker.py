@@ -1,8 +1,11 @@
 import typing as t
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
 from bunkatopics.datamodel import Document, Topic, TopicRanking
+from bunkatopics.topic_modeling.doc_term_matrix import DocTermMatrix
 
 
 class DocumentRanker:
@@ -24,6 +27,7 @@ class DocumentRanker:
         self,
         docs: t.List[Document],
         topics: t.List[Topic],
+        doc_term_matrix: t.Optional[DocTermMatrix] = None,
     ) -> t.Tuple[t.List[Document], t.List[Topic]]:
         """
         Calculate top documents for each topic based on ranking terms.
@@ -31,37 +35,58 @@ class DocumentRanker:
         Args:
             docs (List[Document]): List of documents.
             topics (List[Topic]): List of topics.
+            doc_term_matrix (DocTermMatrix, optional): The terms of every document. Defaults to the
+                matrix built from the `term_id` of the documents.
 
         Returns:
             Tuple[List[Document], List[Topic]]: Updated lists of documents and topics.
         """
-        # Create a DataFrame from the list of documents
-        df_docs = pd.DataFrame.from_records([doc.model_dump() for doc in docs])
-
-        # Explode the term_id column to have one row per term
-        df_docs = df_docs[["doc_id", "topic_id", "term_id"]]
-        df_docs = df_docs.explode("term_id").reset_index(drop=True)
+        if doc_term_matrix is None:
+            doc_term_matrix = DocTermMatrix.from_documents(docs)
+
+        # Sparse (topic x term) indicator of the top terms of every topic
+        top_terms = [(topic.term_id or [])[: self.ranking_terms] for topic in topics]
+        topic_rows = np.repeat(np.arange(len(topics)), [len(x) for x in top_terms])
+        term_columns = doc_term_matrix.columns(term for x in top_terms for term in x)
+        known = term_columns >= 0
+        topic_terms = sparse.csr_matrix(
+            (
+                np.ones(known.sum(), dtype=np.int32),
+                (topic_rows[known], term_columns[known]),
+            ),
+            shape=(len(topics), doc_term_matrix.shape[1]),
+        )
 
-        # Create a DataFrame from the list of topics and truncate term_id
-        df_topics = pd.DataFrame.from_records([topic.model_dump() for topic in topics])
-        df_topics["term_id"] = df_topics["term_id"].apply(
-            lambda x: x[: self.ranking_terms]
+        # Count the top terms of its topic in every document
+        topic_index = {topic.topic_id: i for i, topic in enumerate(topics)}
+        doc_topics = {doc.doc_id: topic_index.get(doc.topic_id) for doc in docs}
+        row_topics = np.array(
+            [doc_topics.get(doc_id) for doc_id in doc_term_matrix.doc_ids],
+            dtype=object,
         )
-        df_topics = df_topics[["topic_id", "term_id"]]
-        df_topics = df_topics.explode("term_id").reset_index(drop=True)
-
-        # Merge documents and topics, and calculate term counts
-        df_rank = pd.merge(df_docs, df_topics, on=["topic_id", "term_id"])
-        df_rank = (
-            df_rank.groupby(["topic_id", "doc_id"])["term_id"]
-            .count()
-            .rename("count_topic_terms")
-            .reset_index()
+        rows = np.flatnonzero(pd.notna(row_topics))
+        row_topics = row_topics[rows].astype(np.int64)
+        counts = np.asarray(
+            doc_term_matrix.matrix[rows].multiply(topic_terms[row_topics]).sum(axis=1)
+        ).ravel()
+
+        matched = counts > 0
+        doc_multiplicities = {doc.doc_id: doc.multiplicity for doc in docs}
+        doc_ids = [doc_term_matrix.doc_ids[row] for row in rows[matched]]
+        df_rank = pd.DataFrame(
+            {
+                "topic_id": [topics[i].topic_id for i in row_topics[matched]],
+                "doc_id": doc_ids,
+                "count_topic_terms": counts[matched],
+                "multiplicity": [doc_multiplicities.get(x, 1) for x in doc_ids],
+            }
         )
+        df_rank = df_rank.sort_values(["topic_id", "doc_id"]).reset_index(drop=True)
 
-        # Sort and rank documents within each topic
+        # Sort and rank documents within each topic, the most duplicated first among ties
         df_rank = df_rank.sort_values(
-            ["topic_id", "count_topic_terms"], ascending=(True, False)
+            ["topic_id", "count_topic_terms", "multiplicity"],
+            ascending=(True, False, False),
         ).reset_index(drop=True)
         df_rank["rank"] = df_rank.groupby("topic_id")["count_topic_terms"].rank(
             method="first", ascending=False
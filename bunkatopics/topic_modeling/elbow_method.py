@@ -1,38 +1,157 @@
-import matplotlib.pyplot as plt
-from kneed import KneeLocator
-from sklearn.cluster import KMeans
+import typing as t
 
+import numpy as np
+import pandas as pd
 
-def compute_knee(data, max_k):
-    # Compute sum of squared distances for different values of K
-    distortions = []
-    for k in range(1, max_k + 1):
-        kmeans = KMeans(n_clusters=k)
-        kmeans.fit(data)
-        distortions.append(
-            kmeans.inertia_
-        )  # Inertia: Sum of squared distances to the nearest centroid
-
-    # Find the optimal number of clusters using the KneeLocator
-    knee = KneeLocator(
-        range(1, max_k + 1), distortions, curve="convex", direction="decreasing"
+from bunkatopics.logging import logger
+
+
+def find_knee(
+    x: t.Sequence[float], y: t.Sequence[float], sensitivity: float = 1.0
+) -> t.Optional[float]:
+    """
+    Finds the knee of a decreasing convex curve, such as the inertia of k-means, with Kneedle.
+
+    Both axes are normalized to [0, 1]. The knee is the first local maximum of the distance
+    between the flipped curve and the diagonal that is followed by a drop of the distance below
+    its threshold, the maximum minus `sensitivity` times the mean step of x.
+
+    Args:
+        x (Sequence[float]): The increasing x values.
+        y (Sequence[float]): The decreasing y values.
+        sensitivity (float): Higher values wait for a clearer knee. Default is 1.0.
+
+    Returns:
+        Optional[float]: The x value of the knee, None if the curve is too short or flat.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) < 3 or np.ptp(x) == 0 or np.ptp(y) == 0:
+        return None
+
+    x_normalized = (x - x.min()) / np.ptp(x)
+    y_normalized = (y - y.min()) / np.ptp(y)
+    difference = (1 - y_normalized) - x_normalized
+
+    maxima = [
+        i
+        for i in range(1, len(difference) - 1)
+        if difference[i - 1] <= difference[i] >= difference[i + 1]
+    ]
+    step = np.diff(x_normalized).mean()
+    for position, maximum in enumerate(maxima):
+        threshold = difference[maximum] - sensitivity * step
+        end = maxima[position + 1] if position + 1 < len(maxima) else len(difference)
+        if (difference[maximum + 1 : end] < threshold).any():
+            return float(x[maximum])
+
+    return None
+
+
+def _score_n_clusters(
+    X: np.ndarray,
+    n_clusters: int,
+    sample_weight: t.Optional[np.ndarray],
+    silhouette_rows: np.ndarray,
+    random_state: int,
+) -> t.Dict[str, float]:
+    from sklearn.cluster import MiniBatchKMeans
+    from sklearn.metrics import silhouette_score
+
+    model = MiniBatchKMeans(
+        n_clusters=n_clusters, n_init=3, random_state=random_state
+    ).fit(X, sample_weight=sample_weight)
+
+    labels = model.labels_[silhouette_rows]
+    silhouette = np.nan
+    if 1 < len(np.unique(labels)) < len(silhouette_rows):
+        silhouette = silhouette_score(X[silhouette_rows], labels)
+
+    return {
+        "n_clusters": n_clusters,
+        "inertia": float(model.inertia_),
+        "silhouette": float(silhouette),
+    }
+
+
+def select_n_clusters(
+    X: np.ndarray,
+    n_clusters: t.Iterable[int] = range(2, 31),
+    sample_weight: t.Optional[np.ndarray] = None,
+    method: str = "knee",
+    sample_size: int = 20_000,
+    silhouette_sample_size: int = 2_000,
+    n_jobs: int = -1,
+    random_state: int = 42,
+) -> t.Tuple[int, pd.DataFrame]:
+    """
+    Selects the number of clusters of k-means, without plotting anything.
+
+    A MiniBatchKMeans is fitted for every candidate on the same random sample of points, the
+    candidates running in parallel threads. Every fit is scored by its inertia and by its
+    silhouette on a smaller subsample.
+
+    Args:
+        X (np.ndarray): A (n_samples, dim) matrix of points, possibly memory-mapped.
+        n_clusters (Iterable[int]): The candidate numbers of clusters. Default is 2 to 30.
+        sample_weight (np.ndarray, optional): The weight of every point. Default is None.
+        method (str): "knee" picks the knee of the inertia curve, "silhouette" the best silhouette.
+            Default is "knee".
+        sample_size (int): The number of points the k-means are fitted on. Default is 20,000.
+        silhouette_sample_size (int): The number of points the silhouette is computed on. Default is 2,000.
+        n_jobs (int): The number of threads, -1 for all the CPUs. Default is -1.
+        random_state (int): Seed of the sampling and of the k-means. Default is 42.
+
+    Returns:
+        Tuple[int, pd.DataFrame]: The selected number of clusters, and the n_clusters, inertia and
+        silhouette of every candidate.
+
+    Raises:
+        ValueError: If `method` is neither "knee" nor "silhouette".
+    """
+    from joblib import Parallel, delayed
+
+    if method not in ("knee", "silhouette"):
+        raise ValueError(f"method must be 'knee' or 'silhouette', got {method!r}")
+
+    candidates = sorted({k for k in n_clusters if 1 <= k <= len(X)})
+    if not candidates:
+        raise ValueError(f"No candidate number of clusters for {len(X)} points")
+
+    rng = np.random.default_rng(random_state)
+    rows = np.sort(rng.choice(len(X), size=min(len(X), sample_size), replace=False))
+    sample = np.asarray(X[rows], dtype=np.float32)
+    weights = None if sample_weight is None else np.asarray(sample_weight)[rows]
+    silhouette_rows = np.sort(
+        rng.choice(
+            len(rows), size=min(len(rows), silhouette_sample_size), replace=False
+        )
     )
 
-    # Plot the elbow curve with the knee point marked
-    plt.plot(range(1, max_k + 1), distortions, marker="o")
-    plt.xlabel("Number of clusters (K)")
-    plt.ylabel("Sum of squared distances")
-    plt.title("Elbow Curve")
-    plt.vlines(
-        knee.knee,
-        plt.ylim()[0],
-        plt.ylim()[1],
-        linestyles="dashed",
-        colors="r",
-        label="Knee",
+    scores = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_score_n_clusters)(sample, k, weights, silhouette_rows, random_state)
+        for k in candidates
     )
-    plt.legend()
+    curve = pd.DataFrame(scores)
+
+    if method == "silhouette" and curve["silhouette"].notna().any():
+        selected = int(curve.loc[curve["silhouette"].idxmax(), "n_clusters"])
+    else:
+        knee = find_knee(curve["n_clusters"], curve["inertia"])
+        # Without a clear knee, fall back on the best silhouette
+        if knee is None and curve["silhouette"].notna().any():
+            knee = curve.loc[curve["silhouette"].idxmax(), "n_clusters"]
+        selected = int(knee) if knee is not None else candidates[0]
+
+    logger.info(f"Selected {selected} clusters with the {method} method")
+    return selected, curve
+
+
+def compute_knee(data, max_k):
+    """
+    Returns the number of clusters at the knee of the inertia curve, from 1 to `max_k` clusters.
 
-    # Print the optimal number of clusters
-    print(f"Optimal number of clusters (K): {knee.knee}")
-    plt.show()
+    Kept for compatibility: see `select_n_clusters`.
+    """
+    n_clusters, _ = select_n_clusters(np.asarray(data), range(1, max_k + 1))
+    return n_clusters
@@ -0,0 +1,149 @@
+import typing as t
+
+import numpy as np
+
+from bunkatopics.datamodel import TOPIC_ID, Topic
+
+
+def ward_linkage(centers: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Builds the Ward dendrogram of weighted points, such as the centers of clusters.
+
+    Merging the groups i and j costs the increase of the within-group sum of squares,
+    `w_i * w_j / (w_i + w_j) * ||c_i - c_j||²`, so that large clusters are merged later than
+    small ones at the same distance.
+
+    Args:
+        centers (np.ndarray): A (n_points, dim) matrix.
+        weights (np.ndarray): The weight of every point, e.g. the size of its cluster.
+
+    Returns:
+        np.ndarray: A (n_points - 1, 4) linkage matrix in the format of `scipy.cluster.hierarchy`.
+    """
+    centers = np.array(centers, dtype=np.float64)
+    weights = np.maximum(np.asarray(weights, dtype=np.float64), 1e-12)
+    n_points = len(centers)
+
+    def merge_costs(row: int) -> np.ndarray:
+        distances = ((centers - centers[row]) ** 2).sum(axis=1)
+        return weights * weights[row] / (weights + weights[row]) * distances
+
+    squared_norms = (centers**2).sum(axis=1)
+    distances = np.maximum(
+        squared_norms[:, None] + squared_norms[None, :] - 2 * centers @ centers.T, 0
+    )
+    costs = np.outer(weights, weights) / np.add.outer(weights, weights) * distances
+    np.fill_diagonal(costs, np.inf)
+
+    active = np.ones(n_points, dtype=bool)
+    cluster_ids = np.arange(n_points)
+    counts = np.ones(n_points)
+    linkage = np.empty((max(n_points - 1, 0), 4))
+    for step in range(n_points - 1):
+        i, j = sorted(np.unravel_index(np.argmin(costs), costs.shape))
+        linkage[step] = [
+            min(cluster_ids[i], cluster_ids[j]),
+            max(cluster_ids[i], cluster_ids[j]),
+            np.sqrt(2 * costs[i, j]),
+            counts[i] + counts[j],
+        ]
+
+        # The merged group takes the place of i, j is removed
+        total = weights[i] + weights[j]
+        centers[i] = (weights[i] * centers[i] + weights[j] * centers[j]) / total
+        weights[i] = total
+        counts[i] += counts[j]
+        cluster_ids[i] = n_points + step
+        active[j] = False
+
+        row_costs = merge_costs(i)
+        row_costs[~active] = np.inf
+        row_costs[i] = np.inf
+        costs[i, :] = costs[:, i] = row_costs
+        costs[j, :] = costs[:, j] = np.inf
+
+    return linkage
+
+
+class TopicHierarchy:
+    """
+    Dendrogram of the fine clusters of the documents, cut at any number of topics.
+
+    The assignment of the fine clusters to the groups of every cut of the dendrogram is
+    computed once, so that the documents of any level are found by indexing. The topics of
+    the levels already named are kept in `topics`.
+    """
+
+    def __init__(
+        self, fine_labels: np.ndarray, centers: np.ndarray, weights: np.ndarray
+    ) -> None:
+        """
+        Args:
+            fine_labels (np.ndarray): The fine cluster of every document.
+            centers (np.ndarray): The (n_fine_clusters, dim) centers of the fine clusters.
+            weights (np.ndarray): The size of every fine cluster.
+        """
+        from scipy.cluster.hierarchy import cut_tree
+
+        self.fine_labels = np.asarray(fine_labels, dtype=np.int64)
+        self.n_fine_clusters = len(centers)
+        self.linkage_ = ward_linkage(centers, weights)
+        # Column i holds the labels of the cut into n_fine_clusters - i groups
+        self._cuts = (
+            cut_tree(self.linkage_)
+            if self.n_fine_clusters > 1
+            else np.zeros((1, 1), dtype=np.int64)
+        )
+        self.topics: t.Dict[int, t.List[Topic]] = {}
+        # The model that computed the fine clusters
+        self.clustering_model = None
+
+    def __repr__(self) -> str:
+        return f"TopicHierarchy(n_fine_clusters={self.n_fine_clusters}, levels={sorted(self.topics)})"
+
+    def cluster_labels(self, n_clusters: int) -> np.ndarray:
+        """
+        Returns the group of every fine cluster when the dendrogram is cut into `n_clusters` groups.
+
+        Raises:
+            ValueError: If `n_clusters` is not between 1 and the number of fine clusters.
+        """
+        if not 1 <= n_clusters <= self.n_fine_clusters:
+            raise ValueError(
+                f"n_clusters must be between 1 and {self.n_fine_clusters}, got {n_clusters}"
+            )
+        return self._cuts[:, self.n_fine_clusters - n_clusters]
+
+    def topic_ids_of_clusters(self, n_clusters: int) -> np.ndarray:
+        """Returns the topic_id of every fine cluster when the dendrogram is cut into `n_clusters` topics."""
+        labels = self.cluster_labels(n_clusters)
+        return f"bt-{n_clusters}-" + labels.astype(str).astype(object)
+
+    def topic_ids(self, n_clusters: int) -> np.ndarray:
+        """Returns the topic_id of every document when the dendrogram is cut into `n_clusters` topics."""
+        return self.topic_ids_of_clusters(n_clusters)[self.fine_labels]
+
+    def link(self) -> None:
+        """Sets the level, the parent and the children of the topics of the named levels."""
+        levels = sorted(self.topics)
+        for n_clusters in levels:
+            for topic in self.topics[n_clusters]:
+                # Keyed by the number of topics, so that naming a new level leaves it unchanged
+                topic.level = n_clusters
+                topic.parent_topic_id = None
+                topic.children_topic_id = []
+
+        for coarse, fine in zip(levels, levels[1:]):
+            parents: t.Dict[TOPIC_ID, TOPIC_ID] = {
+                f"bt-{fine}-{fine_label}": f"bt-{coarse}-{coarse_label}"
+                for fine_label, coarse_label in zip(
+                    self.cluster_labels(fine), self.cluster_labels(coarse)
+                )
+            }
+            coarse_topics = {topic.topic_id: topic for topic in self.topics[coarse]}
+            for topic in self.topics[fine]:
+                # The parent may have been dropped for being too small
+                parent = coarse_topics.get(parents[topic.topic_id])
+                if parent is not None:
+                    topic.parent_topic_id = parent.topic_id
+                    parent.children_topic_id.append(topic.topic_id)
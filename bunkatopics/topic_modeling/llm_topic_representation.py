@@ -1,15 +1,15 @@
 import typing as t
 
 import pandas as pd
-from langchain.chains import LLMChain
-from langchain.prompts import ChatPromptTemplate
-from langchain_core.language_models.llms import LLM
 from tqdm import tqdm
 
 from bunkatopics.datamodel import Document, Topic
 from bunkatopics.topic_modeling.prompt_generator import (
     promp_template_topics_terms, promp_template_topics_terms_no_docs)
 
+if t.TYPE_CHECKING:
+    from langchain_core.language_models.llms import LLM
+
 TERM_ID = str
 
 
@@ -25,7 +25,7 @@ class LLMCleaningTopic:
 
     def __init__(
         self,
-        llm: LLM,
+        llm: "LLM",
         language: str = "english",
         top_doc: int = 3,
         top_terms: int = 10,
@@ -118,6 +118,9 @@ def _get_clean_topic(
     Returns:
         Cleaned topic label.
     """
+    from langchain.chains import LLMChain
+    from langchain.prompts import ChatPromptTemplate
+
     specific_terms = specific_terms[:top_terms]
     specific_documents = specific_documents[:top_doc]
 
@@ -1,30 +1,31 @@
 import random
+import time
 import typing as t
 import warnings
-from functools import partial
+from functools import lru_cache, partial
 
 import pandas as pd
-import spacy
-import textacy
-import textacy.preprocessing
 from tqdm import tqdm
 
 from bunkatopics.datamodel import Term
 from bunkatopics.logging import logger
 
-from .utils import detect_language, detect_language_to_spacy_model
-
-# Define a preprocessing pipeline
-preproc = textacy.preprocessing.make_pipeline(
-    textacy.preprocessing.normalize.unicode,
-    textacy.preprocessing.normalize.bullet_points,
-    textacy.preprocessing.normalize.quotation_marks,
-    textacy.preprocessing.normalize.whitespace,
-    textacy.preprocessing.normalize.hyphenated_words,
-    textacy.preprocessing.remove.brackets,
-    textacy.preprocessing.replace.currency_symbols,
-    textacy.preprocessing.remove.html_tags,
-)
+from .doc_term_matrix import DocTermMatrix
+from .utils import detect_language, detect_language_to_spacy_model, load_spacy_model
+
+# spaCy factories needed by every extraction: lemmas need POS tags, which need the
+# token-to-vector layer
+BASE_COMPONENTS = {
+    "tok2vec",
+    "transformer",
+    "tagger",
+    "morphologizer",
+    "attribute_ruler",
+    "lemmatizer",
+}
+# Additional factories needed by named entities and noun chunks
+ENTITIES_COMPONENTS = {"ner", "entity_ruler"}
+NOUN_CHUNKS_COMPONENTS = {"parser"}
 
 # Define custom types for document and term IDs
 DOC_ID = t.TypeVar("DOC_ID")
@@ -54,6 +55,8 @@ class TextacyTermsExtractor:
         include_pos: t.List[str] = ["NOUN"],
         include_types: t.List[str] = ["PERSON", "ORG"],
         language: str = "en",
+        n_process: int = 1,
+        batch_size: int = 1000,
     ):
         """
         Initializes the TextacyTermsExtractor with specified configuration.
@@ -66,6 +69,8 @@ class TextacyTermsExtractor:
             drop_emoji (bool): Remove emojis before extraction. Defaults to True.
             include_pos (list[str]): POS tags to include. Defaults to ["NOUN"].
             include_types (list[str]): Entity types to include. Defaults to ["PERSON", "ORG"].
+            n_process (int): Number of worker processes running the spaCy pipeline. Defaults to 1.
+            batch_size (int): Number of documents sent at once to the spaCy pipeline. Defaults to 1000.
 
         Raises:
             ValueError: If the specified language is not supported.
@@ -79,12 +84,14 @@ class TextacyTermsExtractor:
         self.include_types = include_types
         self.ngrams = ngrams
         self.language = language
+        self.n_process = n_process
+        self.batch_size = batch_size
 
     def fit_transform(
         self,
         ids: t.List[DOC_ID],
         sentences: t.List[str],
-    ) -> t.Tuple[t.List[Term], t.Dict[DOC_ID, t.List[TERM_ID]]]:
+    ) -> t.Tuple[t.List[Term], DocTermMatrix]:
         """
         Extracts terms from the provided documents and returns them along with their indices.
 
@@ -92,6 +99,10 @@ class TextacyTermsExtractor:
             ids (List[DOC_ID]): List of document IDs.
             sentences (List[str]): List of sentences corresponding to the document IDs.
 
+        Returns:
+            Tuple[List[Term], DocTermMatrix]: The extracted terms, and the sparse matrix of the
+            terms occurring in every document, whose columns follow the order of the terms.
+
         Notes:
             - The method processes each document to extract relevant terms based on the configured
             linguistic features such as n-grams, named entities, and noun chunks.
@@ -107,17 +118,11 @@ class TextacyTermsExtractor:
             )
             self.language_model = "en_core_web_sm"
 
-        try:
-            spacy.load(self.language_model)
-        except OSError:
-            # The model is not installed, so download it
-            spacy.cli.download(self.language_model)
-
         # Create a DataFrame from the provided document IDs and sentences
         self.df = pd.DataFrame({"content": sentences, "doc_id": ids})
 
         # Extract terms from the DataFrame
-        df_terms, df_terms_indexed = self.extract_terms_df(
+        df_terms, doc_term_matrix = self.extract_terms_df(
             self.df,
             text_var="content",
             index_var="doc_id",
@@ -130,21 +135,17 @@ class TextacyTermsExtractor:
             include_pos=self.include_pos,
             include_types=self.include_types,
             language_model=self.language_model,
+            n_process=self.n_process,
+            batch_size=self.batch_size,
         )
 
         # Process and return the extracted terms
         df_terms = df_terms.reset_index().rename(columns={"terms_indexed": "term_id"})
         terms = [Term(**row) for row in df_terms.to_dict(orient="records")]
         self.terms: t.List[Term] = terms
+        self.doc_term_matrix = doc_term_matrix
 
-        df_terms_indexed = df_terms_indexed.reset_index().rename(
-            columns={"text": "terms_indexed"}
-        )
-        indexed_terms_dict = df_terms_indexed.set_index("doc_id")[
-            "terms_indexed"
-        ].to_dict()
-
-        return terms, indexed_terms_dict
+        return terms, doc_term_matrix
 
     def extract_terms_df(
         self,
@@ -160,114 +161,59 @@ class TextacyTermsExtractor:
         include_pos: t.List[str] = ["NOUN", "PROPN", "ADJ"],
         include_types: t.List[str] = ["PERSON", "ORG"],
         language_model: str = "en_core_web_sm",
-    ) -> t.Tuple[pd.DataFrame, pd.DataFrame]:
-        load_lang = textacy.load_spacy_lang(language_model, disable=())
-
-        def extract_terms(
-            tuple: t.Tuple[int, str],
-            ngs: bool,
-            ents: bool,
-            ncs: bool,
-            ngrams: t.Tuple[int, int],
-            drop_emoji: bool,
-            remove_punctuation: bool,
-            include_pos: t.List[str],
-            include_types: t.List[str],
-        ) -> pd.DataFrame:
-            index = tuple[0]
-            text = tuple[1]
-
-            prepro_text = preproc(str(text))
-            if drop_emoji:
-                prepro_text = textacy.preprocessing.replace.emojis(prepro_text, repl="")
-
-            if remove_punctuation:
-                prepro_text = textacy.preprocessing.remove.punctuation(prepro_text)
-
-            doc = textacy.make_spacy_doc(prepro_text, lang=load_lang)
-
-            terms = []
-
-            if ngs:
-                ngrams_terms = list(
-                    textacy.extract.terms(
-                        doc,
-                        ngs=partial(
-                            textacy.extract.ngrams,
-                            n=ngrams,
-                            filter_punct=True,
-                            filter_stops=True,
-                            include_pos=include_pos,
-                        ),
-                        dedupe=False,
-                    )
-                )
-
-                terms.append(ngrams_terms)
-
-            if ents:
-                ents_terms = list(
-                    textacy.extract.terms(
-                        doc,
-                        ents=partial(
-                            textacy.extract.entities, include_types=include_types
-                        ),
-                        dedupe=False,
-                    )
-                )
-                terms.append(ents_terms)
-
-            if ncs:
-                ncs_terms = list(
-                    textacy.extract.terms(
-                        doc,
-                        ncs=partial(textacy.extract.noun_chunks, drop_determiners=True),
-                        dedupe=False,
-                    )
-                )
-
-                noun_chunks = [x for x in ncs_terms if len(x) >= 3]
-                terms.append(noun_chunks)
-
-            final = [item for sublist in terms for item in sublist]
-            final = list(set(final))
-
-            df = [
-                (term.text, term.lemma_.lower(), term.label_, term.__len__())
-                for term in final
-            ]
-            df = pd.DataFrame(df, columns=["text", "lemma", "ent", "ngrams"])
-            df["text_index"] = index
-
-            return df
+        n_process: int = 1,
+        batch_size: int = 1000,
+    ) -> t.Tuple[pd.DataFrame, DocTermMatrix]:
+        load_lang = load_spacy_model(language_model)
+        disabled_components = get_disabled_components(
+            load_lang, ngs=ngs, ents=ents, ncs=ncs
+        )
+        logger.debug(f"Disabled spaCy components: {disabled_components}")
 
         data = data[data[text_var].notna()]
 
-        sentences = data[text_var].tolist()
         indexes = data[index_var].tolist()
-        inputs = [(x, y) for x, y in zip(indexes, sentences)]
-
-        res = list(
-            tqdm(
-                map(
-                    partial(
-                        extract_terms,
-                        ngs=ngs,
-                        ents=ents,
-                        ncs=ncs,
-                        drop_emoji=drop_emoji,
-                        remove_punctuation=remove_punctuation,
-                        ngrams=ngrams,
-                        include_pos=include_pos,
-                        include_types=include_types,
-                    ),
-                    inputs,
-                ),
-                total=len(inputs),
-            )
+        texts = (
+            _preprocess_text(text, drop_emoji, remove_punctuation)
+            for text in data[text_var]
         )
 
-        final_res = pd.concat([x for x in res])
+        # spaCy streams the texts by batches and, with n_process > 1, loads one copy
+        # of the pipeline per worker process
+        spacy_docs = load_lang.pipe(
+            texts,
+            n_process=n_process,
+            batch_size=batch_size,
+            disable=disabled_components,
+        )
+        start_time = time.perf_counter()
+
+        # Accumulate the terms of all documents into flat columns
+        columns = {"text": [], "lemma": [], "ent": [], "ngrams": [], "text_index": []}
+        for index, doc in tqdm(zip(indexes, spacy_docs), total=len(indexes)):
+            for term in _extract_terms(
+                doc,
+                ngs=ngs,
+                ents=ents,
+                ncs=ncs,
+                ngrams=ngrams,
+                include_pos=include_pos,
+                include_types=include_types,
+            ):
+                columns["text"].append(term.text)
+                columns["lemma"].append(term.lemma_.lower())
+                columns["ent"].append(term.label_)
+                columns["ngrams"].append(len(term))
+                columns["text_index"].append(index)
+
+        elapsed_time = time.perf_counter() - start_time
+        self.throughput_ = len(indexes) / elapsed_time if elapsed_time > 0 else None
+        if self.throughput_ is not None:
+            logger.info(
+                f"Extracted terms from {len(indexes)} documents ({self.throughput_:.0f} docs/s)"
+            )
+
+        final_res = pd.DataFrame(columns)
 
         terms = (
             final_res.groupby(["text", "lemma", "ent", "ngrams"])
@@ -281,14 +227,129 @@ class TextacyTermsExtractor:
         terms = terms.rename(columns={"text": "terms_indexed"})
         terms = terms.set_index("terms_indexed")
 
-        terms_indexed = final_res[["text", "text_index"]].drop_duplicates()
-        terms_indexed = terms_indexed.rename(columns={"text_index": index_var})
-        terms_indexed = terms_indexed.groupby(index_var)["text"].apply(list)
-        terms_indexed = terms_indexed.reset_index()
-        terms_indexed = terms_indexed.rename(columns={"text": "terms_indexed"})
-        terms_indexed = terms_indexed.set_index(index_var)
+        doc_term_matrix = DocTermMatrix.from_pairs(
+            final_res["text_index"].values,
+            final_res["text"].values,
+            doc_ids=indexes,
+            vocabulary=terms.index,
+        )
+
+        return terms, doc_term_matrix
+
+
+def get_disabled_components(
+    nlp, ngs: bool = True, ents: bool = False, ncs: bool = False
+) -> t.List[str]:
+    """
+    Lists the components of a spaCy pipeline that are not needed to extract the requested terms.
+
+    Args:
+        nlp: The spaCy pipeline.
+        ngs (bool): Whether n-grams are extracted.
+        ents (bool): Whether named entities are extracted.
+        ncs (bool): Whether noun chunks are extracted.
+
+    Returns:
+        List[str]: The names of the components that can be disabled.
+    """
+    required = set(BASE_COMPONENTS)
+    if ents:
+        required |= ENTITIES_COMPONENTS
+    if ncs:
+        required |= NOUN_CHUNKS_COMPONENTS
+
+    return [
+        name
+        for name in nlp.pipe_names
+        if nlp.get_pipe_meta(name).factory not in required
+    ]
+
+
+@lru_cache(maxsize=None)
+def _get_preprocessor() -> t.Callable[[str], str]:
+    """Builds the textacy preprocessing pipeline on first use, textacy being slow to import."""
+    import textacy.preprocessing
+
+    return textacy.preprocessing.make_pipeline(
+        textacy.preprocessing.normalize.unicode,
+        textacy.preprocessing.normalize.bullet_points,
+        textacy.preprocessing.normalize.quotation_marks,
+        textacy.preprocessing.normalize.whitespace,
+        textacy.preprocessing.normalize.hyphenated_words,
+        textacy.preprocessing.remove.brackets,
+        textacy.preprocessing.replace.currency_symbols,
+        textacy.preprocessing.remove.html_tags,
+    )
+
+
+def _preprocess_text(text: str, drop_emoji: bool, remove_punctuation: bool) -> str:
+    import textacy.preprocessing
+
+    prepro_text = _get_preprocessor()(str(text))
+    if drop_emoji:
+        prepro_text = textacy.preprocessing.replace.emojis(prepro_text, repl="")
+
+    if remove_punctuation:
+        prepro_text = textacy.preprocessing.remove.punctuation(prepro_text)
+
+    return prepro_text
+
+
+def _extract_terms(
+    doc,
+    ngs: bool,
+    ents: bool,
+    ncs: bool,
+    ngrams: t.Tuple[int, int],
+    include_pos: t.List[str],
+    include_types: t.List[str],
+) -> t.List:
+    """Returns the unique n-grams, entities and noun chunks of a spaCy document."""
+    import textacy.extract
+
+    terms = []
+
+    if ngs:
+        ngrams_terms = list(
+            textacy.extract.terms(
+                doc,
+                ngs=partial(
+                    textacy.extract.ngrams,
+                    n=ngrams,
+                    filter_punct=True,
+                    filter_stops=True,
+                    include_pos=include_pos,
+                ),
+                dedupe=False,
+            )
+        )
+
+        terms.append(ngrams_terms)
+
+    if ents:
+        ents_terms = list(
+            textacy.extract.terms(
+                doc,
+                ents=partial(textacy.extract.entities, include_types=include_types),
+                dedupe=False,
+            )
+        )
+        terms.append(ents_terms)
+
+    if ncs:
+        ncs_terms = list(
+            textacy.extract.terms(
+                doc,
+                ncs=partial(textacy.extract.noun_chunks, drop_determiners=True),
+                dedupe=False,
+            )
+        )
+
+        noun_chunks = [x for x in ncs_terms if len(x) >= 3]
+        terms.append(noun_chunks)
 
-        return terms, terms_indexed
+    final = [item for sublist in terms for item in sublist]
+    return list(set(final))
 
 
 def from_dict_to_frame(indexed_dict):
@@ -1,12 +1,15 @@
 import typing as t
 
+import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
+from scipy import sparse
 
 from bunkatopics.datamodel import ConvexHullModel, Document, Term, Topic
 from bunkatopics.logging import logger
-from bunkatopics.topic_modeling.utils import specificity
-from bunkatopics.visualization.convex_hull_plotter import get_convex_hull_coord
+from bunkatopics.topic_modeling.clustering import warm_start_centers
+from bunkatopics.topic_modeling.doc_term_matrix import DocTermMatrix
+from bunkatopics.topic_modeling.hierarchy import TopicHierarchy
+from bunkatopics.topic_modeling.utils import sparse_specificity
 
 
 class BunkaTopicModeling:
@@ -28,11 +31,15 @@ class BunkaTopicModeling:
         x_column: str = "x",
         y_column: str = "y",
         custom_clustering_model=None,
+        clustering_space: str = "2d",
+        n_components: t.Optional[int] = None,
+        convex_hulls: bool = True,
     ) -> None:
         """Constructs all the necessary attributes for the BunkaTopicModeling object.
 
         Arguments:
-            n_clusters (int, optional): Number of clusters for K-Means. Defaults to 10.
+            n_clusters (Union[int, str], optional): Number of clusters for K-Means, or "auto" to select it at the knee
+                of the inertia curve of MiniBatchKMeans fits on a sample (see `select_n_clusters`). Defaults to 10.
             ngrams (list, optional): List of n-gram lengths to consider. Defaults to [1, 2].
             name_length (int, optional): Maximum length of topic names. Defaults to 15.
             top_terms_overall (int, optional): Number of top terms to consider overall. Defaults to 1000.
@@ -41,9 +48,23 @@ class BunkaTopicModeling:
             x_column (str, optional): Column name for x-coordinate in the DataFrame. Defaults to "x".
             y_column (str, optional): Column name for y-coordinate in the DataFrame. Defaults to "y".
             custom_clustering_model (optional): Custom clustering model instance, if any. Defaults to None.
+            clustering_space (str, optional): "2d" clusters the x and y coordinates of the documents,
+                "embeddings" clusters their embeddings (the 2D map is then used for display only) with
+                a chunked MiniBatchKMeans by default. Defaults to "2d".
+            n_components (int, optional): With `clustering_space="embeddings"`, reduces the embeddings to
+                this number of PCA components before clustering them. Defaults to None.
+            convex_hulls (bool, optional): Whether to compute the convex hull of every topic. Defaults to True.
+
+        Raises:
+            ValueError: If `clustering_space` is neither "2d" nor "embeddings".
         """
+        if clustering_space not in ("2d", "embeddings"):
+            raise ValueError(
+                f"clustering_space must be '2d' or 'embeddings', got {clustering_space!r}"
+            )
 
         self.n_clusters = n_clusters
+        self.convex_hulls = convex_hulls
         self.ngrams = ngrams
         self.name_length = name_length
         self.top_terms_overall = top_terms_overall
@@ -52,11 +73,15 @@ class BunkaTopicModeling:
         self.y_column = y_column
         self.custom_clustering_model = custom_clustering_model
         self.min_docs_per_cluster = min_docs_per_cluster
+        self.clustering_space = clustering_space
+        self.n_components = n_components
 
     def fit_transform(
         self,
         docs: t.List[Document],
         terms: t.List[Term],
+        doc_term_matrix: t.Optional[DocTermMatrix] = None,
+        embeddings: t.Optional[np.ndarray] = None,
     ) -> t.List[Topic]:
         """
         Analyzes documents and terms to form topics, assigns names to these topics based on the top terms,
@@ -69,6 +94,10 @@ class BunkaTopicModeling:
         Arguments:
             docs (List[[Document]): List of Document objects representing the documents to be analyzed.
             terms (List[Term]): List of Term objects representing the terms to be considered in topic naming.
+            doc_term_matrix (DocTermMatrix, optional): The terms of every document. Defaults to the matrix
+                built from the `term_id` of the documents.
+            embeddings (np.ndarray, optional): The embedding of every document, in the order of `docs`.
+                Required with `clustering_space="embeddings"`.
         Returns:
             List[Topic]: A list of Topic objects, each representing a discovered topic with attributes
                      like name, size, centroid coordinates, and convex hull.
@@ -79,40 +108,301 @@ class BunkaTopicModeling:
             - The method calculates the centroid and convex hull for each topic based on the document embeddings.
         """
 
-        # Rest of the function remains the same...
+        df_embeddings_2D, multiplicities = self._docs_frame(docs)
+        features = self._clustering_features(df_embeddings_2D, embeddings)
+
+        if self.custom_clustering_model is not None:
+            clustering_model = self.custom_clustering_model
+            clustering_model.fit(features)
+        else:
+            clustering_model = self._kmeans(
+                self._select_n_clusters(features, multiplicities)
+            )
+            clustering_model.fit(features, sample_weight=multiplicities)
+
+        self.clustering_model_ = clustering_model
+
+        topic_ids = "bt-" + clustering_model.labels_.astype(str).astype(object)
+        for doc, topic_id in zip(docs, topic_ids):
+            doc.topic_id = topic_id
+
+        topics = self._topics_from_labels(docs, terms, [topic_ids], doc_term_matrix)[0]
+        if self.convex_hulls:
+            _add_convex_hulls(topics, docs)
+
+        # Remove in case of HDBSCAN ?
+
+        return topics
+
+    def fit_sweep(
+        self,
+        docs: t.List[Document],
+        terms: t.List[Term],
+        n_clusters: t.Sequence[int],
+        doc_term_matrix: t.Optional[DocTermMatrix] = None,
+        embeddings: t.Optional[np.ndarray] = None,
+        silhouette_sample_size: int = 10_000,
+    ) -> t.Dict[int, t.Dict[str, t.Any]]:
+        """
+        Computes the topics of several numbers of clusters at once, without modifying the documents.
+
+        The k-means of every resolution starts from the centers of the previous, coarser one,
+        completed by k-means++ sampling. The topics of all the resolutions are named from one
+        stacked (topic x term) table: every resolution partitions the same documents, so the
+        specificity of a stacked table is the specificity of every resolution. The documents are
+        neither ranked nor given convex hulls: see `Bunka.select_topics`.
+
+        Arguments:
+            docs (List[Document]): The documents, with their x and y coordinates.
+            terms (List[Term]): The terms considered in topic naming.
+            n_clusters (Sequence[int]): The numbers of clusters to compute.
+            doc_term_matrix (DocTermMatrix, optional): The terms of every document. Defaults to the matrix
+                built from the `term_id` of the documents.
+            embeddings (np.ndarray, optional): The embedding of every document, in the order of `docs`.
+                Required with `clustering_space="embeddings"`.
+            silhouette_sample_size (int, optional): The number of documents the silhouette score is computed on.
+                Defaults to 10,000.
+
+        Returns:
+            Dict[int, Dict[str, Any]]: For every number of clusters, the "topics", the "topic_ids" of the
+            documents, the fitted "clustering_model", its "inertia" and its "silhouette" score.
+
+        Raises:
+            ValueError: If a custom clustering model was given: the sweep only runs k-means.
+        """
+        from sklearn.metrics import silhouette_score
 
-        x_values = [getattr(doc, self.x_column) for doc in docs]
-        y_values = [getattr(doc, self.y_column) for doc in docs]
+        if self.custom_clustering_model is not None:
+            raise ValueError("The sweep does not support custom clustering models")
+
+        df_embeddings_2D, multiplicities = self._docs_frame(docs)
+        features = self._clustering_features(df_embeddings_2D, embeddings)
+        if self.clustering_space == "2d":
+            features = features.to_numpy(dtype=np.float64)
+
+        rng = np.random.default_rng(42)
+        silhouette_rows = np.sort(
+            rng.choice(
+                len(docs), size=min(len(docs), silhouette_sample_size), replace=False
+            )
+        )
+
+        results, previous = {}, None
+        for k in sorted(set(n_clusters)):
+            clustering_model = self._kmeans(k)
+            if previous is not None:
+                if self.clustering_space == "embeddings":
+                    # The centers live in the (reduced) space of a sample of the embeddings
+                    rows = previous.sample_rows(len(features))
+                    points = previous.reduce(
+                        features if rows is None else features[rows]
+                    )
+                    weights = multiplicities if rows is None else multiplicities[rows]
+                else:
+                    points, weights = features, multiplicities
+                init = warm_start_centers(
+                    points, previous.cluster_centers_, k, sample_weight=weights
+                )
+                if self.clustering_space == "embeddings":
+                    clustering_model.init = init
+                else:
+                    clustering_model.set_params(init=init, n_init=1)
+            clustering_model.fit(features, sample_weight=multiplicities)
+            previous = clustering_model
+
+            labels = clustering_model.labels_
+            sample_labels = labels[silhouette_rows]
+            silhouette = np.nan
+            if 1 < len(np.unique(sample_labels)) < len(silhouette_rows):
+                sample = features[silhouette_rows]
+                if self.clustering_space == "embeddings":
+                    sample = clustering_model.reduce(sample)
+                silhouette = float(silhouette_score(sample, sample_labels))
+
+            results[k] = {
+                "topic_ids": "bt-" + labels.astype(str).astype(object),
+                "clustering_model": clustering_model,
+                "inertia": float(clustering_model.inertia_),
+                "silhouette": silhouette,
+            }
+            logger.debug(
+                f"{k} clusters: inertia {results[k]['inertia']:.4g}, silhouette {silhouette:.3f}"
+            )
+
+        all_topics = self._topics_from_labels(
+            docs,
+            terms,
+            [result["topic_ids"] for result in results.values()],
+            doc_term_matrix,
+        )
+        for result, topics in zip(results.values(), all_topics):
+            result["topics"] = topics
+
+        return results
+
+    def fit_hierarchy(
+        self,
+        docs: t.List[Document],
+        terms: t.List[Term],
+        n_clusters: t.Sequence[int],
+        n_fine_clusters: t.Optional[int] = None,
+        doc_term_matrix: t.Optional[DocTermMatrix] = None,
+        embeddings: t.Optional[np.ndarray] = None,
+    ) -> TopicHierarchy:
+        """
+        Clusters the documents once into fine clusters, and builds the Ward dendrogram of their centers.
+
+        The topics of the levels `n_clusters` are named in one stacked pass and linked to their
+        parent and children. Other levels can be named later with `name_levels`. The documents are
+        not modified.
+
+        Arguments:
+            docs (List[Document]): The documents, with their x and y coordinates.
+            terms (List[Term]): The terms considered in topic naming.
+            n_clusters (Sequence[int]): The numbers of topics of the levels to name.
+            n_fine_clusters (int, optional): The number of clusters of the k-means, the finest level the
+                dendrogram can be cut at. Defaults to the largest of `n_clusters`.
+            doc_term_matrix (DocTermMatrix, optional): The terms of every document. Defaults to the matrix
+                built from the `term_id` of the documents.
+            embeddings (np.ndarray, optional): The embedding of every document, in the order of `docs`.
+                Required with `clustering_space="embeddings"`.
+
+        Returns:
+            TopicHierarchy: The dendrogram, with the topics of the named levels.
+
+        Raises:
+            ValueError: If a custom clustering model was given, or if `n_fine_clusters` is smaller than
+                one of `n_clusters`.
+        """
+        if self.custom_clustering_model is not None:
+            raise ValueError("The hierarchy does not support custom clustering models")
+        if n_fine_clusters is None:
+            n_fine_clusters = max(n_clusters)
+        if n_fine_clusters < max(n_clusters):
+            raise ValueError(
+                f"n_fine_clusters ({n_fine_clusters}) must be at least the largest of n_clusters"
+            )
 
-        # Rest of the function remains unchanged...
+        df_embeddings_2D, multiplicities = self._docs_frame(docs)
+        features = self._clustering_features(df_embeddings_2D, embeddings)
 
+        clustering_model = self._kmeans(n_fine_clusters)
+        clustering_model.fit(features, sample_weight=multiplicities)
+        self.clustering_model_ = clustering_model
+
+        labels = np.asarray(clustering_model.labels_, dtype=np.int64)
+        hierarchy = TopicHierarchy(
+            labels,
+            clustering_model.cluster_centers_,
+            np.bincount(labels, weights=multiplicities, minlength=n_fine_clusters),
+        )
+        hierarchy.clustering_model = clustering_model
+        self.name_levels(hierarchy, docs, terms, n_clusters, doc_term_matrix)
+        return hierarchy
+
+    def name_levels(
+        self,
+        hierarchy: TopicHierarchy,
+        docs: t.List[Document],
+        terms: t.List[Term],
+        n_clusters: t.Sequence[int],
+        doc_term_matrix: t.Optional[DocTermMatrix] = None,
+    ) -> None:
+        """Names the topics of the levels of `hierarchy` not named yet, and links all its levels."""
+        levels = [k for k in sorted(set(n_clusters)) if k not in hierarchy.topics]
+        if not levels:
+            return
+
+        all_topics = self._topics_from_labels(
+            docs, terms, [hierarchy.topic_ids(k) for k in levels], doc_term_matrix
+        )
+        for k, topics in zip(levels, all_topics):
+            hierarchy.topics[k] = topics
+        hierarchy.link()
+
+    def _docs_frame(self, docs: t.List[Document]) -> t.Tuple[pd.DataFrame, np.ndarray]:
+        """Returns the coordinates of the documents indexed by doc_id, and their multiplicities."""
         df_embeddings_2D = pd.DataFrame(
             {
                 "doc_id": [doc.doc_id for doc in docs],
-                self.x_column: x_values,
-                self.y_column: y_values,
+                self.x_column: [getattr(doc, self.x_column) for doc in docs],
+                self.y_column: [getattr(doc, self.y_column) for doc in docs],
             }
         )
         df_embeddings_2D = df_embeddings_2D.set_index("doc_id")
 
-        if self.custom_clustering_model is None:
-            clustering_model = KMeans(
-                n_clusters=self.n_clusters, n_init="auto", random_state=42
+        # Deduplicated documents stand for `multiplicity` input documents
+        multiplicities = np.array([doc.multiplicity for doc in docs], dtype=np.int64)
+        return df_embeddings_2D, multiplicities
+
+    def _clustering_features(
+        self, df_embeddings_2D: pd.DataFrame, embeddings: t.Optional[np.ndarray]
+    ):
+        if self.clustering_space == "embeddings":
+            if embeddings is None:
+                raise ValueError(
+                    "The embeddings of the documents are required to cluster them"
+                )
+            return embeddings
+        return df_embeddings_2D
+
+    def _select_n_clusters(self, features, multiplicities: np.ndarray) -> int:
+        """Returns `n_clusters`, or the number of clusters selected on the features when it is "auto"."""
+        self.n_clusters_curve_ = None
+        if self.n_clusters != "auto":
+            return self.n_clusters
+
+        from bunkatopics.topic_modeling.elbow_method import select_n_clusters
+
+        if isinstance(features, pd.DataFrame):
+            features = features.to_numpy(dtype=np.float64)
+        elif self.n_components is not None:
+            # Select on a sample reduced by the PCA the final model clusters in
+            reducer = self._kmeans(None).fit_reducer(features)
+            rng = np.random.default_rng(42)
+            rows = np.sort(
+                rng.choice(len(features), min(len(features), 20_000), replace=False)
             )
+            features = reducer.reduce(features[rows])
+            multiplicities = multiplicities[rows]
 
-        else:
-            clustering_model = self.custom_clustering_model
+        n_clusters, self.n_clusters_curve_ = select_n_clusters(
+            features, sample_weight=multiplicities
+        )
+        return n_clusters
+
+    def _kmeans(self, n_clusters: int):
+        """The default clustering model of the clustering space."""
+        if self.clustering_space == "embeddings":
+            from bunkatopics.topic_modeling.clustering import EmbeddingKMeans
 
-        df_embeddings_2D["topic_number"] = clustering_model.fit(
-            df_embeddings_2D
-        ).labels_.astype(str)
+            return EmbeddingKMeans(
+                n_clusters=n_clusters, n_components=self.n_components
+            )
 
-        df_embeddings_2D["topic_id"] = "bt" + "-" + df_embeddings_2D["topic_number"]
+        from sklearn.cluster import KMeans
 
-        topic_doc_dict = df_embeddings_2D["topic_id"].to_dict()
-        for doc in docs:
-            doc.topic_id = topic_doc_dict.get(doc.doc_id, [])
+        return KMeans(n_clusters=n_clusters, n_init="auto", random_state=42)
 
+    def _topics_from_labels(
+        self,
+        docs: t.List[Document],
+        terms: t.List[Term],
+        doc_topic_ids: t.Sequence[np.ndarray],
+        doc_term_matrix: t.Optional[DocTermMatrix] = None,
+    ) -> t.List[t.List[Topic]]:
+        """
+        Names and measures the topics of one or several partitions of the documents.
+
+        Arguments:
+            docs (List[Document]): The documents.
+            terms (List[Term]): The terms considered in topic naming.
+            doc_topic_ids (Sequence[np.ndarray]): For every partition, the topic_id of every document.
+            doc_term_matrix (DocTermMatrix, optional): The terms of every document.
+
+        Returns:
+            List[List[Topic]]: The topics of every partition.
+        """
         terms = [x for x in terms if x.count_terms >= self.min_count_terms]
 
         df_terms = pd.DataFrame.from_records([term.model_dump() for term in terms])
@@ -120,18 +410,57 @@ class BunkaTopicModeling:
         df_terms = df_terms.head(self.top_terms_overall)
         df_terms = df_terms[df_terms["ngrams"].isin(self.ngrams)]
 
-        df_terms_indexed = pd.DataFrame.from_records([doc.model_dump() for doc in docs])
-
-        df_terms_indexed = df_terms_indexed[["doc_id", "term_id", "topic_id"]]
-        df_terms_indexed = df_terms_indexed.explode("term_id").reset_index(drop=True)
-
-        df_terms_topics = pd.merge(df_terms_indexed, df_terms, on="term_id")
+        if doc_term_matrix is None:
+            doc_term_matrix = DocTermMatrix.from_documents(docs)
+
+        columns = doc_term_matrix.columns(df_terms["term_id"])
+        columns = columns[columns >= 0]
+        doc_rows = doc_term_matrix.rows(doc.doc_id for doc in docs)
+        in_matrix = doc_rows >= 0
+        multiplicities = np.array([doc.multiplicity for doc in docs], dtype=np.int64)
+
+        # Sparse (topic x term) contingency table of the selected terms, the topics of every
+        # partition being stacked. The margins of every partition are the same up to the number
+        # of partitions, which leaves the specificity unchanged.
+        topic_rows, doc_columns, weights, partition_topic_ids = [], [], [], []
+        offset = 0
+        for topic_ids in doc_topic_ids:
+            topic_ids = np.asarray(topic_ids, dtype=object)
+            topic_codes, unique_topic_ids = pd.factorize(
+                topic_ids[in_matrix], sort=True
+            )
+            topic_rows.append(topic_codes + offset)
+            doc_columns.append(doc_rows[in_matrix])
+            weights.append(multiplicities[in_matrix])
+            partition_topic_ids.append(np.asarray(unique_topic_ids, dtype=object))
+            offset += len(unique_topic_ids)
+
+        topic_docs = sparse.csr_matrix(
+            (
+                np.concatenate(weights),
+                (np.concatenate(topic_rows), np.concatenate(doc_columns)),
+            ),
+            shape=(offset, len(doc_term_matrix)),
+        )
+        topic_term_counts = topic_docs @ doc_term_matrix.matrix[:, columns]
 
-        df_topics_rep = specificity(
-            df_terms_topics, X="topic_id", Y="term_id", Z=None, top_n=500
+        stacked_rows, term_columns, _ = sparse_specificity(topic_term_counts, top_n=500)
+        stacked_topic_ids = np.concatenate(partition_topic_ids + [np.empty(0, object)])
+        stacked_partitions = np.repeat(
+            np.arange(len(partition_topic_ids)),
+            [len(x) for x in partition_topic_ids],
+        )
+        df_topics_rep = pd.DataFrame(
+            {
+                "partition": stacked_partitions[stacked_rows],
+                "topic_id": stacked_topic_ids[stacked_rows],
+                "term_id": doc_term_matrix.vocabulary[columns][term_columns],
+            }
         )
         df_topics_rep = (
-            df_topics_rep.groupby("topic_id")["term_id"].apply(list).reset_index()
+            df_topics_rep.groupby(["partition", "topic_id"])["term_id"]
+            .apply(list)
+            .reset_index()
         )
         df_topics_rep["name"] = df_topics_rep["term_id"].apply(lambda x: x[:100])
         df_topics_rep["name"] = df_topics_rep["name"].apply(lambda x: clean_terms(x))
@@ -141,47 +470,62 @@ class BunkaTopicModeling:
         )
         df_topics_rep["name"] = df_topics_rep["name"].apply(lambda x: " | ".join(x))
 
-        topics = [Topic(**x) for x in df_topics_rep.to_dict(orient="records")]
-
-        df_topics_docs = pd.DataFrame.from_records([doc.model_dump() for doc in docs])
-        df_topics_docs = df_topics_docs[["doc_id", "x", "y", "topic_id"]]
-        df_topics_docs = df_topics_docs.groupby("topic_id").agg(
-            size=("doc_id", "count"), x_centroid=("x", "mean"), y_centroid=("y", "mean")
+        # Sizes and centroids count every input document of a deduplicated group
+        x_values = np.array([getattr(doc, self.x_column) for doc in docs], dtype=float)
+        y_values = np.array([getattr(doc, self.y_column) for doc in docs], dtype=float)
+        df_topics_docs = pd.DataFrame(
+            {
+                "partition": np.repeat(np.arange(len(doc_topic_ids)), len(docs)),
+                "topic_id": np.concatenate(
+                    [np.asarray(x, dtype=object) for x in doc_topic_ids]
+                    + [np.empty(0, object)]
+                ),
+                "size": np.tile(multiplicities, len(doc_topic_ids)),
+                "x_centroid": np.tile(multiplicities * x_values, len(doc_topic_ids)),
+                "y_centroid": np.tile(multiplicities * y_values, len(doc_topic_ids)),
+            }
         )
-
-        topic_dict = df_topics_docs[["size", "x_centroid", "y_centroid"]].to_dict(
-            "index"
+        df_topics_docs = df_topics_docs.groupby(["partition", "topic_id"]).sum()
+        df_topics_docs["x_centroid"] /= df_topics_docs["size"]
+        df_topics_docs["y_centroid"] /= df_topics_docs["size"]
+        df_topics_rep = df_topics_rep.join(df_topics_docs, on=["partition", "topic_id"])
+
+        all_topics = [[] for _ in doc_topic_ids]
+        for record in df_topics_rep.to_dict(orient="records"):
+            partition = record.pop("partition")
+            # remove too small clusters
+            if record["size"] >= self.min_docs_per_cluster:
+                all_topics[partition].append(Topic(**record))
+
+        return all_topics
+
+
+def _add_convex_hulls(
+    topics: t.List[Topic], docs: t.List[Document], n_jobs: int = -1
+) -> None:
+    """Computes the convex hull of the documents of every topic, None when it cannot be computed."""
+    from bunkatopics.visualization.convex_hull_plotter import get_convex_hulls
+
+    topic_ids = {topic.topic_id for topic in topics}
+    topic_docs = [doc for doc in docs if doc.topic_id in topic_ids]
+    hulls = get_convex_hulls(
+        np.fromiter((doc.x for doc in topic_docs), np.float64, len(topic_docs)),
+        np.fromiter((doc.y for doc in topic_docs), np.float64, len(topic_docs)),
+        np.array([doc.topic_id for doc in topic_docs], dtype=object),
+        interpolate_curve=True,
+        n_jobs=n_jobs,
+    )
+
+    for topic in topics:
+        hull = hulls.get(topic.topic_id)
+        topic.convex_hull = (
+            None
+            if hull is None
+            else ConvexHullModel(
+                x_coordinates=list(hull[0]), y_coordinates=list(hull[1])
+            )
         )
 
-        for topic in topics:
-            topic.size = topic_dict[topic.topic_id]["size"]
-            topic.x_centroid = topic_dict[topic.topic_id]["x_centroid"]
-            topic.y_centroid = topic_dict[topic.topic_id]["y_centroid"]
-
-        # remove too small clusters
-        topics = [x for x in topics if x.size >= self.min_docs_per_cluster]
-
-        try:
-            for x in topics:
-                topic_id = x.topic_id
-                x_points = [doc.x for doc in docs if doc.topic_id == topic_id]
-                y_points = [doc.y for doc in docs if doc.topic_id == topic_id]
-
-                points = pd.DataFrame({"x": x_points, "y": y_points}).values
-
-                x_ch, y_ch = get_convex_hull_coord(points, interpolate_curve=True)
-                x_ch = list(x_ch)
-                y_ch = list(y_ch)
-
-                res = ConvexHullModel(x_coordinates=x_ch, y_coordinates=y_ch)
-                x.convex_hull = res
-        except Exception as e:
-            print(e)
-
-        # Remove in case of HDBSCAN ?
-
-        return topics
-
 
 def clean_terms(terms: t.List[str]) -> t.List[str]:
     """
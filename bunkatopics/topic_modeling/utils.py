@@ -1,11 +1,78 @@
+import random
+import threading
+import time
+import typing as t
 from collections import Counter
 
 import numpy as np
 import pandas as pd
-from langdetect import LangDetectException, detect
+from langdetect import DetectorFactory, LangDetectException, detect
+from scipy import sparse
+
 from bunkatopics.logging import logger
 
 
+def sparse_specificity(
+    counts: sparse.spmatrix,
+    top_n: int = 50,
+    row_totals: t.Optional[np.ndarray] = None,
+    column_totals: t.Optional[np.ndarray] = None,
+) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the positive chi²-style specificity of the cells of a sparse contingency table.
+
+    The specificity of a cell is `(c - e)² / e`, signed by `c - e`, where `e` is the count
+    expected under independence. A positive score requires an observed count, so only the
+    non-zero cells are scored and the dense table is never built.
+
+    Args:
+        counts (sparse.spmatrix): A (n_rows, n_columns) matrix of counts.
+        top_n (int): The number of top results to return per row.
+        row_totals (np.ndarray, optional): The margins of the rows. Defaults to the row sums.
+        column_totals (np.ndarray, optional): The margins of the columns. Defaults to the column sums.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The row, column and specificity score of the
+        top positive cells, ordered by row then by decreasing score.
+    """
+    counts = sparse.csr_matrix(counts, dtype=np.float64)
+    counts.sum_duplicates()
+    if row_totals is None:
+        row_totals = np.asarray(counts.sum(axis=1)).ravel()
+    if column_totals is None:
+        column_totals = np.asarray(counts.sum(axis=0)).ravel()
+    total = counts.sum()
+
+    rows = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+    columns = counts.indices
+    expected = row_totals[rows] * column_totals[columns] / total
+    scores = (counts.data - expected) ** 2 / expected * np.sign(counts.data - expected)
+
+    top_rows, top_columns, top_scores = [], [], []
+    for row in range(counts.shape[0]):
+        start, end = counts.indptr[row], counts.indptr[row + 1]
+        row_scores = scores[start:end]
+        positive = np.flatnonzero(row_scores > 0)
+        if len(positive) > top_n:
+            positive = positive[
+                np.argpartition(-row_scores[positive], top_n - 1)[:top_n]
+            ]
+        positive = positive[np.argsort(-row_scores[positive], kind="stable")]
+
+        top_rows.append(np.full(len(positive), row))
+        top_columns.append(columns[start:end][positive])
+        top_scores.append(row_scores[positive])
+
+    if not top_rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+
+    return (
+        np.concatenate(top_rows),
+        np.concatenate(top_columns),
+        np.concatenate(top_scores),
+    )
+
+
 def specificity(
     df: pd.DataFrame, X: str, Y: str, Z: str, top_n: int = 50
 ) -> pd.DataFrame:
@@ -22,49 +89,33 @@ def specificity(
     Returns:
         pd.DataFrame: A DataFrame containing specificity scores between X and Y.
     """
-    if Z is None:
-        Z = "count_values"
-        df[Z] = 1
-        group = df.groupby([X, Y]).agg(count_values=(Z, "sum")).reset_index()
-        cont = group.pivot(index=X, columns=Y, values=Z).fillna(0).copy()
-    else:
-        group = df.groupby([X, Y])[Z].sum().reset_index()
-        cont = group.pivot(index=X, columns=Y, values=Z).fillna(0).copy()
-
-    tx = df[X].value_counts()
-    ty = df[Y].value_counts()
+    x_codes, x_values = pd.factorize(df[X], sort=True)
+    y_codes, y_values = pd.factorize(df[Y], sort=True)
+    weights = np.ones(len(df)) if Z is None else df[Z].to_numpy(dtype=np.float64)
+    # Like groupby, rows with a missing category are ignored
+    known = (x_codes >= 0) & (y_codes >= 0)
+    x_codes, y_codes, weights = x_codes[known], y_codes[known], weights[known]
 
-    cont = cont.astype(int)
+    counts = sparse.csr_matrix(
+        (weights, (x_codes, y_codes)), shape=(len(x_values), len(y_values))
+    )
 
-    tx_df = pd.DataFrame(tx)
-    tx_df.columns = ["c"]
-    ty_df = pd.DataFrame(ty)
-    ty_df.columns = ["c"]
-
-    # Total observed values
-    n = group[Z].sum()
-
-    # Matrix product using pd.T to pivot one of the two series.
-    indep = tx_df.dot(ty_df.T) / n
-
-    cont = cont.reindex(indep.columns, axis=1)
-    cont = cont.reindex(indep.index, axis=0)
-
-    # Contingency Matrix
-    ecart = (cont - indep) ** 2 / indep
-    chi2 = ecart.sum(axis=1)
-    chi2 = chi2.sort_values(ascending=False)
-    spec = ecart * np.sign(cont - indep)
+    # The margins count the rows of `df`, whether or not they are weighted
+    rows, columns, scores = sparse_specificity(
+        counts,
+        top_n=top_n,
+        row_totals=np.bincount(x_codes, minlength=len(x_values)).astype(np.float64),
+        column_totals=np.bincount(y_codes, minlength=len(y_values)).astype(np.float64),
+    )
 
     # Edge Table of X, Y, specificity measure
-    edge = spec.unstack().reset_index()
-    edge = edge.rename(columns={0: "specificity_score"})
-    edge = edge.sort_values(
-        by=[X, "specificity_score"], ascending=[True, False]
-    ).reset_index(drop=True)
-    edge = edge[edge["specificity_score"] > 0]
-    edge = edge.groupby([X]).head(top_n)
-    edge = edge.reset_index(drop=True)
+    edge = pd.DataFrame(
+        {
+            Y: y_values[columns],
+            X: x_values[rows],
+            "specificity_score": scores,
+        }
+    )
 
     return edge
 
@@ -75,19 +126,191 @@ def most_common_element(lst):
     return most_common[0][0] if most_common else None
 
 
-def detect_language(documents):
-    langs = []
-    for doc in documents:
-        try:
-            lang = detect(doc)
-            langs.append(lang)
-        except LangDetectException:
-            logger.debug(f"Could not detect language for document: {doc}")
-            pass
+def _detect_one(document: str, max_chars: t.Optional[int] = 200) -> t.Optional[str]:
+    text = str(document)[:max_chars] if max_chars else str(document)
+    try:
+        return detect(text)
+    except LangDetectException:
+        logger.debug(f"Could not detect language for document: {text}")
+        return None
+
+
+def _seed_detector(random_state: int) -> None:
+    # langdetect draws random trials: without a seed, the same text may get another language
+    DetectorFactory.seed = random_state
+
+
+def _majority_is_settled(counts: Counter, z: float) -> bool:
+    # Wilson lower bound of the share of the leading language among the two most common
+    top = counts.most_common(2)
+    leader = top[0][1]
+    n = leader + (top[1][1] if len(top) > 1 else 0)
+    share = leader / n
+    denominator = 1 + z**2 / n
+    center = share + z**2 / (2 * n)
+    margin = z * np.sqrt(share * (1 - share) / n + z**2 / (4 * n**2))
+    return (center - margin) / denominator > 0.5
+
+
+def detect_language(
+    documents: t.Sequence[str],
+    batch_size: int = 50,
+    min_documents: int = 50,
+    max_documents: int = 2000,
+    confidence: float = 0.99,
+    time_budget: t.Optional[float] = 10.0,
+    max_chars: t.Optional[int] = 200,
+    random_state: int = 42,
+) -> t.Optional[str]:
+    """
+    Detect the majority language of a corpus from as few documents as possible.
+
+    Documents are drawn at random and scored batch by batch on their first characters.
+    The detection stops as soon as the leading language is significantly more frequent
+    than the runner-up, when `max_documents` were scored or when the time budget is spent.
+
+    Args:
+        documents (Sequence[str]): The documents of the corpus.
+        batch_size (int): The number of documents scored between two stopping checks. Default is 50.
+        min_documents (int): The number of documents scored before stopping early (or all the
+            documents of smaller corpora). Default is 50.
+        max_documents (int): The maximum number of documents scored. Default is 2000.
+        confidence (float): The confidence level of the stopping rule. Default is 0.99.
+        time_budget (float, optional): The maximum number of seconds spent, checked after each
+            batch. None disables it. Default is 10.
+        max_chars (int, optional): The number of characters of each document given to the
+            detector. None gives the whole document. Default is 200.
+        random_state (int): The seed of the document sampling and of the detector. Default is 42.
+
+    Returns:
+        Optional[str]: The language code of the majority language, None if no document could be detected.
+    """
+    from scipy.stats import norm
+
+    _seed_detector(random_state)
+
+    z = norm.ppf(1 - (1 - confidence) / 2)
+    order = list(range(len(documents)))
+    random.Random(random_state).shuffle(order)
+    order = order[:max_documents]
+
+    counts = Counter()
+    n_scored = 0
+    start_time = time.perf_counter()
+    for start in range(0, len(order), batch_size):
+        for i in order[start : start + batch_size]:
+            lang = _detect_one(documents[i], max_chars=max_chars)
+            if lang is not None:
+                counts[lang] += 1
+        n_scored = min(start + batch_size, len(order))
+
+        if not counts or n_scored < min_documents:
+            continue
+        if _majority_is_settled(counts, z):
+            break
+        if time_budget is not None and time.perf_counter() - start_time > time_budget:
+            logger.debug("Language detection stopped by the time budget")
+            break
+
+    logger.debug(f"Language detection on {n_scored} documents: {dict(counts)}")
+    return counts.most_common(1)[0][0] if counts else None
+
+
+def detect_document_languages(
+    documents: t.Sequence[str],
+    batch_size: int = 1000,
+    time_budget: t.Optional[float] = None,
+    max_chars: t.Optional[int] = 200,
+    random_state: int = 42,
+) -> t.List[t.Optional[str]]:
+    """
+    Detect the language of every document, for corpora mixing several languages.
+
+    The documents are scored in order, batch by batch. Without a time budget, every document
+    is scored: the time grows linearly with the corpus, at about 200 documents per second.
+
+    Args:
+        documents (Sequence[str]): The documents.
+        batch_size (int): The number of documents scored between two checks of the time budget.
+            Default is 1000.
+        time_budget (float, optional): The maximum number of seconds spent, checked after each
+            batch. The documents left are not scored. None scores every document. Default is None.
+        max_chars (int, optional): The number of characters of each document given to the
+            detector. None gives the whole document. Default is 200.
+        random_state (int): The seed of the detector. Default is 42.
+
+    Returns:
+        List[Optional[str]]: The language code of every document, None when it could not be detected
+        or was left unscored by the time budget.
+    """
+    _seed_detector(random_state)
+
+    languages: t.List[t.Optional[str]] = [None] * len(documents)
+    start_time = time.perf_counter()
+    for start in range(0, len(documents), batch_size):
+        for i in range(start, min(start + batch_size, len(documents))):
+            languages[i] = _detect_one(documents[i], max_chars=max_chars)
+        n_scored = min(start + batch_size, len(documents))
+
+        if (
+            time_budget is not None
+            and n_scored < len(documents)
+            and time.perf_counter() - start_time > time_budget
+        ):
+            logger.warning(
+                f"Language detection stopped by the time budget: {len(documents) - n_scored} "
+                "documents were left without a language"
+            )
+            break
+
+    return languages
+
+
+# Process-wide registry of the loaded spaCy pipelines, shared by every extractor
+_spacy_models = {}
+_spacy_models_lock = threading.Lock()
+
+
+def load_spacy_model(model_name: str, download: bool = True):
+    """
+    Loads a spaCy pipeline once per process and returns the shared instance.
+
+    The pipeline is downloaded first if it is not installed. Later calls, from any
+    Bunka instance or worker task, return the already loaded pipeline.
+
+    Args:
+        model_name (str): The name of the spaCy pipeline, e.g. "en_core_web_sm".
+        download (bool): Whether to download the pipeline if it is not installed. Default is True.
+
+    Returns:
+        spacy.language.Language: The loaded pipeline.
+
+    Raises:
+        OSError: If the pipeline is not installed and `download` is False.
+    """
+    nlp = _spacy_models.get(model_name)
+    if nlp is not None:
+        return nlp
+
+    import spacy
 
-    res = most_common_element(langs)
+    with _spacy_models_lock:
+        # Another thread may have loaded the model while we were waiting
+        nlp = _spacy_models.get(model_name)
+        if nlp is None:
+            try:
+                nlp = spacy.load(model_name)
+            except OSError:
+                if not download:
+                    raise
+                # The model is not installed, so download it
+                logger.info(f"Downloading the spaCy model {model_name}")
+                spacy.cli.download(model_name)
+                nlp = spacy.load(model_name)
+            _spacy_models[model_name] = nlp
+            logger.debug(f"Loaded the spaCy model {model_name}")
 
-    return res
+    return nlp
 
 
 detect_language_to_spacy_model = {
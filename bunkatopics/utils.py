@@ -1,11 +1,14 @@
 import os
+import threading
 import typing as t
 
 import jsonlines
+import numpy as np
 import pandas as pd
-import tiktoken
 
+from bunkatopics import serialization
 from bunkatopics.datamodel import Document, Term, Topic
+from bunkatopics.embeddings import EmbeddingMatrix, iter_batches
 
 
 def _filter_hdbscan(topics: t.List[Topic], docs: t.List[Document]):
@@ -27,6 +30,18 @@ def _filter_hdbscan(topics: t.List[Topic], docs: t.List[Document]):
     return filtered_topics, filtered_docs
 
 
+def _merge_terms(terms: t.List[Term], new_terms: t.List[Term]) -> t.List[Term]:
+    # Add the counts of terms already known and append the others, most frequent first
+    merged = {term.term_id: term.model_copy() for term in terms}
+    for term in new_terms:
+        if term.term_id in merged:
+            merged[term.term_id].count_terms += term.count_terms
+        else:
+            merged[term.term_id] = term.model_copy()
+
+    return sorted(merged.values(), key=lambda term: term.count_terms, reverse=True)
+
+
 def _create_topic_dfs(topics: t.List[Topic], docs: t.List[Document]):
     df_topics = pd.DataFrame.from_records([topic.model_dump() for topic in topics])
 
@@ -70,24 +85,66 @@ class BunkaError(Exception):
 
 
 def save_bunka_models(bunka, path="bunka_dump"):
+    """Saves a Bunka model in the columnar format of `bunkatopics.serialization`."""
     os.makedirs(path, exist_ok=True)
 
-    for doc in bunka.docs:
-        list_of_floats = [float(value) for value in doc.embedding]
-        doc.embedding = list_of_floats
-
-    # Dump the data into JSONL files
-    with jsonlines.open(path + "/bunka_docs.jsonl", mode="w") as writer:
-        for item in bunka.docs:
-            writer.write(item.dict())
-
-    # Dump the data into JSONL files
-    with jsonlines.open(path + "/bunka_terms.jsonl", mode="w") as writer:
-        for item in bunka.terms:
-            writer.write(item.dict())
+    serialization.write_documents(bunka.docs, path)
+    serialization.write_terms(bunka.terms, path)
+    serialization.write_embeddings(bunka.embeddings, path)
+    serialization.write_projection_model(bunka.projection_model, path)
+
+    # Files of a previous save that the model does not have anymore
+    stale_files = []
+
+    if bunka.doc_term_matrix is not None:
+        serialization.write_doc_term_matrix(bunka.doc_term_matrix, path)
+    else:
+        stale_files += [
+            serialization.DOC_TERM_MATRIX_FILE,
+            serialization.DOC_TERM_ROWS_FILE,
+            serialization.VOCABULARY_FILE,
+        ]
+
+    if getattr(bunka, "topics", None):
+        serialization.write_topics(bunka.topics, path)
+    else:
+        stale_files.append(serialization.TOPICS_FILE)
+
+    topics_params = getattr(bunka, "topics_params_", None)
+    clustering_model = getattr(bunka, "clustering_model_", None)
+    if clustering_model is not None:
+        serialization.write_clustering_model(clustering_model, path)
+    else:
+        stale_files.append(serialization.CLUSTERING_MODEL_FILE)
+
+    for file_name in stale_files:
+        if os.path.exists(os.path.join(path, file_name)):
+            os.remove(os.path.join(path, file_name))
+
+    serialization.write_settings(
+        {
+            "detected_language": getattr(bunka, "detected_language", None),
+            "language_name": getattr(bunka, "language_name", None),
+            "embedding_model": bunka.embedding_backend.model_id,
+            # The fitted clustering model is pickled on its own
+            "topics_params": (
+                {
+                    **topics_params,
+                    "custom_clustering_model": topics_params["custom_clustering_model"]
+                    is not None,
+                }
+                if topics_params is not None
+                else None
+            ),
+            "fit_params": getattr(bunka, "fit_params_", None),
+            "duplicates": bunka.duplicates_,
+            "document_languages": getattr(bunka, "document_languages_", None),
+        },
+        path,
+    )
 
 
-# Define a function to read documents from a JSONL file
+# Readers of the JSONL dumps written by older versions
 def read_documents_from_jsonl(file_path):
     documents = []
     with jsonlines.open(file_path, mode="r") as reader:
@@ -97,6 +154,19 @@ def read_documents_from_jsonl(file_path):
     return documents
 
 
+def read_embeddings(path):
+    # Older dumps stored one list of floats per document
+    doc_ids, vectors = [], []
+    with jsonlines.open(path + "/bunka_docs.jsonl", mode="r") as reader:
+        for item in reader:
+            if item.get("embedding"):
+                doc_ids.append(item["doc_id"])
+                vectors.append(item["embedding"])
+    if not vectors:
+        return EmbeddingMatrix(np.empty((0, 0), dtype=np.float32), [])
+    return EmbeddingMatrix(np.asarray(vectors, dtype=np.float32), doc_ids)
+
+
 def read_terms_from_jsonl(file_path):
     terms = []
     with jsonlines.open(file_path, mode="r") as reader:
@@ -106,11 +176,78 @@ def read_terms_from_jsonl(file_path):
     return terms
 
 
-enc = tiktoken.get_encoding("cl100k_base")
+_encoding = None
+_encoding_lock = threading.Lock()
 
 
-def count_tokens(docs):
-    tokens = [enc.encode(x) for x in docs]
-    sum_tokens = [len(x) for x in tokens]
-    total_number_of_tokens = sum(sum_tokens)
+def _get_encoding():
+    # The tokenizer is only loaded when tokens are first counted
+    global _encoding
+    if _encoding is None:
+        with _encoding_lock:
+            if _encoding is None:
+                import tiktoken
+
+                _encoding = tiktoken.get_encoding("cl100k_base")
+    return _encoding
+
+
+def count_tokens(
+    docs: t.Iterable[str], batch_size: int = 1000, num_threads: int = 8
+) -> int:
+    """
+    Counts the tokens of the documents, batch by batch with several threads.
+
+    Args:
+        docs (Iterable[str]): The documents.
+        batch_size (int): The number of documents encoded at once. Default is 1000.
+        num_threads (int): The number of threads encoding a batch. Default is 8.
+
+    Returns:
+        int: The total number of tokens.
+    """
+    encoding = _get_encoding()
+    total_number_of_tokens = 0
+    for batch in iter_batches(docs, batch_size):
+        tokens = encoding.encode_ordinary_batch(batch, num_threads=num_threads)
+        total_number_of_tokens += sum(len(x) for x in tokens)
     return total_number_of_tokens
+
+
+def estimate_tokens(
+    docs: t.Sequence[str],
+    sample_size: int = 1000,
+    confidence: float = 0.95,
+    random_state: int = 42,
+) -> t.Tuple[int, int]:
+    """
+    Estimates the number of tokens of the documents from a random sample.
+
+    Args:
+        docs (Sequence[str]): The documents.
+        sample_size (int): The number of documents encoded. Default is 1000.
+        confidence (float): The confidence level of the margin. Default is 0.95.
+        random_state (int): The seed of the sample. Default is 42.
+
+    Returns:
+        Tuple[int, int]: The estimated total number of tokens and its margin of error. The count is
+        exact, with a margin of 0, when there are no more documents than `sample_size`.
+    """
+    if len(docs) <= sample_size:
+        return count_tokens(docs), 0
+
+    from scipy.stats import norm
+
+    rng = np.random.default_rng(random_state)
+    sample = [docs[i] for i in rng.choice(len(docs), sample_size, replace=False)]
+    lengths = np.array(
+        [len(x) for x in _get_encoding().encode_ordinary_batch(sample)], dtype=float
+    )
+
+    # Standard error of the total, with the finite population correction
+    n_docs = len(docs)
+    correction = np.sqrt((n_docs - sample_size) / (n_docs - 1))
+    standard_error = n_docs * lengths.std(ddof=1) / np.sqrt(sample_size) * correction
+    z = norm.ppf(1 - (1 - confidence) / 2)
+
+    return int(round(n_docs * lengths.mean())), int(np.ceil(z * standard_error))
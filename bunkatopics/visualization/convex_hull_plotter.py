@@ -2,6 +2,8 @@ import numpy as np
 from scipy import interpolate
 from scipy.spatial import ConvexHull
 
+from bunkatopics.logging import logger
+
 
 def get_convex_hull_coord(points: np.array, interpolate_curve: bool = True) -> tuple:
     """
@@ -40,3 +42,54 @@ def get_convex_hull_coord(points: np.array, interpolate_curve: bool = True) -> t
         interp_y = y_hull
 
     return interp_x, interp_y
+
+
+def get_convex_hulls(
+    x: np.ndarray,
+    y: np.ndarray,
+    labels: np.ndarray,
+    interpolate_curve: bool = True,
+    n_jobs: int = -1,
+) -> dict:
+    """
+    Calculate the convex hull coordinates of the points of every label.
+
+    The points are grouped with a single sort of the labels, and the hulls of the groups are
+    computed in parallel threads. A group whose hull cannot be computed (fewer than 3 points,
+    collinear points...) gets None instead of stopping the other groups.
+
+    Args:
+        x (np.ndarray): The x coordinates of the points.
+        y (np.ndarray): The y coordinates of the points.
+        labels (np.ndarray): The label of every point.
+        interpolate_curve (bool): Whether to interpolate the convex hulls.
+        n_jobs (int): The number of threads, -1 for all the CPUs.
+
+    Returns:
+        dict: The (x, y) coordinates of the convex hull of every label, or None.
+    """
+    from joblib import Parallel, delayed
+
+    points = np.column_stack([x, y]).astype(np.float64, copy=False)
+    unique_labels, codes = np.unique(np.asarray(labels), return_inverse=True)
+    order = np.argsort(codes, kind="stable")
+    groups = (
+        np.split(points[order], np.flatnonzero(np.diff(codes[order])) + 1)
+        if len(order)
+        else []
+    )
+
+    def hull(label, group_points):
+        try:
+            return get_convex_hull_coord(group_points, interpolate_curve)
+        except Exception as e:
+            # Qhull errors span many lines
+            message = (str(e).splitlines() or [repr(e)])[0]
+            logger.warning(f"No convex hull for {label}: {message}")
+            return None
+
+    hulls = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(hull)(label, group_points)
+        for label, group_points in zip(unique_labels, groups)
+    )
+    return dict(zip(unique_labels.tolist(), hulls))
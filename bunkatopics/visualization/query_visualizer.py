@@ -4,15 +4,16 @@ import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from sklearn.metrics.pairwise import cosine_similarity
 
 from bunkatopics.datamodel import Document
+from bunkatopics.embeddings import EmbeddingMatrix, as_embedding_backend
 from bunkatopics.visualization.visualization_utils import wrap_by_word
 
 
 def plot_query(
     embedding_model,
     docs: t.List[Document],
+    embeddings: EmbeddingMatrix,
     query: str = "What is firearm?",
     min_score: float = 0.7,
     height: int = 600,
@@ -22,8 +23,9 @@ def plot_query(
     Visualize the similarity scores between a query and a list of documents.
 
     Args:
-        embedding_model: The embedding model used for encoding text.
-        docs (List[Document]): A list of Document objects containing content and embeddings.
+        embedding_model: The embedding model used for encoding text, or an EmbeddingBackend.
+        docs (List[Document]): A list of Document objects containing content.
+        embeddings (EmbeddingMatrix): The embedding matrix referenced by the documents.
         query (str): The query text for which similarity scores are calculated (default is "What is firearm?").
         min_score (float): The minimum similarity score for including a document (default is 0.7).
         height (int): Height of the visualization plot (default is 600).
@@ -34,14 +36,13 @@ def plot_query(
         float: The percentage of documents with similarity scores above the minimum score.
     """
 
-    query_embedding = embedding_model.embed_query(query)
+    query_embedding = as_embedding_backend(embedding_model).encode_query(query)
 
     ids = [x.doc_id for x in docs]
     contents = [x.content for x in docs]
-    embeddings = [x.embedding for x in docs]
-    embeddings_array = np.array(embeddings)
-    similarities = cosine_similarity([query_embedding], embeddings_array)
-    similarities = similarities.tolist()[0]
+    similarities = embeddings.cosine_similarity(
+        query_embedding, rows=embeddings.rows_of(docs)
+    )
 
     df_unique = pd.DataFrame({"ids": ids, "score": similarities, "content": contents})
     df_unique = df_unique.sort_values("score", ascending=False).reset_index(drop=True)
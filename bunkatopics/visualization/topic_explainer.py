@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 
 from bunkatopics.datamodel import Document
+from bunkatopics.topic_modeling.doc_term_matrix import DocTermMatrix
 from bunkatopics.topic_modeling.utils import specificity
 
 
@@ -16,6 +17,7 @@ def plot_specific_terms(
     ngrams=[2],
     quantile=0.80,
     top_n=20,
+    doc_term_matrix: t.Optional[DocTermMatrix] = None,
 ):
     """
     Visualize the specificity scores of terms associated with two groups along a continuum.
@@ -28,6 +30,8 @@ def plot_specific_terms(
         ngrams (List[int]): List of n-grams to consider (default is [2]).
         quantile (float): Quantile threshold for grouping terms (default is 0.80).
         top_n (int): Number of top specific terms to visualize (default is 20).
+        doc_term_matrix (DocTermMatrix, optional): The terms of every document (default is the matrix
+            built from the `term_id` of the documents).
 
     Returns:
         None: Displays a plot of specificity scores for terms.
@@ -40,32 +44,35 @@ def plot_specific_terms(
         if x.continuum.id == id
     ]
     doc_id = [x.doc_id for x in docs]
-    content = [x.content for x in docs]
 
-    df_distances = pd.DataFrame(
-        {"doc_id": doc_id, "distances": distances, "content": content}
-    )
-
-    df_terms = pd.DataFrame(
-        {
-            "doc_id": [x.doc_id for x in docs],
-            "term_id": [x.term_id for x in docs],
-        }
-    )
-
-    df_terms = df_terms.explode("term_id").reset_index(drop=True)
-    df_terms_docs = pd.merge(df_distances, df_terms, on="doc_id")
-    df_terms_docs["group"] = np.nan
-
-    df_terms_docs["group"][
-        df_terms_docs["distances"] > df_distances["distances"].quantile(quantile)
-    ] = "1"
-    df_terms_docs["group"][
-        df_terms_docs["distances"] <= df_distances["distances"].quantile(1 - quantile)
-    ] = "0"
-    df_terms_docs = df_terms_docs.sort_values("distances", ascending=False)
-    df_terms_docs = (
-        df_terms_docs.groupby(["group", "term_id"])["doc_id"].count().reset_index()
+    distances = pd.Series(distances, index=doc_id)
+    low = distances <= distances.quantile(1 - quantile)
+    high = (distances > distances.quantile(quantile)) & ~low
+
+    if doc_term_matrix is None:
+        doc_term_matrix = DocTermMatrix.from_documents(docs)
+
+    # Count the documents of each group containing each term
+    rows = doc_term_matrix.rows(doc_id)
+    group_counts = {}
+    for group, in_group in (("0", low.values), ("1", high.values)):
+        group_rows = rows[in_group & (rows >= 0)]
+        group_counts[group] = np.asarray(
+            doc_term_matrix.matrix[group_rows].sum(axis=0)
+        ).ravel()
+
+    df_terms_docs = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "group": group,
+                    "term_id": doc_term_matrix.vocabulary[np.flatnonzero(counts)],
+                    "doc_id": counts[np.flatnonzero(counts)],
+                }
+            )
+            for group, counts in group_counts.items()
+        ],
+        ignore_index=True,
     )
 
     df_terms_docs["lenght"] = df_terms_docs["term_id"].apply(
@@ -271,21 +271,21 @@ class TopicVisualizer:
             )
 
         if self.convex_hull:
-            try:
-                for topic in topics:
-                    # Create a Scatter plot with the convex hull coordinates
-                    trace = go.Scatter(
-                        x=topic.convex_hull.x_coordinates,
-                        y=topic.convex_hull.y_coordinates,
-                        mode="lines",
-                        name="Convex Hull",
-                        line=dict(color="grey", dash="dot"),
-                        hoverinfo="none",
-                        showlegend=False,
-                    )
-                    fig_density.add_trace(trace)
-            except Exception as e:
-                print(e)
+            for topic in topics:
+                # Topics whose convex hull could not be computed are not outlined
+                if topic.convex_hull is None:
+                    continue
+                # Create a Scatter plot with the convex hull coordinates
+                trace = go.Scatter(
+                    x=topic.convex_hull.x_coordinates,
+                    y=topic.convex_hull.y_coordinates,
+                    mode="lines",
+                    name="Convex Hull",
+                    line=dict(color="grey", dash="dot"),
+                    hoverinfo="none",
+                    showlegend=False,
+                )
+                fig_density.add_trace(trace)
 
         if color is not None:
             fig_density.update_layout(
@@ -24,6 +24,7 @@ dependencies = [
     "FlagEmbedding>=1.2.8",
     "tiktoken==0.6.0",
     "langdetect>=1.0.9",
+    "pyarrow>=14.0.0",
 ]
 
 test = ["nbformat>=4.2.0", "nbconvert>=7.16.3", "jupyter>=1.00"]
@@ -48,6 +49,8 @@ dev = test + format_dependencies + docs_dependencies
 
 front = ["streamlit"]
 
+tsne = ["openTSNE>=1.0.0"]
+
 with open("README.md", "r") as doc:
     long_description = doc.read()
 
@@ -88,6 +91,7 @@ setup(
         "test": test,
         "docs": docs_dependencies,
         "format": format_dependencies,
+        "tsne": tsne,
     },
     python_requires=">=3.9",
 )
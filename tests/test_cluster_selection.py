@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+
+from bunkatopics.topic_modeling.elbow_method import (
+    compute_knee,
+    find_knee,
+    select_n_clusters,
+)
+
+
+class TestClusterSelection(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        centers = rng.uniform(-20, 20, size=(4, 2))
+        self.X = np.vstack([center + rng.normal(size=(100, 2)) for center in centers])
+
+    def test_find_knee(self):
+        x = np.arange(1, 11)
+        y = np.array([100, 40, 10, 9, 8, 7, 6, 5, 4, 3])
+        self.assertEqual(find_knee(x, y), 3)
+        self.assertIsNone(find_knee(x, np.ones(10)))
+
+    def test_select_n_clusters(self):
+        n_clusters, curve = select_n_clusters(self.X, range(2, 11))
+
+        self.assertEqual(n_clusters, 4)
+        self.assertEqual(curve["n_clusters"].tolist(), list(range(2, 11)))
+        self.assertTrue((np.diff(curve["inertia"]) < 0).all())
+
+        n_clusters, _ = select_n_clusters(self.X, range(2, 11), method="silhouette")
+        self.assertEqual(n_clusters, 4)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            select_n_clusters(self.X, method="gap")
+
+    def test_compute_knee(self):
+        n_clusters = compute_knee(self.X, 10)
+        self.assertIsInstance(n_clusters, int)
+        self.assertIn(n_clusters, range(2, 11))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+from sklearn.datasets import make_blobs
+from sklearn.metrics import adjusted_rand_score
+
+from bunkatopics.topic_modeling import BunkaTopicModeling, EmbeddingKMeans
+
+
+class TestEmbeddingKMeans(unittest.TestCase):
+    def setUp(self):
+        self.X, self.y = make_blobs(
+            n_samples=3000, centers=5, n_features=32, random_state=0
+        )
+
+    def test_finds_the_clusters(self):
+        model = EmbeddingKMeans(n_clusters=5).fit(self.X)
+        self.assertEqual(model.cluster_centers_.dtype, np.float32)
+        self.assertAlmostEqual(adjusted_rand_score(self.y, model.labels_), 1.0)
+
+    def test_chunked_fit_with_pca(self):
+        model = EmbeddingKMeans(
+            n_clusters=5, n_components=8, chunk_size=500, batch_size=256
+        ).fit(self.X, sample_weight=np.ones(len(self.X)))
+
+        self.assertEqual(model.cluster_centers_.shape, (5, 8))
+        self.assertAlmostEqual(adjusted_rand_score(self.y, model.labels_), 1.0)
+        np.testing.assert_array_equal(
+            model.transform(self.X[:10]).argmin(axis=1), model.labels_[:10]
+        )
+
+    def test_chunked_labels_and_inertia(self):
+        model = EmbeddingKMeans(n_clusters=5, chunk_size=700)
+        model.fit(self.X, sample_weight=np.arange(len(self.X)) % 3 + 1)
+
+        distances = model.transform(self.X)
+        np.testing.assert_array_equal(model.labels_, distances.argmin(axis=1))
+        expected = (distances.min(axis=1).astype(np.float64) ** 2) @ (
+            np.arange(len(self.X)) % 3 + 1
+        )
+        self.assertAlmostEqual(model.inertia_, expected, delta=1e-4 * expected)
+
+    def test_auto_n_clusters_in_the_reduced_space(self):
+        topic_model = BunkaTopicModeling(
+            n_clusters="auto", clustering_space="embeddings", n_components=8
+        )
+        n_clusters = topic_model._select_n_clusters(self.X, np.ones(len(self.X)))
+
+        self.assertEqual(n_clusters, 5)
+        # The PCA fitted by the final model is the one the selection used
+        reducer = EmbeddingKMeans(n_components=8).fit_reducer(self.X)
+        model = EmbeddingKMeans(n_clusters=5, n_components=8).fit(self.X)
+        np.testing.assert_allclose(
+            model.reduce(self.X[:10]), reducer.reduce(self.X[:10]), atol=1e-5
+        )
+
+    def test_unknown_clustering_space(self):
+        with self.assertRaises(ValueError):
+            BunkaTopicModeling(clustering_space="3d")
+
+
+if __name__ == "__main__":
+    unittest.main()
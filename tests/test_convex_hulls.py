@@ -0,0 +1,54 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from bunkatopics.visualization import convex_hull_plotter
+from bunkatopics.visualization.convex_hull_plotter import (
+    get_convex_hull_coord,
+    get_convex_hulls,
+)
+
+
+class TestConvexHulls(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.labels = rng.choice(["bt-0", "bt-1", "bt-2"], size=300)
+        self.x = rng.normal(size=300) + (self.labels == "bt-1") * 5
+        self.y = rng.normal(size=300)
+
+    def test_same_hulls_as_each_topic(self):
+        hulls = get_convex_hulls(self.x, self.y, self.labels)
+
+        self.assertEqual(sorted(hulls), ["bt-0", "bt-1", "bt-2"])
+        for label, (x_hull, y_hull) in hulls.items():
+            mask = self.labels == label
+            expected = get_convex_hull_coord(
+                np.column_stack([self.x[mask], self.y[mask]])
+            )
+            np.testing.assert_allclose(x_hull, expected[0])
+            np.testing.assert_allclose(y_hull, expected[1])
+
+    def test_failures_are_isolated(self):
+        # Two points have no convex hull
+        labels = np.append(self.labels, ["bt-3", "bt-3"])
+        x, y = np.append(self.x, [0.0, 1.0]), np.append(self.y, [0.0, 1.0])
+        hulls = get_convex_hulls(x, y, labels, n_jobs=2)
+
+        self.assertIsNone(hulls["bt-3"])
+        self.assertEqual(sum(hull is not None for hull in hulls.values()), 3)
+
+    def test_failures_without_message(self):
+        with mock.patch.object(
+            convex_hull_plotter,
+            "get_convex_hull_coord",
+            side_effect=[ValueError(), (np.zeros(3), np.zeros(3)), ValueError()],
+        ):
+            hulls = get_convex_hulls(self.x, self.y, self.labels, n_jobs=1)
+
+        self.assertIsNone(hulls["bt-0"])
+        self.assertIsNotNone(hulls["bt-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from bunkatopics.cleaning.deduplication import (
+    exact_duplicates,
+    find_duplicates,
+    minhash_signatures,
+)
+
+
+class TestDeduplication(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        vocabulary = [f"word{i}" for i in range(2000)]
+        self.texts = [" ".join(rng.choice(vocabulary, 30)) for _ in range(200)]
+
+    def test_exact_duplicates_are_normalized(self):
+        representatives = exact_duplicates(["A  text", "a text ", "Other", "", ""])
+        np.testing.assert_array_equal(representatives, [0, 0, 2, 3, 3])
+
+    def test_near_duplicates(self):
+        texts = self.texts + ["RT @user: " + text for text in self.texts[:50]]
+        representatives = find_duplicates(texts, method="near")
+
+        np.testing.assert_array_equal(representatives[:200], np.arange(200))
+        np.testing.assert_array_equal(representatives[200:], np.arange(50))
+
+    def test_exact_method_keeps_near_duplicates(self):
+        texts = self.texts[:3] + ["RT " + self.texts[0]]
+        np.testing.assert_array_equal(
+            find_duplicates(texts, method="exact"), [0, 1, 2, 3]
+        )
+
+    def test_signatures_estimate_jaccard(self):
+        tokens = self.texts[0].split()
+        half = " ".join(tokens[:15] + self.texts[1].split()[:15])
+        signatures = minhash_signatures([self.texts[0], half], num_perm=256)
+        similarity = (signatures[0] == signatures[1]).mean()
+        # 13 shared 3-grams out of 28 + 28 - 13
+        self.assertAlmostEqual(similarity, 13 / 43, delta=0.1)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            find_duplicates(self.texts, method="fuzzy")
+
+
+if __name__ == "__main__":
+    unittest.main()
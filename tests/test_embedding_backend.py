@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+
+from bunkatopics.embeddings.backend import EmbeddingBackend, as_embedding_backend
+
+
+class EncodeModel:
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        return [[len(x), 1.0] for x in texts]
+
+
+class LangchainModel:
+    def embed_documents(self, texts):
+        return [[1.0, 0.0] for _ in texts]
+
+    def embed_query(self, text):
+        return [0.0, 2.0]
+
+
+class TestEmbeddingBackend(unittest.TestCase):
+    def test_duplicates_are_encoded_once(self):
+        model = EncodeModel()
+        backend = EmbeddingBackend(model, batch_size=2, normalize=False)
+        embeddings = backend.encode(["ab", "c", "ab", "def", "c"])
+
+        self.assertEqual(model.calls, [["ab", "c"], ["def"]])
+        self.assertEqual(embeddings.dtype, np.float32)
+        np.testing.assert_array_equal(embeddings[:, 0], [2, 1, 2, 3, 1])
+
+    def test_threads_keep_the_order(self):
+        texts = ["x" * i for i in range(1, 50)]
+        single = EmbeddingBackend(EncodeModel(), batch_size=4).encode(texts)
+        threaded = EmbeddingBackend(EncodeModel(), batch_size=4, num_threads=3).encode(
+            texts
+        )
+        np.testing.assert_array_equal(single, threaded)
+
+    def test_normalization(self):
+        embeddings = EmbeddingBackend(EncodeModel()).encode(["abc", "d"])
+        np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-6)
+
+        backend = EmbeddingBackend(EncodeModel(), normalize=False)
+        self.assertNotEqual(EmbeddingBackend(EncodeModel()).model_id, backend.model_id)
+
+    def test_langchain_queries(self):
+        backend = as_embedding_backend(LangchainModel())
+        np.testing.assert_array_equal(backend.encode(["a"]), [[1.0, 0.0]])
+        np.testing.assert_array_equal(backend.encode_query("a"), [0.0, 1.0])
+        self.assertIs(as_embedding_backend(backend), backend)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import tempfile
+import unittest
+
+import numpy as np
+
+from bunkatopics.embeddings.cache import EmbeddingCache
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.calls = []
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def encode(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[len(x), i] for i, x in enumerate(texts)], dtype=np.float32)
+
+    def test_only_misses_are_encoded(self):
+        cache = EmbeddingCache(self.tmp_dir.name)
+        first = cache.get_or_compute("model", ["a b", "cde"], self.encode)
+        second = cache.get_or_compute("model", ["a  b ", "fg", "cde"], self.encode)
+
+        self.assertEqual(self.calls, [["a b", "cde"], ["fg"]])
+        np.testing.assert_array_equal(second[0], first[0])
+        np.testing.assert_array_equal(second[2], first[1])
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+    def test_keys_depend_on_model(self):
+        cache = EmbeddingCache(self.tmp_dir.name)
+        cache.get_or_compute("model-a", ["text"], self.encode)
+        cache.get_or_compute("model-b", ["text"], self.encode)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_lru_eviction(self):
+        cache = EmbeddingCache(self.tmp_dir.name, max_entries=2)
+        cache.get_or_compute("model", ["a"], self.encode)
+        cache.get_or_compute("model", ["b"], self.encode)
+        cache.get("model", ["a"])  # "a" becomes the most recently used
+        cache.get_or_compute("model", ["c"], self.encode)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("model", ["b"])[0])
+        self.assertIsNotNone(cache.get("model", ["a"])[0])
+
+    def test_size_is_kept_up_to_date(self):
+        cache = EmbeddingCache(self.tmp_dir.name)
+        cache.put("model", ["a", "b", "a"], np.ones((3, 4)))
+        cache.put("model", ["b", "c"], np.ones((2, 4)))
+        self.assertEqual(len(cache), 3)
+        cache.close()
+
+        # The size of an existing cache is counted when it is opened
+        cache = EmbeddingCache(self.tmp_dir.name)
+        self.assertEqual(len(cache), 3)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_caches_sharing_a_file(self):
+        first = EmbeddingCache(self.tmp_dir.name, max_entries=3)
+        second = EmbeddingCache(self.tmp_dir.name, max_entries=3)
+        first.put("model", ["a", "b"], np.ones((2, 4)))
+        second.put("model", ["c", "d"], np.ones((2, 4)))
+        first.put("model", ["e"], np.ones((1, 4)))
+
+        # The cap holds for the rows written by both caches
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 3)
+        self.assertEqual(
+            second._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0],
+            3,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
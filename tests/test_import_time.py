@@ -0,0 +1,59 @@
+import json
+import subprocess
+import sys
+import unittest
+
+# Seconds allowed for `import bunkatopics` in a fresh interpreter
+IMPORT_TIME_BUDGET = 2.0
+
+# Dependencies only needed to visualize, use widgets or run a model
+DEFERRED_MODULES = [
+    "FlagEmbedding",
+    "IPython",
+    "ipywidgets",
+    "kneed",
+    "langchain",
+    "langchain_community",
+    "langchain_core",
+    "matplotlib",
+    "numba",
+    "plotly",
+    "psutil",
+    "sentence_transformers",
+    "sklearn",
+    "spacy",
+    "textacy",
+    "tiktoken",
+    "torch",
+    "umap",
+]
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import bunkatopics
+print(json.dumps({"time": time.perf_counter() - start, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_bunkatopics():
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+    def test_heavy_dependencies_are_deferred(self):
+        modules = set(import_bunkatopics()["modules"])
+        imported = [name for name in DEFERRED_MODULES if name in modules]
+        self.assertEqual(imported, [])
+
+    def test_import_time_budget(self):
+        # The first run also compiles the bytecode: keep the best of three
+        best = min(import_bunkatopics()["time"] for _ in range(3))
+        self.assertLess(best, IMPORT_TIME_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
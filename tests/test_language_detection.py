@@ -0,0 +1,35 @@
+import unittest
+
+from bunkatopics.topic_modeling.utils import detect_document_languages, detect_language
+
+
+class TestLanguageDetection(unittest.TestCase):
+    def setUp(self):
+        self.documents = [
+            "The cat sat on the mat and looked at the garden",
+            "Le chat est assis sur le tapis et regarde le jardin",
+            "El gato se sentó en la alfombra y miró el jardín",
+        ] * 20
+
+    def test_document_languages(self):
+        languages = detect_document_languages(self.documents[:3])
+        self.assertEqual(languages, ["en", "fr", "es"])
+
+    def test_detection_is_seeded(self):
+        # Short texts are ambiguous: without a seed, their language changes between runs
+        documents = ["ok", "si", "die", "hola que"] * 5
+        self.assertEqual(
+            detect_document_languages(documents), detect_document_languages(documents)
+        )
+        self.assertEqual(detect_language(documents), detect_language(documents))
+
+    def test_time_budget_leaves_documents_unscored(self):
+        languages = detect_document_languages(
+            self.documents, batch_size=10, time_budget=0
+        )
+        self.assertEqual(languages[:3], ["en", "fr", "es"])
+        self.assertEqual(languages[10:], [None] * 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
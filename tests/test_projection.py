@@ -0,0 +1,33 @@
+import unittest
+
+import numpy as np
+
+from bunkatopics.projection import LandmarkUMAP
+
+
+class TestLandmarkUMAP(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        centers = rng.normal(scale=5, size=(3, 8))
+        self.X = np.vstack(
+            [center + rng.normal(size=(100, 8)) for center in centers]
+        ).astype(np.float32)
+
+    def test_parallel_transform_of_a_fresh_model(self):
+        model = LandmarkUMAP(n_landmarks=120, batch_size=20, n_jobs=4, n_neighbors=10)
+        embeddings_2D = model.fit_transform(self.X)
+
+        self.assertEqual(embeddings_2D.shape, (300, 2))
+        self.assertTrue(np.isfinite(embeddings_2D).all())
+        self.assertLess(len(model.landmarks_), len(self.X))
+
+        # Transforming again in parallel threads gives the same coordinates
+        transformed = model.transform(self.X[:100])
+        self.assertTrue(np.isfinite(transformed).all())
+        np.testing.assert_allclose(
+            transformed, model.transform(self.X[:100]), atol=1e-4
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import jsonlines
+import numpy as np
+
+from bunkatopics import serialization
+from bunkatopics.datamodel import ConvexHullModel, Document, Term, Topic, TopicRanking
+from bunkatopics.embeddings import EmbeddingMatrix
+from bunkatopics.topic_modeling.doc_term_matrix import DocTermMatrix
+from bunkatopics.utils import read_embeddings, save_bunka_models
+
+
+class TestSerialization(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def test_documents(self):
+        docs = [
+            Document(
+                doc_id="a",
+                content="first document",
+                x=1.5,
+                y=-2.0,
+                topic_id="bt-0",
+                topic_ranking=TopicRanking(topic_id="bt-0", rank=1),
+                term_id=["first", "document"],
+                embedding_row=0,
+                multiplicity=3,
+                metadata={"source": "web"},
+            ),
+            Document(doc_id="b", content="second document"),
+        ]
+        serialization.write_documents(docs, self.path)
+        loaded = serialization.read_documents(self.path)
+
+        self.assertTrue(serialization.is_columnar_dump(self.path))
+        self.assertEqual(loaded, docs)
+        self.assertIsNone(loaded[1].x)
+
+    def test_terms_and_topics(self):
+        terms = [
+            Term(term_id="cat", lemma="cat", ent="cat", ngrams=1, count_terms=4),
+            Term(
+                term_id="black cat", lemma="black cat", ent="", ngrams=2, count_terms=1
+            ),
+        ]
+        topics = [
+            Topic(
+                topic_id="bt-0",
+                name="cat | black cat",
+                term_id=["cat", "black cat"],
+                x_centroid=0.5,
+                size=12,
+                convex_hull=ConvexHullModel(
+                    x_coordinates=[0.0, 1.0, 0.0], y_coordinates=[0.0, 0.0, 1.0]
+                ),
+            ),
+            Topic(topic_id="bt-1", name="dog"),
+        ]
+        serialization.write_terms(terms, self.path)
+        serialization.write_topics(topics, self.path)
+
+        self.assertEqual(serialization.read_terms(self.path), terms)
+        self.assertEqual(serialization.read_topics(self.path), topics)
+
+    def test_missing_topics(self):
+        self.assertIsNone(serialization.read_topics(self.path))
+        self.assertIsNone(serialization.read_projection_model(self.path))
+        self.assertIsNone(serialization.read_doc_term_matrix(self.path))
+        self.assertEqual(serialization.read_settings(self.path), {})
+
+    def test_doc_term_matrix(self):
+        doc_term_matrix = DocTermMatrix.from_pairs(
+            ["a", "a", "b"], ["cat", "dog", "dog"], ["a", "b", "c"], ["cat", "dog"]
+        )
+        serialization.write_doc_term_matrix(doc_term_matrix, self.path)
+        loaded = serialization.read_doc_term_matrix(self.path)
+
+        self.assertEqual(loaded.doc_ids, ["a", "b", "c"])
+        self.assertEqual(loaded.vocabulary.tolist(), ["cat", "dog"])
+        self.assertEqual(loaded.to_dict(), doc_term_matrix.to_dict())
+
+    def test_settings(self):
+        settings = {"detected_language": "fr", "topics_params": {"n_clusters": 3}}
+        serialization.write_settings(settings, self.path)
+        loaded = serialization.read_settings(self.path)
+
+        self.assertEqual(loaded["format_version"], serialization.FORMAT_VERSION)
+        self.assertEqual(loaded["topics_params"], {"n_clusters": 3})
+
+    def test_embeddings_are_memory_mapped(self):
+        vectors = np.random.default_rng(0).normal(size=(5, 4)).astype(np.float32)
+        embeddings = EmbeddingMatrix(vectors, ["a", "b", "c", "d", "e"])
+        serialization.write_embeddings(embeddings, self.path)
+
+        loaded = serialization.read_embeddings(self.path)
+        self.assertIsInstance(loaded.vectors, np.memmap)
+        np.testing.assert_array_equal(loaded.vectors, vectors)
+        self.assertEqual(loaded.doc_ids, embeddings.doc_ids)
+
+        # Saving a model loaded from the same directory keeps the mapped file
+        serialization.write_embeddings(loaded, self.path)
+        np.testing.assert_array_equal(
+            serialization.read_embeddings(self.path, mmap=False).vectors, vectors
+        )
+
+    def test_stale_doc_term_matrix_is_removed(self):
+        bunka = SimpleNamespace(
+            docs=[Document(doc_id="a", content="cat", x=0.0, y=0.0)],
+            terms=[],
+            embeddings=EmbeddingMatrix(np.ones((1, 2)), ["a"]),
+            projection_model=None,
+            doc_term_matrix=DocTermMatrix.from_pairs(["a"], ["cat"], ["a"], ["cat"]),
+            embedding_backend=SimpleNamespace(model_id="model"),
+            duplicates_={},
+        )
+        save_bunka_models(bunka, self.path)
+        self.assertIsNotNone(serialization.read_doc_term_matrix(self.path))
+
+        bunka.doc_term_matrix = None
+        save_bunka_models(bunka, self.path)
+        self.assertIsNone(serialization.read_doc_term_matrix(self.path))
+
+    def test_legacy_embeddings(self):
+        with jsonlines.open(self.path + "/bunka_docs.jsonl", mode="w") as writer:
+            writer.write({"doc_id": "a", "content": "first", "embedding": [1.0, 2.0]})
+            writer.write({"doc_id": "b", "content": "second", "embedding": None})
+        embeddings = read_embeddings(self.path)
+
+        self.assertEqual(embeddings.doc_ids, ["a"])
+        np.testing.assert_array_equal(embeddings.vectors, [[1.0, 2.0]])
+
+    def test_legacy_dump_without_embeddings(self):
+        with jsonlines.open(self.path + "/bunka_docs.jsonl", mode="w") as writer:
+            writer.write({"doc_id": "a", "content": "first"})
+        embeddings = read_embeddings(self.path)
+
+        self.assertEqual(embeddings.doc_ids, [])
+        self.assertEqual(len(embeddings.vectors), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
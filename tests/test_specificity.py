@@ -0,0 +1,58 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from bunkatopics.topic_modeling.utils import sparse_specificity, specificity
+
+
+def dense_specificity(counts):
+    expected = np.outer(counts.sum(axis=1), counts.sum(axis=0)) / counts.sum()
+    return (counts - expected) ** 2 / expected * np.sign(counts - expected)
+
+
+class TestSpecificity(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.counts = rng.poisson(0.3, size=(6, 40)) * rng.integers(1, 5, size=40)
+
+    def test_matches_dense_computation(self):
+        rows, columns, scores = sparse_specificity(
+            sparse.csr_matrix(self.counts), top_n=1000
+        )
+        dense = dense_specificity(self.counts.astype(float))
+
+        np.testing.assert_allclose(scores, dense[rows, columns])
+        self.assertEqual(len(scores), (dense > 0).sum())
+
+    def test_top_n_per_row(self):
+        rows, columns, scores = sparse_specificity(
+            sparse.csr_matrix(self.counts), top_n=3
+        )
+        dense = dense_specificity(self.counts.astype(float))
+
+        for row in range(len(self.counts)):
+            row_scores = scores[rows == row]
+            self.assertLessEqual(len(row_scores), 3)
+            self.assertTrue(np.all(np.diff(row_scores) <= 0))
+            if len(row_scores):
+                self.assertAlmostEqual(row_scores[0], np.nanmax(dense[row]))
+
+    def test_dataframe_edges(self):
+        df = pd.DataFrame(
+            {
+                "topic": ["a", "a", "a", "b", "b", "b"],
+                "term": ["x", "x", "y", "y", "z", "z"],
+            }
+        )
+        edge = specificity(df, X="topic", Y="term", Z=None, top_n=10)
+
+        self.assertEqual(list(edge.columns), ["term", "topic", "specificity_score"])
+        self.assertEqual(edge["topic"].tolist(), ["a", "b"])
+        self.assertEqual(edge["term"].tolist(), ["x", "z"])
+        self.assertTrue((edge["specificity_score"] > 0).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from collections import Counter
+
+import numpy as np
+from scipy.cluster.hierarchy import linkage
+
+from bunkatopics.datamodel import Document, Term
+from bunkatopics.topic_modeling import BunkaTopicModeling, DocTermMatrix
+from bunkatopics.topic_modeling.hierarchy import ward_linkage
+
+
+class TestTopicHierarchy(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        words = [f"word{i}" for i in range(300)]
+        self.docs = []
+        for i in range(600):
+            cluster = i % 6
+            x, y = np.array([cluster * 3.0, (cluster % 2) * 4.0]) + rng.normal(size=2)
+            vocabulary = words[cluster * 40 : (cluster + 1) * 40] + words[240:]
+            self.docs.append(
+                Document(
+                    doc_id=f"d{i}",
+                    content="",
+                    x=float(x),
+                    y=float(y),
+                    term_id=list(dict.fromkeys(rng.choice(vocabulary, 8))),
+                )
+            )
+        counts = Counter(term for doc in self.docs for term in doc.term_id)
+        self.terms = [
+            Term(term_id=term, lemma=term, ent=term, ngrams=1, count_terms=count)
+            for term, count in counts.items()
+        ]
+        self.doc_term_matrix = DocTermMatrix.from_documents(self.docs)
+        self.model = BunkaTopicModeling(min_docs_per_cluster=1, name_length=3)
+
+    def test_ward_linkage_matches_scipy(self):
+        X = np.random.default_rng(0).normal(size=(30, 4))
+        np.testing.assert_allclose(
+            ward_linkage(X, np.ones(len(X)))[:, 2], linkage(X, "ward")[:, 2]
+        )
+
+    def test_levels_are_linked(self):
+        hierarchy = self.model.fit_hierarchy(
+            self.docs,
+            self.terms,
+            [2, 6],
+            n_fine_clusters=12,
+            doc_term_matrix=self.doc_term_matrix,
+        )
+        coarse, fine = hierarchy.topics[2], hierarchy.topics[6]
+
+        self.assertEqual([topic.level for topic in coarse + fine], [2] * 2 + [6] * 6)
+        sizes = {topic.topic_id: topic.size for topic in fine}
+        for topic in coarse:
+            self.assertIsNone(topic.parent_topic_id)
+            self.assertEqual(
+                sum(sizes[child] for child in topic.children_topic_id), topic.size
+            )
+        # The documents are left untouched
+        self.assertTrue(all(doc.topic_id is None for doc in self.docs))
+
+    def test_cuts_are_nested(self):
+        hierarchy = self.model.fit_hierarchy(
+            self.docs, self.terms, [3], n_fine_clusters=12
+        )
+        for n_clusters in range(1, 12):
+            coarse = hierarchy.cluster_labels(n_clusters)
+            fine = hierarchy.cluster_labels(n_clusters + 1)
+            self.assertEqual(len(np.unique(fine)), n_clusters + 1)
+            # Every group of the finer cut is inside one group of the coarser cut
+            self.assertTrue(
+                all(len(np.unique(coarse[fine == label])) == 1 for label in fine)
+            )
+
+        self.model.name_levels(hierarchy, self.docs, self.terms, [8])
+        self.model.name_levels(hierarchy, self.docs, self.terms, [5])
+        self.assertEqual(sorted(hierarchy.topics), [3, 5, 8])
+        # Naming an intermediate level leaves the others unchanged
+        self.assertEqual(hierarchy.topics[8][0].level, 8)
+        self.assertEqual(hierarchy.topics[3][0].level, 3)
+
+        with self.assertRaises(ValueError):
+            hierarchy.cluster_labels(13)
+
+
+if __name__ == "__main__":
+    unittest.main()
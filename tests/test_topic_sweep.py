@@ -0,0 +1,68 @@
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from bunkatopics.datamodel import Document, Term
+from bunkatopics.topic_modeling import BunkaTopicModeling, DocTermMatrix
+from bunkatopics.topic_modeling.clustering import warm_start_centers
+
+
+class TestTopicSweep(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        words = [f"word{i}" for i in range(300)]
+        self.docs = []
+        for i in range(600):
+            cluster = i % 5
+            x, y = np.array([cluster * 3.0, (cluster % 2) * 4.0]) + rng.normal(size=2)
+            vocabulary = words[cluster * 50 : (cluster + 1) * 50] + words[250:]
+            self.docs.append(
+                Document(
+                    doc_id=f"d{i}",
+                    content="",
+                    x=float(x),
+                    y=float(y),
+                    term_id=list(dict.fromkeys(rng.choice(vocabulary, 8))),
+                )
+            )
+        counts = Counter(term for doc in self.docs for term in doc.term_id)
+        self.terms = [
+            Term(term_id=term, lemma=term, ent=term, ngrams=1, count_terms=count)
+            for term, count in counts.items()
+        ]
+        self.doc_term_matrix = DocTermMatrix.from_documents(self.docs)
+        self.model = BunkaTopicModeling(min_docs_per_cluster=5, name_length=3)
+
+    def test_sweep(self):
+        results = self.model.fit_sweep(
+            self.docs, self.terms, [10, 5, 2], doc_term_matrix=self.doc_term_matrix
+        )
+
+        self.assertEqual(list(results), [2, 5, 10])
+        self.assertEqual(len(results[5]["topics"]), 5)
+        self.assertLess(results[10]["inertia"], results[2]["inertia"])
+        self.assertEqual(max(results, key=lambda k: results[k]["silhouette"]), 5)
+        # The documents are left untouched
+        self.assertTrue(all(doc.topic_id is None for doc in self.docs))
+
+    def test_stacked_naming_matches_single_naming(self):
+        results = self.model.fit_sweep(
+            self.docs, self.terms, [3, 5], doc_term_matrix=self.doc_term_matrix
+        )
+        for result in results.values():
+            single = self.model._topics_from_labels(
+                self.docs, self.terms, [result["topic_ids"]], self.doc_term_matrix
+            )[0]
+            self.assertEqual(single, result["topics"])
+
+    def test_warm_start_keeps_the_centers(self):
+        X = np.random.default_rng(0).normal(size=(200, 2))
+        centers = warm_start_centers(X, X[:3], 7)
+
+        self.assertEqual(centers.shape, (7, 2))
+        np.testing.assert_array_equal(centers[:3], X[:3])
+
+
+if __name__ == "__main__":
+    unittest.main()